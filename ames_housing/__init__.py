@@ -0,0 +1 @@
+"""Utilitas pipeline prediksi harga rumah Ames Housing."""
@@ -0,0 +1,232 @@
+"""Pemuat dataset ARFF dengan cache kolumnar yang di-memory-map.
+
+Bagian ``@data`` diparse sekali dengan parser CSV milik pandas (C engine),
+lalu disimpan sebagai file Feather tanpa kompresi. Pemanggilan berikutnya
+langsung membaca cache lewat memory-map selama header dan isi file ARFF
+tidak berubah.
+"""
+
+import csv
+import hashlib
+import os
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+_ATTRIBUTE_RE = re.compile(r"""@attribute\s+('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|\S+)\s+(.+)""", re.IGNORECASE)
+_NUMERIC_TYPES = {'numeric': 'real', 'real': 'real', 'integer': 'integer'}
+_SCHEMA_META_KEY = b'ames_housing.schema_hash'
+
+
+@dataclass(frozen=True)
+class ArffAttribute:
+    name: str
+    kind: str  # 'integer', 'real', 'nominal' atau 'string'
+    categories: tuple = ()
+
+
+@dataclass(frozen=True)
+class ArffSchema:
+    relation: str
+    attributes: tuple
+    data_offset: int  # posisi byte baris pertama setelah @data
+    header_hash: str
+
+    @property
+    def names(self):
+        return [attr.name for attr in self.attributes]
+
+
+def _unquote(token):
+    token = token.strip()
+    if len(token) >= 2 and token[0] == token[-1] and token[0] in "'\"":
+        return token[1:-1].replace('\\' + token[0], token[0])
+    return token
+
+
+def _parse_attribute(line):
+    match = _ATTRIBUTE_RE.match(line)
+    if match is None:
+        raise ValueError(f"Baris @attribute tidak valid: {line!r}")
+    name, spec = _unquote(match.group(1)), match.group(2).strip()
+    if spec.startswith('{'):
+        body = spec[1:spec.rindex('}')]
+        values = next(csv.reader([body], quotechar="'", escapechar='\\', skipinitialspace=True))
+        return ArffAttribute(name, 'nominal', tuple(v.strip() for v in values))
+    kind = spec.split()[0].lower()
+    return ArffAttribute(name, _NUMERIC_TYPES.get(kind, 'string'))
+
+
+def read_arff_header(path):
+    """Membaca header ARFF tanpa menyentuh bagian ``@data``."""
+    relation, attributes = '', []
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            raw = f.readline()
+            if not raw:
+                raise ValueError(f"{path}: bagian @data tidak ditemukan")
+            digest.update(raw)
+            line = raw.decode('utf-8').strip()
+            lower = line.lower()
+            if not line or line.startswith('%'):
+                continue
+            if lower.startswith('@relation'):
+                relation = _unquote(line[len('@relation'):])
+            elif lower.startswith('@attribute'):
+                attributes.append(_parse_attribute(line))
+            elif lower.startswith('@data'):
+                return ArffSchema(relation, tuple(attributes), f.tell(), digest.hexdigest())
+
+
+def schema_from_frame(df, relation='data'):
+    """Skema ARFF dari DataFrame: ``category`` -> nominal, integer -> INTEGER.
+
+    Kolom float yang seluruh nilainya bulat juga dianggap INTEGER (seperti
+    INTEGER dengan missing value setelah dibaca :func:`read_arff`).
+    """
+    attributes = []
+    for col, series in df.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            attributes.append(ArffAttribute(col, 'nominal', tuple(str(c) for c in series.cat.categories)))
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            attributes.append(ArffAttribute(col, 'integer'))
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.dropna()
+            integral = len(values) > 0 and bool((values == values.round()).all())
+            attributes.append(ArffAttribute(col, 'integer' if integral else 'real'))
+        else:
+            attributes.append(ArffAttribute(col, 'string'))
+    return ArffSchema(relation, tuple(attributes), 0, '')
+
+
+def quote_arff(value):
+    """Kutip nilai nominal/string ARFF bila perlu."""
+    value = str(value)
+    if value == '' or any(ch in value for ch in " ,{}%'\"\t\\"):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    return value
+
+
+def arff_header(schema):
+    """Teks header ARFF (sampai dan termasuk baris ``@DATA``) untuk ``schema``."""
+    lines = [f"@RELATION {quote_arff(schema.relation)}", '']
+    for attr in schema.attributes:
+        if attr.kind == 'nominal':
+            spec = '{' + ','.join(quote_arff(c) for c in attr.categories) + '}'
+        else:
+            spec = {'integer': 'INTEGER', 'real': 'REAL'}.get(attr.kind, 'STRING')
+        lines.append(f"@ATTRIBUTE {quote_arff(attr.name)} {spec}")
+    lines += ['', '@DATA', '']
+    return '\n'.join(lines)
+
+
+def _to_frame(raw, schema, integer_dtype=None):
+    for attr in schema.attributes:
+        col = raw[attr.name]
+        if attr.kind == 'nominal':
+            cat = pd.Categorical(col, categories=list(attr.categories))
+            if cat.isna().sum() != col.isna().sum():
+                unknown = sorted(set(col.dropna()) - set(attr.categories))
+                raise ValueError(f"Nilai nominal tidak dikenal pada kolom {attr.name}: {unknown[:5]}")
+            raw[attr.name] = cat
+        elif attr.kind == 'integer' and integer_dtype is not None:
+            raw[attr.name] = col.astype(integer_dtype)
+        elif attr.kind == 'integer':
+            raw[attr.name] = col.astype('float64' if col.isna().any() else 'int64')
+        elif attr.kind == 'real':
+            raw[attr.name] = col.astype('float64')
+    return raw
+
+
+def _csv_dtypes(schema):
+    return {attr.name: (object if attr.kind in ('nominal', 'string') else 'float64')
+            for attr in schema.attributes}
+
+
+def read_arff(path, schema=None):
+    """Mem-parse file ARFF dense secara vektor menjadi DataFrame bertipe.
+
+    Atribut nominal dikembalikan sebagai dtype ``category`` dengan urutan
+    kategori sesuai header; atribut INTEGER tanpa missing value menjadi
+    ``int64``.
+    """
+    schema = schema or read_arff_header(path)
+    with open(path, 'rb') as f:
+        f.seek(schema.data_offset)
+        raw = _read_data(f, schema)
+    return _to_frame(raw, schema)
+
+
+def _read_data(f, schema, chunksize=None):
+    return pd.read_csv(
+        f, header=None, names=schema.names, dtype=_csv_dtypes(schema),
+        na_values=['?'], keep_default_na=False, quotechar="'", escapechar='\\',
+        skipinitialspace=True, comment='%', skip_blank_lines=True, encoding='utf-8',
+        chunksize=chunksize,
+    )
+
+
+def iter_arff_chunks(path, chunksize=100_000, schema=None):
+    """Membaca bagian ``@data`` secara bertahap, ``chunksize`` baris per DataFrame.
+
+    Dtype setiap chunk diambil dari header sehingga konsisten antar chunk:
+    nominal menjadi ``category`` dengan kategori header dan INTEGER menjadi
+    ``Int64`` (nullable) karena missing value bisa muncul di chunk mana saja.
+    Memori puncak sebanding dengan ``chunksize``, bukan ukuran file.
+    """
+    schema = schema or read_arff_header(path)
+    with open(path, 'rb') as f:
+        f.seek(schema.data_offset)
+        with _read_data(f, schema, chunksize=chunksize) as reader:
+            for raw in reader:
+                yield _to_frame(raw, schema, integer_dtype='Int64')
+
+
+def _cache_key(path, schema):
+    stat = os.stat(path)
+    key = f"{schema.header_hash}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def load_dataset(path='dataset.arff', cache_dir=None, use_cache=True):
+    """Memuat dataset ARFF, memakai cache Feather jika masih valid.
+
+    Cache disimpan di ``cache_dir`` (default ``.cache`` di samping file
+    ARFF) dan dibuat ulang otomatis ketika header atau isi file berubah.
+    Tanpa ``pyarrow`` file tetap diparse, hanya saja tanpa cache.
+    """
+    path = Path(path)
+    schema = read_arff_header(path)
+    if not use_cache:
+        return read_arff(path, schema)
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:
+        warnings.warn("pyarrow tidak terpasang; cache kolumnar dinonaktifkan")
+        return read_arff(path, schema)
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else path.parent / '.cache'
+    cache_path = cache_dir / f"{path.stem}.{_cache_key(path, schema)}.feather"
+    if cache_path.exists():
+        table = feather.read_table(cache_path, memory_map=True)
+        meta = table.schema.metadata or {}
+        if meta.get(_SCHEMA_META_KEY) == schema.header_hash.encode():
+            return table.to_pandas()
+
+    df = read_arff(path, schema)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{path.stem}.*.feather"):
+        stale.unlink()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           _SCHEMA_META_KEY: schema.header_hash.encode()})
+    tmp_path = cache_path.with_suffix('.tmp')
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, cache_path)
+    return df
+
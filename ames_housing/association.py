@@ -0,0 +1,131 @@
+"""Matriks Cramér's V antar kolom kategorikal.
+
+Setiap kolom di-encode menjadi kode integer sekali saja. Tabel kontingensi
+tiap pasangan dibangun dengan ``np.bincount`` pada kode gabungan, dan hanya
+segitiga atas yang dihitung karena Cramér's V simetris.
+"""
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+_CODES = None  # matriks kode milik proses worker
+
+
+def _contingency(a, b, ka, kb):
+    valid = (a >= 0) & (b >= 0)
+    if not valid.all():
+        a, b = a[valid], b[valid]
+    table = np.bincount(a * kb + b, minlength=ka * kb).reshape(ka, kb)
+    # Sama seperti pd.crosstab: kategori yang tidak muncul tidak ikut dihitung.
+    return table[table.any(axis=1)][:, table.any(axis=0)]
+
+
+def cramers_v_from_table(table):
+    """Cramér's V terkoreksi bias dari tabel kontingensi.
+
+    Statistik chi-square mengikuti ``scipy.stats.chi2_contingency``,
+    termasuk koreksi Yates untuk tabel dengan derajat kebebasan 1.
+    Mengembalikan NaN jika nilainya tidak terdefinisi.
+    """
+    observed = np.asarray(table, dtype='float64')
+    n = observed.sum()
+    r, k = observed.shape
+    if n <= 1 or r == 0 or k == 0:
+        return np.nan
+    expected = np.outer(observed.sum(axis=1), observed.sum(axis=0)) / n
+    if (r - 1) * (k - 1) == 1:
+        diff = expected - observed
+        observed = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+    chi2 = ((observed - expected) ** 2 / expected).sum()
+
+    phi2corr = max(0.0, chi2 / n - ((k - 1) * (r - 1)) / (n - 1))
+    rcorr = r - ((r - 1) ** 2) / (n - 1)
+    kcorr = k - ((k - 1) ** 2) / (n - 1)
+    denom = min(kcorr - 1, rcorr - 1)
+    if denom <= 0:
+        return np.nan
+    return float(np.sqrt(phi2corr / denom))
+
+
+def cramers_v(x, y):
+    """Cramér's V untuk satu pasangan Series."""
+    a, _ = pd.factorize(x)
+    b, _ = pd.factorize(y)
+    return cramers_v_from_table(_contingency(a, b, a.max() + 1, b.max() + 1))
+
+
+def _pair_values(codes, cardinality, pairs):
+    return [cramers_v_from_table(_contingency(codes[:, i], codes[:, j], cardinality[i], cardinality[j]))
+            for i, j in pairs]
+
+
+def _init_worker(codes):
+    global _CODES
+    _CODES = codes
+
+
+def _worker_pairs(cardinality, pairs):
+    return _pair_values(_CODES, cardinality, pairs)
+
+
+def column_fingerprint(series):
+    """Hash isi kolom (tanpa index) untuk kunci cache."""
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+class CramersVEngine:
+    """Menghitung dan meng-cache matriks Cramér's V.
+
+    Hasil per pasangan disimpan berdasarkan fingerprint isi kedua kolom,
+    sehingga pemanggilan ulang setelah sebagian kolom berubah hanya
+    menghitung pasangan yang terdampak. Dengan ``n_jobs > 1`` pasangan dibagi
+    ke process pool.
+    """
+
+    def __init__(self, n_jobs=1, batch_size=256):
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
+        self._cache = {}
+
+    def matrix(self, df, columns=None):
+        columns = list(df.select_dtypes(include=['object', 'category']).columns
+                       if columns is None else columns)
+        fingerprints = [column_fingerprint(df[col]) for col in columns]
+
+        todo = [(i, j) for i, j in combinations(range(len(columns)), 2)
+                if (fingerprints[i], fingerprints[j]) not in self._cache]
+        if todo:
+            codes = np.empty((len(df), len(columns)), dtype='int64')
+            for idx, col in enumerate(columns):
+                codes[:, idx] = pd.factorize(df[col])[0]
+            cardinality = codes.max(axis=0, initial=-1) + 1
+            for (i, j), value in zip(todo, self._compute(codes, cardinality, todo)):
+                self._cache[fingerprints[i], fingerprints[j]] = value
+                self._cache[fingerprints[j], fingerprints[i]] = value
+
+        values = np.full((len(columns), len(columns)), np.nan)
+        for i, j in combinations(range(len(columns)), 2):
+            values[i, j] = values[j, i] = self._cache[fingerprints[i], fingerprints[j]]
+        for i, col in enumerate(columns):
+            # V(x, x) = 1 untuk kolom dengan lebih dari satu kategori.
+            if df[col].nunique() > 1:
+                values[i, i] = 1.0
+        return pd.DataFrame(values, index=columns, columns=columns)
+
+    def _compute(self, codes, cardinality, pairs):
+        if self.n_jobs == 1 or len(pairs) <= self.batch_size:
+            return _pair_values(codes, cardinality, pairs)
+        batches = [pairs[i:i + self.batch_size] for i in range(0, len(pairs), self.batch_size)]
+        max_workers = None if self.n_jobs in (None, -1) else self.n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(codes,)) as pool:
+            results = pool.map(_worker_pairs, [cardinality] * len(batches), batches)
+            return [value for batch in results for value in batch]
+
+    def clear_cache(self):
+        self._cache.clear()
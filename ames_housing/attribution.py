@@ -0,0 +1,164 @@
+"""Atribusi fitur: permutation importance dan kontribusi per prediksi.
+
+- :func:`permutation_importance`: kenaikan RMSE saat satu kolom diacak,
+  diulang ``n_repeats`` kali. Kolom dibagi ke worker (process pool, X dan
+  y di shared memory lewat :func:`ames_housing.modeling.map_shared`), dan
+  semua pengulangan satu kolom diprediksi dengan satu panggilan
+  ``predict`` pada salinan X yang ditumpuk, bukan ``n_repeats`` panggilan
+  kecil.
+- Kontribusi per listing untuk RandomForest/GradientBoosting diambil dari
+  :meth:`ames_housing.compiled.CompiledEnsemble.contributions` (jalur
+  Saabas): nilai dasar + jumlah kontribusi = prediksi, dihitung
+  tervektorisasi untuk ribuan listing sekaligus.
+
+:class:`AttributionService` mengikat keduanya ke satu model dan menyimpan
+hasilnya di :class:`~ames_housing.cache.ArtifactCache` dengan kunci versi
+model (hash isi model ter-fit) + hash data.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from joblib import hash as joblib_hash
+from threadpoolctl import threadpool_limits
+
+from .compiled import compile_ensemble
+from .modeling import data_fingerprint, map_shared
+
+
+def _rmse(y_true, y_pred):
+    return np.sqrt(((y_true - y_pred) ** 2).mean(axis=-1))
+
+
+def _predict(model, values):
+    """``model.predict`` pada array; model yang di-fit dengan DataFrame menerima DataFrame bernama kolom."""
+    names = getattr(model, 'feature_names_in_', None)
+    if names is not None:
+        values = pd.DataFrame(values, columns=names, copy=False)
+    return np.asarray(model.predict(values), dtype='float64')
+
+
+def _permutation_task(X, y, model, columns, seeds, n_repeats, max_rows):
+    """Worker: skor RMSE (kolom x pengulangan) untuk ``columns``."""
+    n_rows = len(X)
+    repeats_per_call = max(1, min(n_repeats, max_rows // max(n_rows, 1)))
+    scores = np.empty((len(columns), n_repeats))
+    with threadpool_limits(limits=1):
+        for i, (column, seed) in enumerate(zip(columns, seeds)):
+            rng = np.random.default_rng(seed)
+            orders = [rng.permutation(n_rows) for _ in range(n_repeats)]
+            for start in range(0, n_repeats, repeats_per_call):
+                batch = orders[start:start + repeats_per_call]
+                stacked = np.tile(X, (len(batch), 1))
+                stacked[:, column] = np.concatenate([X[order, column] for order in batch])
+                y_pred = _predict(model, stacked).reshape(len(batch), n_rows)
+                scores[i, start:start + len(batch)] = _rmse(y, y_pred)
+    return scores
+
+
+def permutation_importance(model, X, y, n_repeats=5, random_state=42, n_jobs=-1, max_rows=200_000):
+    """Permutation importance (kenaikan RMSE) setiap kolom ``X``.
+
+    ``max_rows`` membatasi jumlah baris satu panggilan ``predict`` (X
+    ditumpuk sebanyak pengulangan yang muat). Hasil tidak bergantung pada
+    ``n_jobs``: setiap kolom punya seed turunan sendiri. Mengembalikan
+    DataFrame ``importance_mean``/``importance_std`` terurut menurun,
+    dengan ``baseline_rmse`` di ``attrs``.
+    """
+    columns = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(np.shape(X)[1]))
+    X_values = np.asarray(X, dtype='float64')
+    y_values = np.asarray(y, dtype='float64')
+    baseline = float(_rmse(y_values, _predict(model, X_values)))
+
+    seeds = np.random.SeedSequence(random_state).generate_state(len(columns))
+    cores = (os.cpu_count() or 1) if n_jobs in (None, -1) else n_jobs
+    workers = max(1, min(cores, len(columns)))
+    # Satu task per worker agar model cukup di-pickle sekali per worker.
+    groups = np.array_split(np.arange(len(columns)), workers)
+    tasks = [(model, g, seeds[g], n_repeats, max_rows) for g in groups]
+    outputs = map_shared(_permutation_task, [X_values, y_values], tasks, workers)
+    increase = np.vstack(outputs) - baseline
+
+    result = pd.DataFrame({'importance_mean': increase.mean(axis=1),
+                           'importance_std': increase.std(axis=1)}, index=columns)
+    result.attrs['baseline_rmse'] = baseline
+    return result.sort_values('importance_mean', ascending=False, kind='stable')
+
+
+def model_version(model):
+    """Hash isi model ter-fit; berubah setiap kali model dilatih ulang dengan hasil berbeda."""
+    return joblib_hash(model)
+
+
+class AttributionService:
+    """Atribusi untuk satu model ter-fit, dengan cache per versi model.
+
+    ``contributions`` hanya tersedia untuk model yang bisa dikompilasi
+    (RandomForest, ExtraTrees, GradientBoosting, DecisionTree). ``compiled``
+    boleh diisi :class:`~ames_housing.compiled.CompiledEnsemble` milik model
+    yang sama agar tidak dikompilasi dua kali (misalnya dari ``ModelBundle``).
+    """
+
+    def __init__(self, model, feature_names=None, cache=None, compiled=None):
+        self.model = model
+        self.cache = cache
+        self.version = model_version(model)
+        names = feature_names if feature_names is not None else getattr(model, 'feature_names_in_', None)
+        self.feature_names = None if names is None else list(names)
+        self._compiled = compiled
+
+    @property
+    def compiled(self):
+        if self._compiled is None:
+            self._compiled = compile_ensemble(self.model)
+        return self._compiled
+
+    def _cached(self, kind, data_hash, compute):
+        key = f"attr-{kind}-{self.version}-{data_hash}"
+        if self.cache is not None:
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+        value = compute()
+        if self.cache is not None:
+            self.cache.put(key, value)
+        return value
+
+    def _columns(self, X):
+        if isinstance(X, pd.DataFrame):
+            return list(X.columns)
+        return self.feature_names or list(range(np.shape(X)[1]))
+
+    def contributions(self, X):
+        """DataFrame kontribusi (baris x fitur) plus kolom ``bias``; jumlah satu baris = prediksi."""
+        def compute():
+            values = self.compiled.contributions(np.asarray(X, dtype='float64'))
+            frame = pd.DataFrame(values, columns=self._columns(X), index=getattr(X, 'index', None))
+            frame.insert(0, 'bias', self.compiled.expected_value)
+            return frame
+
+        return self._cached('contrib', data_fingerprint(X), compute)
+
+    def permutation_importance(self, X, y, n_repeats=5, random_state=42, n_jobs=-1):
+        def compute():
+            result = permutation_importance(self.model, X, y, n_repeats, random_state, n_jobs)
+            if not isinstance(X, pd.DataFrame) and self.feature_names is not None:
+                result.index = [self.feature_names[i] for i in result.index]
+            return result
+
+        data_hash = f"{data_fingerprint(X, y)}-{n_repeats}-{random_state}"
+        return self._cached('perm', data_hash, compute)
+
+    def explain(self, X, top=10):
+        """Per baris: ``top`` fitur dengan kontribusi absolut terbesar (untuk penilai)."""
+        frame = self.contributions(X)
+        values = frame.drop(columns='bias')
+        rows = []
+        for i in range(len(values)):
+            row = values.iloc[i]
+            largest = row.abs().nlargest(top).index
+            rows.append({'bias': float(frame['bias'].iloc[i]),
+                         'prediction': float(frame.iloc[i].sum()),
+                         'contributions': {str(k): float(row[k]) for k in largest}})
+        return rows
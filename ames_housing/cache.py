@@ -0,0 +1,95 @@
+"""Cache artefak di disk dengan kunci berbasis isi (content-addressed).
+
+Setiap entri adalah satu file joblib bernama ``<key>.joblib``. Waktu akses
+terakhir dicatat lewat mtime file; jika total ukuran melebihi
+``max_bytes``, entri yang paling lama tidak dipakai (LRU) dihapus lebih
+dulu.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import joblib
+
+_SUFFIX = '.joblib'
+
+
+class ArtifactCache:
+    """Penyimpanan objek ter-pickle (estimator, prediksi) per kunci hash."""
+
+    def __init__(self, directory='.cache/models', max_bytes=2 * 1024 ** 3):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def get(self, key, default=None):
+        """Nilai tersimpan untuk ``key``, atau ``default`` jika tidak ada.
+
+        Entri yang gagal dimuat (terpotong, rusak, atau di-pickle dengan
+        versi scikit-learn/NumPy lain) dianggap miss dan dihapus, sehingga
+        pemanggil cukup menghitung ulang dan menyimpannya lagi.
+        """
+        path = self._path(key)
+        try:
+            value = joblib.load(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except Exception:
+            self.misses += 1
+            path.unlink(missing_ok=True)
+            return default
+        self.hits += 1
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            pass  # sudah di-evict proses lain setelah dimuat
+        return value
+
+    def put(self, key, value):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        joblib.dump(value, tmp_path)
+        os.replace(tmp_path, path)
+        self.evict()
+        return value
+
+    def entries(self):
+        """Daftar ``(path, ukuran, waktu_akses)`` terurut dari yang paling lama."""
+        if not self.directory.exists():
+            return []
+        entries = []
+        for path in self.directory.glob(f'*{_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Hapus entri LRU sampai total ukuran <= ``max_bytes``."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            path.unlink(missing_ok=True)
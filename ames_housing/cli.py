@@ -0,0 +1,222 @@
+"""Antarmuka baris perintah: ``python -m ames_housing <subcommand>``.
+
+Subcommand:
+
+- ``train``: alur pelatihan lengkap (:func:`ames_housing.pipeline.run`),
+  artefak disimpan ke ``--artifacts``.
+- ``train-stream``: seleksi fitur Lasso + regresi linear per chunk
+  (:func:`ames_housing.pipeline.train_streaming`) dengan preprocessor
+  hasil ``train``, untuk data yang tidak muat di memori.
+- ``curve``: kurva RMSE vs jumlah fitur teratas untuk satu model
+  (:func:`ames_housing.pipeline.feature_curve`), bisa disimpan ke CSV.
+- ``predict``: scoring file listing (ARFF, CSV, JSON, JSON Lines, Feather)
+  dengan artefak hasil ``train``.
+- ``dedup``: cluster duplikat eksak dan listing ulang di file ARFF, dibaca
+  per chunk (:mod:`ames_housing.dedup`).
+- ``eda``: laporan EDA HTML statis, plot dirender headless dan paralel;
+  hanya plot yang kolom masukannya berubah yang dirender ulang.
+- ``serve``: layanan scoring HTTP (argumen diteruskan ke
+  ``ames_housing.serving``).
+
+Modul berat diimpor di dalam handler masing-masing: ``predict`` hanya
+memuat pandas, preprocessing dan model (tanpa matplotlib/seaborn dan
+tanpa modul pelatihan), sedangkan matplotlib dan seaborn hanya dimuat
+oleh ``eda``. ``scipy.stats`` tetap ikut termuat di jalur ``predict``:
+``sklearn.base`` (dipakai preprocessing dan setiap model yang di-unpickle)
+mengimpornya secara transitif, begitu juga ``sklearn.metrics`` lewat
+``sklearn.linear_model``. ``sklearn.ensemble`` dan
+:mod:`ames_housing.compiled` hanya dimuat jika modelnya ensemble pohon.
+Sebagian besar cold start ``predict`` (sekitar 0.55 s untuk 100 listing
+di mesin satu core) adalah impor pandas dan scikit-learn.
+"""
+
+import argparse
+import os
+import sys
+
+
+def _read_listings(path):
+    import pandas as pd
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.arff':
+        from .arff_io import read_arff
+        return read_arff(path)
+    if ext in ('.jsonl', '.ndjson'):
+        return pd.read_json(path, lines=True)
+    if ext == '.json':
+        return pd.read_json(path)
+    if ext == '.feather':
+        return pd.read_feather(path)
+    return pd.read_csv(path)
+
+
+def _train(args):
+    from .pipeline import run
+
+    summary = run(args.data, artifacts=args.artifacts, cache_dir=args.cache or None,
+                  n_jobs=args.n_jobs, select=not args.no_selection, native=not args.no_native, cv=args.cv)
+    print(summary['results'].to_string(float_format='{:.2f}'.format))
+    if 'cv' in summary:
+        print(f"\nValidasi silang {args.cv}-fold:")
+        print(summary['cv'].to_string(float_format='{:.4f}'.format))
+    if 'selection' in summary:
+        print()
+        print(summary['selection'].to_string(float_format='{:.2f}'.format))
+    print(f"\nModel terbaik: {summary['best_model']} -> {summary['model_path']}")
+    return 0
+
+
+def _train_stream(args):
+    import joblib
+
+    from .pipeline import train_streaming
+    from .preprocessing import HousePreprocessor
+
+    preprocessor = HousePreprocessor.load(args.preprocessor)
+    summary = train_streaming(args.data, preprocessor, chunksize=args.chunksize,
+                              remove_outliers=not args.keep_outliers)
+    search = summary['search']
+    os.makedirs(os.path.dirname(args.model) or '.', exist_ok=True)
+    joblib.dump(summary['model'], args.model)
+    print(search.cv_scores_.mean(axis=1).rename('mean R2').to_string(float_format='{:.4f}'.format))
+    print(f"\n{search.n_rows_} baris, alpha terbaik {search.best_alpha_:g}, "
+          f"{len(summary['selected'])} fitur terpilih -> {args.model}")
+    return 0
+
+
+def _curve(args):
+    from . import pipeline
+
+    models = pipeline.default_models()
+    if args.model not in models:
+        raise SystemExit(f"model tidak dikenal: {args.model!r} (pilihan: {', '.join(models)})")
+    _, X, y = pipeline.preprocess(pipeline.load(args.data))
+    X_train, X_test, y_train, y_test = pipeline.split(X, y)
+    sizes = [int(k) for k in args.sizes.split(',')] if args.sizes else None
+    curve = pipeline.feature_curve(models[args.model], X_train, y_train, X_test, y_test,
+                                   sizes=sizes, rank_method=args.rank, n_jobs=args.n_jobs)
+    print(curve.curve_.to_string(index=False, float_format='{:.4f}'.format))
+    print(f"\nTerbaik: {curve.best_n_features_} fitur teratas ({args.model})")
+    if args.output:
+        curve.curve_.to_csv(args.output, index=False)
+    return 0
+
+
+def _predict(args):
+    from .serving import ModelBundle
+
+    bundle = ModelBundle.load(args.preprocessor, args.model)
+    frame = _read_listings(args.input)
+    predictions = bundle.predict_frame(frame)
+    result = frame[['Id']].copy() if 'Id' in frame else frame.iloc[:, :0].copy()
+    result['SalePrice'] = predictions
+    if args.output == '-':
+        result.to_csv(sys.stdout, index=False)
+    else:
+        result.to_csv(args.output, index=False)
+    return 0
+
+
+def _dedup(args):
+    from .dedup import find_duplicates_arff
+
+    dedup = find_duplicates_arff(args.data, chunksize=args.chunksize, tolerance=args.tolerance,
+                                 window=args.window, min_similarity=args.min_similarity, near=not args.exact_only)
+    clusters = dedup.result()
+    summary = dedup.summary()
+    print(f"{summary['rows']:,} baris: {summary['exact_duplicates']:,} duplikat eksak, "
+          f"{summary['near_duplicates']:,} hampir-duplikat dalam {summary['clusters']:,} cluster")
+    if args.output:
+        clusters.to_csv(args.output, index=False)
+    return 0
+
+
+def _eda(args):
+    from . import eda
+    from .arff_io import load_dataset
+
+    report = eda.build_report(load_dataset(args.data), args.output, n_jobs=args.n_jobs, dpi=args.dpi)
+    print(f"{len(report['rendered'])} plot dirender, {len(report['reused'])} dipakai ulang -> {report['path']}")
+    return 0
+
+
+def _serve(args):
+    from .serving import main
+
+    main(args.serve_args)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m ames_housing',
+                                     description="Pipeline prediksi harga rumah Ames Housing")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train = commands.add_parser('train', help="latih, bandingkan dan simpan model terbaik")
+    train.add_argument('--data', default='dataset.arff')
+    train.add_argument('--artifacts', default='artifacts')
+    train.add_argument('--cache', default='.cache/models', help="direktori cache model ('' = tanpa cache)")
+    train.add_argument('--n-jobs', type=int, default=-1)
+    train.add_argument('--no-selection', action='store_true', help="lewati evaluasi seleksi fitur")
+    train.add_argument('--cv', type=int, default=0, help="jumlah fold validasi silang (0 = tanpa CV)")
+    train.add_argument('--no-native', action='store_true',
+                       help="jangan ikutkan model dengan kategori native (Hist Gradient Boosting)")
+    train.set_defaults(handler=_train)
+
+    stream = commands.add_parser('train-stream', help="latih Lasso + regresi linear per chunk (out-of-core)")
+    stream.add_argument('--data', default='dataset.arff')
+    stream.add_argument('--preprocessor', default='artifacts/preprocessor.joblib',
+                        help="preprocessor ter-fit (dengan CategoricalEncoder) dari 'train'")
+    stream.add_argument('--model', default='artifacts/linear_model.joblib')
+    stream.add_argument('--chunksize', type=int, default=100_000)
+    stream.add_argument('--keep-outliers', action='store_true', help="jangan buang outlier IQR")
+    stream.set_defaults(handler=_train_stream)
+
+    curve = commands.add_parser('curve', help="kurva RMSE vs jumlah fitur teratas")
+    curve.add_argument('--data', default='dataset.arff')
+    curve.add_argument('--model', default='Random Forest', help="nama model di pipeline.default_models()")
+    curve.add_argument('--rank', default='auto', choices=['auto', 'importance', 'coef', 'permutation'])
+    curve.add_argument('--sizes', default='', help="daftar jumlah fitur dipisah koma (default: ~20 titik geometris)")
+    curve.add_argument('--n-jobs', type=int, default=-1)
+    curve.add_argument('--output', default='', help="simpan kurva ke file CSV")
+    curve.set_defaults(handler=_curve)
+
+    predict = commands.add_parser('predict', help="prediksi harga untuk file listing")
+    predict.add_argument('input', help="file .arff, .csv, .json, .jsonl atau .feather")
+    predict.add_argument('--preprocessor', default='artifacts/preprocessor.joblib')
+    predict.add_argument('--model', default='artifacts/model.joblib')
+    predict.add_argument('--output', default='-', help="file CSV keluaran ('-' = stdout)")
+    predict.set_defaults(handler=_predict)
+
+    dedup = commands.add_parser('dedup', help="cari duplikat eksak dan listing ulang (per chunk)")
+    dedup.add_argument('--data', default='dataset.arff')
+    dedup.add_argument('--chunksize', type=int, default=100_000)
+    dedup.add_argument('--tolerance', type=float, default=0.02, help="selisih relatif GrLivArea maksimum")
+    dedup.add_argument('--window', type=int, default=10, help="jumlah tetangga urutan yang dibandingkan")
+    dedup.add_argument('--min-similarity', type=float, default=0.9,
+                       help="bagian kolom lain yang harus sama (0-1)")
+    dedup.add_argument('--exact-only', action='store_true', help="hanya duplikat eksak")
+    dedup.add_argument('--output', default='', help="simpan anggota cluster ke file CSV")
+    dedup.set_defaults(handler=_dedup)
+
+    eda = commands.add_parser('eda', help="laporan EDA HTML (reports/eda/report.html)")
+    eda.add_argument('--data', default='dataset.arff')
+    eda.add_argument('--output', default='reports/eda')
+    eda.add_argument('--n-jobs', type=int, default=-1)
+    eda.add_argument('--dpi', type=int, default=100)
+    eda.set_defaults(handler=_eda)
+
+    # Argumen serve (termasuk --help) diurai oleh ames_housing.serving sendiri.
+    serve = commands.add_parser('serve', add_help=False, help="layanan scoring HTTP (lihat ames_housing.serving)")
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != 'serve':
+        parser.error(f"argumen tidak dikenal: {' '.join(extra)}")
+    args.serve_args = extra
+    return args.handler(args)
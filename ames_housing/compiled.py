@@ -0,0 +1,194 @@
+"""Jalur inferensi terkompilasi untuk ensemble pohon scikit-learn.
+
+``RandomForestRegressor.predict`` dan ``GradientBoostingRegressor.predict``
+memanggil setiap pohon satu per satu (RandomForest bahkan lewat joblib),
+sehingga untuk satu listing biaya dispatch jauh lebih besar daripada
+penelusuran pohonnya. :func:`compile_ensemble` meratakan semua pohon ke
+beberapa array NumPy berurutan (fitur, threshold, pasangan anak
+kiri/kanan, nilai daun) dengan offset akar per pohon. Prediksi menelusuri
+semua pasangan baris x pohon sekaligus: setiap langkah beberapa ``take``
+dan satu perbandingan (``x <= threshold`` ke kiri) untuk seluruh batch.
+Daun menunjuk ke dirinya sendiri sehingga tidak perlu percabangan, dan
+setiap ``compact_every`` langkah pasangan yang sudah sampai di daun
+dikeluarkan dari batch.
+
+Traversal NumPy menang untuk satu listing dan batch kecil (tidak ada
+overhead per pohon/joblib), tetapi per baris tetap lebih mahal daripada
+loop C scikit-learn; untuk batch besar ``model.predict`` biasa lebih
+cepat (lihat ``serving.ModelBundle``).
+
+Seperti scikit-learn, X dibulatkan ke float32 sebelum dibandingkan dengan
+threshold (float64), jadi jalur yang diambil sama persis; selisih hasil
+hanya dari urutan penjumlahan floating point.
+"""
+
+import joblib
+import numpy as np
+from sklearn.dummy import DummyRegressor
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.tree import BaseDecisionTree
+
+_LEAF = -1  # sklearn.tree._tree.TREE_LEAF
+
+
+def _trees(model):
+    """``(pohon, init, skala, dibagi_jumlah_pohon)`` untuk model yang didukung."""
+    if isinstance(model, BaseDecisionTree):
+        return [model.tree_], 0.0, 1.0, False
+    if isinstance(model, GradientBoostingRegressor):
+        if isinstance(model.init_, str) and model.init_ == 'zero':
+            init = 0.0
+        elif isinstance(model.init_, DummyRegressor):
+            init = float(np.ravel(model.init_.predict(np.zeros((1, model.n_features_in_))))[0])
+        else:
+            # Nilai awal bergantung pada baris (misalnya init=LinearRegression()), bukan konstanta.
+            raise TypeError(f"GradientBoostingRegressor dengan init {type(model.init_).__name__} "
+                            f"tidak didukung compile_ensemble; hanya 'zero' atau DummyRegressor")
+        return [est.tree_ for est in model.estimators_[:, 0]], init, float(model.learning_rate), False
+    estimators = getattr(model, 'estimators_', None)
+    if estimators is not None and all(isinstance(est, BaseDecisionTree) for est in estimators):
+        # RandomForest / ExtraTrees: rata-rata pohon.
+        return [est.tree_ for est in estimators], 0.0, 1.0, True
+    raise TypeError(f"{type(model).__name__} tidak didukung compile_ensemble")
+
+
+def supports(model):
+    try:
+        _trees(model)
+    except (TypeError, AttributeError):
+        return False
+    return True
+
+
+class CompiledEnsemble:
+    """Ensemble pohon dalam array datar; ``predict`` setara ``model.predict``.
+
+    Atribut utama: ``feature``, ``threshold``, ``missing_left``, ``value``
+    dan ``is_leaf`` (satu entri per node, semua pohon disambung),
+    ``children`` (anak kiri/kanan node i di posisi 2i dan 2i+1), ``roots``
+    (indeks akar tiap pohon) serta ``depth``.
+    """
+
+    def __init__(self, model, batch_size=4096, compact_every=6):
+        trees, self.init, self.scale, average = _trees(model)
+        self.batch_size = batch_size
+        self.compact_every = compact_every
+        self.n_features_in_ = model.n_features_in_
+        if hasattr(model, 'feature_names_in_'):
+            self.feature_names_in_ = model.feature_names_in_
+        self.n_trees = len(trees)
+        if average:
+            self.scale /= self.n_trees
+
+        sizes = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self.roots = offsets.astype('intp')
+        self.depth = max(tree.max_depth for tree in trees)
+
+        left = np.concatenate([tree.children_left for tree in trees]).astype('intp')
+        right = np.concatenate([tree.children_right for tree in trees]).astype('intp')
+        node_offsets = np.repeat(offsets, sizes)
+        leaf = left == _LEAF
+        own = np.arange(len(left), dtype='intp')
+        self.is_leaf = leaf
+        self.children = np.column_stack([np.where(leaf, own, left + node_offsets),
+                                         np.where(leaf, own, right + node_offsets)]).ravel()
+        self.feature = np.where(leaf, 0, np.concatenate([tree.feature for tree in trees])).astype('intp')
+        self.threshold = np.concatenate([tree.threshold for tree in trees])
+        self.missing_left = np.concatenate([
+            tree.missing_go_to_left if hasattr(tree, 'missing_go_to_left') else np.zeros(tree.node_count, 'uint8')
+            for tree in trees]).astype(bool)
+        self.value = np.concatenate([tree.value[:, 0, 0] for tree in trees])
+
+    def _check(self, X):
+        X = np.ascontiguousarray(X, dtype='float32')
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X harus berbentuk (n, {self.n_features_in_}), bukan {X.shape}")
+        return X
+
+    def _leaves(self, X, visit=None):
+        """Daun setiap pasangan baris x pohon (urutan baris-mayor) untuk X float32.
+
+        ``visit(pending, parent, child)`` dipanggil setiap langkah dengan
+        posisi pasangan yang masih aktif beserta node asal dan tujuannya.
+        """
+        flat = X.ravel()
+        n_pairs = len(X) * self.n_trees
+        row_start = np.repeat(np.arange(len(X), dtype='intp') * X.shape[1], self.n_trees)
+        node = np.tile(self.roots, len(X))
+        pending = np.arange(n_pairs)
+        leaves = np.empty(n_pairs, dtype='intp')
+        has_nan = np.isnan(flat).any()
+        for step in range(1, self.depth + 1):
+            x = flat.take(row_start + self.feature.take(node))
+            go_right = x > self.threshold.take(node)
+            if has_nan:
+                go_right |= np.isnan(x) & ~self.missing_left.take(node)
+            child = self.children.take(2 * node + go_right)
+            if visit is not None:
+                visit(pending, node, child)
+            node = child
+            if step % self.compact_every == 0 and step < self.depth:
+                done = self.is_leaf.take(node)
+                leaves[pending[done]] = node[done]
+                active = ~done
+                node, pending, row_start = node[active], pending[active], row_start[active]
+        leaves[pending] = node
+        return leaves
+
+    def predict(self, X):
+        X = self._check(X)
+        out = np.empty(len(X))
+        for start in range(0, len(X), self.batch_size):
+            batch = X[start:start + self.batch_size]
+            values = self.value.take(self._leaves(batch)).reshape(len(batch), self.n_trees)
+            out[start:start + len(batch)] = values.sum(axis=1)
+        return self.init + self.scale * out
+
+    @property
+    def expected_value(self):
+        """Prediksi tanpa informasi fitur apa pun (rata-rata node akar)."""
+        return self.init + self.scale * float(self.value.take(self.roots).sum())
+
+    def contributions(self, X):
+        """Kontribusi per fitur untuk setiap baris (metode jalur Saabas).
+
+        Setiap split di jalur sebuah baris menyumbang perubahan nilai node
+        (anak - induk) ke fitur split tersebut, sehingga
+        ``expected_value + contributions(X).sum(axis=1) == predict(X)``.
+        Mengembalikan array (baris, fitur).
+        """
+        X = self._check(X)
+        n_features = X.shape[1]
+        out = np.empty(X.shape)
+        for start in range(0, len(X), self.batch_size):
+            batch = X[start:start + self.batch_size]
+            size = len(batch) * n_features
+            total = np.zeros(size)
+
+            def visit(pending, parent, child):
+                # Pasangan yang sudah di daun menunjuk ke dirinya sendiri: delta 0.
+                delta = self.value.take(child) - self.value.take(parent)
+                cell = (pending // self.n_trees) * n_features + self.feature.take(parent)
+                total[:] += np.bincount(cell, weights=delta, minlength=size)
+
+            self._leaves(batch, visit)
+            out[start:start + len(batch)] = total.reshape(len(batch), n_features)
+        return self.scale * out
+
+    def save(self, path):
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        return joblib.load(path)
+
+
+def compile_ensemble(model, batch_size=4096, compact_every=6):
+    """:class:`CompiledEnsemble` dari RandomForest/ExtraTrees/GradientBoosting/DecisionTree ter-fit.
+
+    GradientBoosting hanya didukung dengan ``init`` konstan (default
+    ``DummyRegressor`` atau ``'zero'``); model lain menghasilkan ``TypeError``.
+    """
+    return CompiledEnsemble(model, batch_size, compact_every)
@@ -0,0 +1,284 @@
+"""Deteksi duplikat eksak dan hampir-duplikat (listing ulang rumah yang sama).
+
+``df.duplicated()`` hanya menangkap salinan baris yang persis sama, termasuk
+``Id``. Rumah yang sama yang dilisting ulang biasanya mendapat ``Id`` baru
+dan beberapa atributnya sedikit berubah (harga, luas dibulatkan, ...).
+:class:`Deduplicator` menangani keduanya dalam satu lintasan per chunk:
+
+- Duplikat eksak: hash 64-bit per baris dari hash per kolom (kolom
+  ``exclude`` seperti ``Id`` diabaikan), dibandingkan dengan hash unik
+  chunk sebelumnya lewat ``searchsorted``, seperti
+  :class:`ames_housing.streaming.DuplicateCounter`.
+- Hampir-duplikat: blocking pada ``Neighborhood`` + ``YearBuilt`` (harus
+  sama) dan ``GrLivArea`` (selisih relatif paling banyak ``tolerance``),
+  diterima jika sidik jari kolom lain (8 bit hash per kolom) sama untuk
+  setidaknya ``min_similarity`` bagian kolom. Seperti banding pada LSH,
+  kolom pembanding dibagi ke ``m + 1`` band (m = jumlah kolom berbeda
+  yang masih diizinkan), sehingga pasangan yang lolos pasti identik di
+  minimal satu band. Untuk setiap band baris diurutkan menurut (blok,
+  hash band, ``GrLivArea``) dan hanya dibandingkan dengan ``window - 1``
+  tetangga urutannya (sorted neighbourhood): biayanya
+  O(band x (n log n + n x window)), bukan O(n²).
+
+Pasangan yang cocok digabung dengan :class:`UnionFind` tervektorisasi;
+wakil cluster adalah baris pertama (posisi terkecil) di cluster tersebut.
+Memori per baris: 1 byte per kolom pembanding plus 8 byte per band dan
+beberapa angka lain, bukan barisnya sendiri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .arff_io import iter_arff_chunks
+
+BLOCK_COLUMNS = ('Neighborhood', 'YearBuilt')
+DISTANCE_COLUMN = 'GrLivArea'
+DEFAULT_EXCLUDE = ('Id',)
+
+_MIX = np.uint64(0x100000001B3)  # prima FNV-1a 64-bit
+_BATCH = 1_000_000  # pasangan kandidat per perbandingan sidik jari
+_LOW7 = np.uint64(0x7F7F7F7F7F7F7F7F)
+_ONES = np.uint64(0x0101010101010101)
+
+
+def _column_hash(series):
+    """Hash uint64 setiap nilai; numerik disamakan ke float64 agar Int64/int/float konsisten antar chunk."""
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return pd.util.hash_array(series.to_numpy(dtype='float64', na_value=np.nan))
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def _combine(hashes, n_rows):
+    out = np.zeros(n_rows, dtype='uint64')
+    for values in hashes:
+        out ^= values
+        out *= _MIX
+    return out
+
+
+def row_hashes(df, columns=None, exclude=DEFAULT_EXCLUDE):
+    """Hash 64-bit per baris dari ``columns`` (default semua kolom kecuali ``exclude``)."""
+    columns = [c for c in (df.columns if columns is None else columns) if c not in exclude]
+    return _combine((_column_hash(df[c]) for c in columns), len(df))
+
+
+class UnionFind:
+    """Union-find tervektorisasi atas posisi 0..n-1; akar setiap cluster adalah posisi terkecilnya."""
+
+    def __init__(self, n):
+        self.parent = np.arange(n, dtype='int64')
+
+    def find(self, rows):
+        roots = self.parent[rows]
+        while True:
+            up = self.parent[roots]
+            if np.array_equal(up, roots):
+                return roots
+            roots = up
+
+    def union(self, a, b):
+        """Gabungkan pasangan ``(a[i], b[i])`` sekaligus."""
+        a, b = np.asarray(a, dtype='int64'), np.asarray(b, dtype='int64')
+        while len(a):
+            ra, rb = self.find(a), self.find(b)
+            pending = ra != rb
+            a, b, ra, rb = a[pending], b[pending], ra[pending], rb[pending]
+            # Akar yang lebih besar digantung ke akar terkecil yang terhubung dengannya.
+            np.minimum.at(self.parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        return self
+
+    def labels(self):
+        """Akar setiap posisi (path compression penuh)."""
+        while True:
+            up = self.parent[self.parent]
+            if np.array_equal(up, self.parent):
+                return self.parent
+            self.parent = up
+
+
+class Deduplicator:
+    """Cluster duplikat eksak dan hampir-duplikat dari data yang datang per chunk.
+
+    ``update(chunk)`` bisa dipanggil berulang (misalnya dari
+    ``iter_arff_chunks``); ``result()`` mengembalikan DataFrame satu baris
+    per anggota cluster berukuran > 1: ``row`` (posisi di aliran data),
+    ``Id`` (jika ada), ``cluster`` (posisi wakil), ``cluster_size`` dan
+    ``exact`` (salinan persis baris sebelumnya, selain kolom ``exclude``).
+    ``exclude=()`` membuat bagian eksaknya setara ``df.duplicated()``.
+
+    Jika ``near`` dimatikan hanya duplikat eksak yang dicari. Kelompok
+    (blok, band) yang berisi lebih dari ``window`` listing dalam rentang
+    ``tolerance`` bisa melewatkan sebagian pasangan langsung, tetapi
+    biasanya tetap terhubung lewat band lain atau tetangga di antaranya.
+    """
+
+    def __init__(self, block_columns=BLOCK_COLUMNS, distance_column=DISTANCE_COLUMN, tolerance=0.02,
+                 window=10, min_similarity=0.9, compare_columns=None, exclude=DEFAULT_EXCLUDE, near=True):
+        self.block_columns = block_columns
+        self.distance_column = distance_column
+        self.tolerance = tolerance
+        self.window = window
+        self.min_similarity = min_similarity
+        self.compare_columns = compare_columns
+        self.exclude = exclude
+        self.near = near
+        self.n_rows = 0
+        self._seen = np.empty(0, dtype='uint64')
+        self._seen_rows = np.empty(0, dtype='int64')
+        self._edges, self._exact_flags = [], []
+        self._ids, self._keys, self._distances, self._fingerprints = [], [], [], []
+
+    def _setup(self, chunk):
+        self.columns_ = [c for c in chunk.columns if c not in self.exclude]
+        keys = set(self.block_columns) | {self.distance_column}
+        compare = self.compare_columns
+        if compare is None:
+            compare = [c for c in self.columns_ if c not in keys]
+        self.compare_columns_ = list(compare)
+        n_columns = len(self.compare_columns_)
+        self.allowed_mismatches_ = n_columns - int(np.ceil(self.min_similarity * n_columns - 1e-9))
+        # allowed + 1 band: pasangan dengan <= allowed kolom berbeda pasti sama persis di satu band.
+        n_bands = min(self.allowed_mismatches_ + 1, n_columns) or 1
+        self.bands_ = [self.compare_columns_[b::n_bands] for b in range(n_bands)]
+
+    def _exact(self, hashes, offset):
+        unique, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+        rows = offset + np.arange(len(hashes))
+        first_rows = offset + first
+        # Duplikat di dalam chunk: tautkan ke kemunculan pertamanya di chunk.
+        within = first_rows[inverse] != rows
+        pos = np.searchsorted(self._seen, unique)
+        pos[pos == len(self._seen)] = 0
+        seen_before = (self._seen[pos] == unique) if len(self._seen) else np.zeros(len(unique), bool)
+        exact = within.copy()
+        exact[first[seen_before]] = True
+        self._edges.append((rows[within], first_rows[inverse[within]]))
+        self._edges.append((first_rows[seen_before], self._seen_rows[pos[seen_before]]))
+
+        merged = np.concatenate([self._seen, unique[~seen_before]])
+        order = np.argsort(merged, kind='stable')
+        self._seen = merged[order]
+        self._seen_rows = np.concatenate([self._seen_rows, first_rows[~seen_before]])[order]
+        return exact
+
+    def update(self, chunk):
+        if self.n_rows == 0:
+            self._setup(chunk)
+        offset = self.n_rows
+        needed = list(self.columns_)
+        if self.near:
+            needed += list(self.block_columns) + self.compare_columns_
+        hashes = {c: _column_hash(chunk[c]) for c in dict.fromkeys(needed)}
+        self._exact_flags.append(self._exact(_combine((hashes[c] for c in self.columns_), len(chunk)), offset))
+        if 'Id' in chunk.columns:
+            self._ids.append(chunk['Id'].to_numpy(dtype='float64', na_value=np.nan))
+        if self.near:
+            block = _combine((hashes[c] for c in self.block_columns), len(chunk))
+            self._keys.append(np.column_stack([_combine([block] + [hashes[c] for c in band], len(chunk))
+                                               for band in self.bands_]))
+            self._distances.append(chunk[self.distance_column].to_numpy(dtype='float64', na_value=np.nan))
+            # 8 bit terbawah hash per kolom, dikemas ke word uint64 (sisa byte nol).
+            n_words = -(-len(self.compare_columns_) // 8)
+            fingerprints = np.zeros((len(chunk), 8 * n_words), dtype='uint8')
+            for j, c in enumerate(self.compare_columns_):
+                fingerprints[:, j] = hashes[c]
+            self._fingerprints.append(fingerprints.view('uint64'))
+        self.n_rows += len(chunk)
+        return self
+
+    def _similar(self, fingerprints, a, b):
+        """Posisi ``a`` yang sidik jarinya cukup mirip dengan ``b`` (kolom sama >= ``min_similarity``).
+
+        Pasangan dibuang begitu jumlah kolom berbeda melewati batas, jadi
+        kebanyakan kandidat yang bukan duplikat berhenti setelah word pertama.
+        """
+        differ = np.zeros(len(a), dtype='uint64')
+        for w in range(fingerprints.shape[1]):
+            v = fingerprints[a, w] ^ fingerprints[b, w]
+            # Bit tertinggi setiap byte tak-nol di v menyala, lalu dihitung per word.
+            nonzero = ((v & _LOW7) + _LOW7) | v
+            differ += (((nonzero >> np.uint64(7)) & _ONES) * _ONES) >> np.uint64(56)
+            keep = differ <= self.allowed_mismatches_
+            a, b, differ = a[keep], b[keep], differ[keep]
+        return a
+
+    def _window_edges(self, order, keys, distances, fingerprints):
+        """Pasangan mirip di antara tetangga ``order`` (sudah terurut menurut kunci lalu jarak)."""
+        edges = []
+        for lag in range(1, self.window):
+            gap = distances[lag:] - distances[:-lag]  # >= 0 dalam satu kunci
+            candidate = (keys[:-lag] == keys[lag:]) & (gap <= self.tolerance * distances[lag:])
+            if not candidate.any():
+                break
+            a = np.flatnonzero(candidate)
+            for start in range(0, len(a), _BATCH):
+                i = a[start:start + _BATCH]
+                i = self._similar(fingerprints, i, i + lag)
+                edges.append((order[i], order[i + lag]))
+        return edges
+
+    def _near_edges(self):
+        keys = np.concatenate(self._keys)
+        distances = np.concatenate(self._distances)
+        fingerprints = np.concatenate(self._fingerprints)
+        rows = np.flatnonzero(~np.isnan(distances))
+        edges = []
+        for band in range(keys.shape[1]):
+            order = rows[np.lexsort((distances[rows], keys[rows, band]))]
+            # Diurutkan sekali per band; pasangan lag k adalah posisi i dan i + k.
+            edges += self._window_edges(order, keys[order, band], distances[order], fingerprints[order])
+        return edges
+
+    def result(self):
+        edges = list(self._edges)
+        if self.near and self.n_rows:
+            edges += self._near_edges()
+        forest = UnionFind(self.n_rows)
+        if edges:
+            forest.union(np.concatenate([a for a, _ in edges]), np.concatenate([b for _, b in edges]))
+        labels = forest.labels()
+        sizes = np.bincount(labels, minlength=self.n_rows)[labels]
+        rows = np.flatnonzero(sizes > 1)
+
+        self.labels_ = labels
+        self.exact_ = np.concatenate(self._exact_flags) if self.n_rows else np.zeros(0, bool)
+        clusters = pd.DataFrame({'row': rows})
+        if self._ids:
+            ids = np.concatenate(self._ids)[rows]
+            clusters['Id'] = ids if np.isnan(ids).any() else ids.astype('int64')
+        clusters['cluster'] = labels[rows]
+        clusters['cluster_size'] = sizes[rows]
+        clusters['exact'] = self.exact_[rows]
+        return clusters
+
+    def summary(self):
+        """Ringkasan jumlah setelah ``result()``: baris, duplikat eksak, hampir-duplikat dan cluster."""
+        representative = self.labels_ == np.arange(self.n_rows)
+        n_exact = int(self.exact_.sum())
+        return {
+            'rows': self.n_rows,
+            'exact_duplicates': n_exact,
+            'near_duplicates': int((~representative).sum()) - n_exact,
+            'clusters': len(np.unique(self.labels_[~representative])),
+        }
+
+
+def find_duplicates(df, **params):
+    """Cluster duplikat sebuah DataFrame (lihat :class:`Deduplicator`)."""
+    return Deduplicator(**params).update(df).result()
+
+
+def find_duplicates_arff(path, chunksize=100_000, **params):
+    """:class:`Deduplicator` ter-update dari file ARFF, dibaca per chunk; panggil ``result()``."""
+    dedup = Deduplicator(**params)
+    for chunk in iter_arff_chunks(path, chunksize):
+        dedup.update(chunk)
+    return dedup
+
+
+def drop_duplicates(df, clusters):
+    """``df`` tanpa anggota cluster selain wakilnya (hasil :func:`find_duplicates` pada ``df``)."""
+    redundant = clusters['row'].to_numpy()[clusters['row'].to_numpy() != clusters['cluster'].to_numpy()]
+    keep = np.ones(len(df), dtype=bool)
+    keep[redundant] = False
+    return df.iloc[keep]
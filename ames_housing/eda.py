@@ -0,0 +1,308 @@
+"""Laporan EDA HTML statis yang dirender headless.
+
+Plot yang dibuat sama dengan bagian EDA notebook: histogram + KDE setiap
+kolom numerik, countplot setiap kolom kategorikal, heatmap korelasi
+Pearson dan heatmap Cramér's V.
+
+- Statistik semua plot (histogram, KDE ter-bin, frekuensi kategori,
+  matriks korelasi, Cramér's V) dihitung sekali di proses utama. Worker
+  hanya menerima statistik itu, bukan DataFrame.
+- Plot dirender paralel di process pool dengan backend Agg, satu PNG per
+  plot, memakai API ``Figure`` (tanpa state global ``pyplot``).
+- Setiap plot punya kunci = hash isi kolom masukannya + parameter plot.
+  ``manifest.json`` di direktori keluaran menyimpan kunci terakhir, jadi
+  pada eksekusi ulang hanya plot yang kolom masukannya berubah yang
+  statistiknya dihitung ulang dan dirender ulang.
+- Hasil akhirnya satu file ``report.html`` dengan gambar tertanam
+  (base64), bisa dibuka tanpa server.
+"""
+
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .association import CramersVEngine
+
+RENDER_VERSION = 1  # naikkan jika cara menggambar berubah agar semua plot dirender ulang
+HIST_BINS = 30
+_KDE_GRID = 512
+
+
+def _numeric_columns(df):
+    return df.select_dtypes(include='number').columns
+
+
+def _categorical_columns(df):
+    return df.select_dtypes(include=['object', 'category']).columns
+
+
+def missing_table(df):
+    """Jumlah dan persentase missing value per kolom (hanya kolom yang punya missing)."""
+    missing = df.isnull().sum()
+    missing = missing[missing > 0].sort_values(ascending=False)
+    return pd.DataFrame({'Missing Values': missing, 'Percentage (%)': missing / len(df) * 100})
+
+
+def column_digest(series):
+    """Hash isi kolom (nilai + dtype), tidak bergantung pada index."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{series.name}|{series.dtype}'.encode())
+    digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# --- statistik -------------------------------------------------------------
+
+def _histogram_stats(values, bins=HIST_BINS):
+    """Histogram dan KDE Gaussian (bandwidth Scott) yang diskalakan ke jumlah per bin.
+
+    KDE dihitung dari histogram halus yang dikonvolusi dengan kernel
+    Gaussian, jadi biayanya O(n + grid), bukan O(n x grid).
+    """
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'counts': [], 'edges': [], 'kde_x': [], 'kde_y': []}
+    counts, edges = np.histogram(values, bins=bins)
+    std = values.std(ddof=1) if len(values) > 1 else 0.0
+    kde_x, kde_y = [], []
+    if std > 0:
+        bw = std * len(values) ** (-1 / 5)
+        lo, hi = values.min() - 3 * bw, values.max() + 3 * bw
+        fine, fine_edges = np.histogram(values, bins=_KDE_GRID, range=(lo, hi))
+        step = fine_edges[1] - fine_edges[0]
+        offsets = np.arange(-int(np.ceil(4 * bw / step)), int(np.ceil(4 * bw / step)) + 1) * step
+        kernel = np.exp(-0.5 * (offsets / bw) ** 2)
+        density = np.convolve(fine, kernel / kernel.sum(), mode='same') / (len(values) * step)
+        kde_x = (fine_edges[:-1] + step / 2).tolist()
+        kde_y = (density * len(values) * (edges[1] - edges[0])).tolist()
+    return {'counts': counts.tolist(), 'edges': edges.tolist(), 'kde_x': kde_x, 'kde_y': kde_y}
+
+
+def _value_counts(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories)),
+                           index=series.cat.categories)
+        counts = counts[counts > 0]
+    else:
+        counts = series.value_counts()
+    counts = counts.sort_values(ascending=False, kind='stable')
+    return {'labels': [str(v) for v in counts.index], 'counts': counts.tolist()}
+
+
+def _matrix_stats(matrix):
+    return {'columns': list(matrix.columns), 'values': matrix.to_numpy().tolist()}
+
+
+# --- rendering (berjalan di worker) -----------------------------------------
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _draw_histogram(fig, stats):
+    ax = fig.add_subplot()
+    if stats['counts']:
+        edges = np.asarray(stats['edges'])
+        ax.bar(edges[:-1], stats['counts'], width=np.diff(edges), align='edge',
+               color='#4c72b0', alpha=0.6, edgecolor='white', linewidth=0.5)
+        if stats['kde_x']:
+            ax.plot(stats['kde_x'], stats['kde_y'], color='#4c72b0', linewidth=1.5)
+    ax.set_title(f"Distribusi {stats['column']}")
+    ax.set_ylabel('Count')
+
+
+def _draw_countplot(fig, stats):
+    ax = fig.add_subplot()
+    ax.bar(range(len(stats['counts'])), stats['counts'], color='#4c72b0')
+    ax.set_xticks(range(len(stats['labels'])), stats['labels'], rotation=45, ha='right', fontsize=7)
+    ax.set_title(stats['column'], fontsize=10)
+    ax.set_ylabel('count')
+
+
+def _draw_heatmap(fig, stats):
+    import seaborn as sns
+
+    matrix = pd.DataFrame(stats['values'], index=stats['columns'], columns=stats['columns'])
+    ax = fig.add_subplot()
+    mask = np.triu(np.ones_like(matrix, dtype=bool))
+    sns.heatmap(matrix, mask=mask, annot=True, fmt=".2f", cmap=stats['cmap'], linewidths=0.5,
+                cbar_kws={"shrink": 0.8}, annot_kws={"size": stats['annot_size']}, ax=ax,
+                **stats.get('heatmap_kwargs', {}))
+    ax.set_title(stats['title'], fontsize=16)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=stats['tick_size'])
+    ax.tick_params(axis='y', labelsize=stats['tick_size'])
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+
+
+_DRAW = {
+    'histogram': (_draw_histogram, (5, 3.5)),
+    'countplot': (_draw_countplot, (5, 3.5)),
+    'heatmap': (_draw_heatmap, (18, 14)),
+}
+
+
+def render_figure(kind, stats, path, dpi=100):
+    """Gambar satu plot dari statistiknya dan simpan sebagai PNG."""
+    from matplotlib.figure import Figure
+
+    draw, figsize = _DRAW[kind]
+    fig = Figure(figsize=figsize)
+    draw(fig, stats)
+    fig.tight_layout()
+    fig.savefig(path, dpi=dpi)
+    return path
+
+
+def _render_task(task):
+    return render_figure(*task)
+
+
+# --- laporan ------------------------------------------------------------------
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+
+
+def figure_specs(df):
+    """Daftar plot laporan: ``(nama, jenis, kolom masukan, section)``."""
+    numeric, categorical = list(_numeric_columns(df)), list(_categorical_columns(df))
+    specs = [(f'hist_{col}', 'histogram', [col], 'numeric') for col in numeric]
+    specs.append(('correlation', 'heatmap', numeric, 'correlation'))
+    specs += [(f'count_{col}', 'countplot', [col], 'categorical') for col in categorical]
+    specs.append(('cramers_v', 'heatmap', categorical, 'cramers_v'))
+    return specs
+
+
+def _figure_key(name, kind, columns, digests, dpi):
+    payload = json.dumps([RENDER_VERSION, name, kind, dpi, [digests[c] for c in columns]])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _compute_stats(df, stale):
+    """Statistik untuk plot di ``stale`` saja, dihitung sekali di proses utama."""
+    stats = {}
+    for name, kind, columns, section in stale:
+        if section == 'numeric':
+            values = df[columns[0]].to_numpy(dtype='float64', na_value=np.nan)
+            stats[name] = {'column': columns[0], **_histogram_stats(values)}
+        elif section == 'categorical':
+            stats[name] = {'column': columns[0], **_value_counts(df[columns[0]])}
+        elif section == 'correlation':
+            stats[name] = {**_matrix_stats(df[columns].corr()), 'title': 'Matriks Korelasi Kolom Numerik',
+                           'cmap': 'coolwarm', 'annot_size': 8, 'tick_size': 9,
+                           'heatmap_kwargs': {'square': True}}
+        elif section == 'cramers_v':
+            matrix = CramersVEngine().matrix(df, columns)
+            ordered = matrix.mean().sort_values(ascending=False).index
+            stats[name] = {**_matrix_stats(matrix.loc[ordered, ordered]),
+                           'title': "Cramér's V antara Kolom Kategorikal", 'cmap': 'YlGnBu',
+                           'annot_size': 6, 'tick_size': 8, 'heatmap_kwargs': {'vmin': 0, 'vmax': 1}}
+    return stats
+
+
+def _load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'figures': {}}
+
+
+def _img(path, alt, width=None):
+    with open(path, 'rb') as f:
+        data = base64.b64encode(f.read()).decode('ascii')
+    style = f' style="width:{width}"' if width else ''
+    return f'<img src="data:image/png;base64,{data}" alt="{html.escape(alt)}"{style}>'
+
+
+def _html(df, specs, files, title):
+    by_section = {}
+    for name, _, _, section in specs:
+        by_section.setdefault(section, []).append(name)
+
+    def grid(names):
+        return '<div class="grid">' + ''.join(_img(files[n], n) for n in names) + '</div>'
+
+    missing = missing_table(df)
+    parts = [
+        f'<h1>{html.escape(title)}</h1>',
+        '<h2>Struktur Data</h2>',
+        f'<p>{len(df):,} baris, {df.shape[1]} kolom, {int(df.duplicated().sum()):,} baris duplikat.</p>',
+        '<h2>Missing Value</h2>',
+        missing.to_html(float_format='{:.2f}'.format) if len(missing) else '<p>Tidak ada missing value.</p>',
+        '<h2>Statistik Deskriptif</h2>',
+        df.describe().T.to_html(float_format='{:.2f}'.format),
+        '<h2>Distribusi Kolom Numerik</h2>', grid(by_section.get('numeric', [])),
+        '<h2>Matriks Korelasi Kolom Numerik</h2>', _img(files['correlation'], 'correlation', '100%'),
+        '<h2>Distribusi Kolom Kategorikal</h2>', grid(by_section.get('categorical', [])),
+        "<h2>Cramér's V antara Kolom Kategorikal</h2>", _img(files['cramers_v'], 'cramers_v', '100%'),
+    ]
+    style = ('body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;font-size:12px}'
+             'td,th{border:1px solid #ccc;padding:2px 6px;text-align:right}'
+             '.grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(360px,1fr));gap:8px}'
+             '.grid img{width:100%}')
+    return (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+            f'<style>{style}</style></head><body>\n' + '\n'.join(parts) + '\n</body></html>\n')
+
+
+def build_report(df, directory='reports/eda', n_jobs=-1, dpi=100, title='Laporan EDA Ames Housing'):
+    """Tulis ``directory/report.html``; hanya plot yang masukannya berubah yang dirender ulang.
+
+    Mengembalikan dict ``path`` (file HTML), ``rendered`` dan ``reused``
+    (nama plot).
+    """
+    figure_dir = os.path.join(directory, 'figures')
+    os.makedirs(figure_dir, exist_ok=True)
+    manifest_path = os.path.join(directory, 'manifest.json')
+    previous = _load_manifest(manifest_path)['figures']
+
+    specs = figure_specs(df)
+    digests = {col: column_digest(df[col]) for col in {c for _, _, cols, _ in specs for c in cols}}
+    entries, stale = {}, []
+    for spec in specs:
+        name, kind, columns, _ = spec
+        key = _figure_key(name, kind, columns, digests, dpi)
+        path = os.path.join(figure_dir, f'{_slug(name)}.png')
+        entries[name] = {'key': key, 'file': os.path.relpath(path, directory), 'columns': columns}
+        old = previous.get(name)
+        if old is None or old['key'] != key or not os.path.exists(path):
+            stale.append(spec)
+
+    stats = _compute_stats(df, stale)
+    tasks = [(kind, stats[name], os.path.join(directory, entries[name]['file']), dpi)
+             for name, kind, _, _ in stale]
+    workers = (os.cpu_count() or 1) if n_jobs in (None, -1) else n_jobs
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(min(workers, len(tasks)), initializer=_init_worker) as pool:
+            list(pool.map(_render_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    else:
+        _init_worker()
+        for task in tasks:
+            _render_task(task)
+
+    for name, old in previous.items():
+        if name not in entries and old['file'] not in {e['file'] for e in entries.values()}:
+            try:
+                os.remove(os.path.join(directory, old['file']))
+            except OSError:
+                pass
+    with open(manifest_path, 'w') as f:
+        json.dump({'render_version': RENDER_VERSION, 'figures': entries}, f, indent=1)
+
+    files = {name: os.path.join(directory, entry['file']) for name, entry in entries.items()}
+    report_path = os.path.join(directory, 'report.html')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(_html(df, specs, files, title))
+    stale_names = {name for name, _, _, _ in stale}
+    return {'path': report_path, 'rendered': [n for n, *_ in specs if n in stale_names],
+            'reused': [n for n, *_ in specs if n not in stale_names]}
@@ -0,0 +1,272 @@
+"""Pelatihan model linear out-of-core dari data yang diproses per chunk.
+
+Regresi linear dan Lasso (dengan intercept) hanya bergantung pada statistik
+cukup data yang dipusatkan: jumlah baris, rata-rata X dan y, XᵀX, Xᵀy dan
+yᵀy. :class:`GramAccumulator` mengumpulkannya chunk demi chunk (digabung
+dengan rumus Chan et al., sama seperti ``DescribeAccumulator``), jadi
+memorinya O(fitur²) berapa pun jumlah baris, dan hasilnya eksak, bukan
+aproksimasi SGD.
+
+Untuk fit, XᵀX diuraikan menjadi sistem kecil X̃ (paling banyak
+fitur x fitur baris) dengan X̃ᵀX̃ = XᵀX dan X̃ᵀỹ = Xᵀy, lalu diserahkan ke
+``lstsq`` atau ``Lasso``/``lasso_path`` scikit-learn. Fungsi objektifnya
+sama dengan fit pada seluruh data sekaligus (alpha disesuaikan dengan
+jumlah baris), jadi koefisiennya sama dengan ``LinearRegression`` dan
+``Lasso`` dalam batas toleransi solver.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import Lasso, lasso_path
+
+
+def _as_float(values):
+    return np.asarray(values, dtype='float64')
+
+
+class GramAccumulator:
+    """Statistik cukup regresi linear: n, rata-rata, XᵀX, Xᵀy dan yᵀy terpusat."""
+
+    def __init__(self):
+        self.n = 0
+        self.x_mean = self.y_mean = None
+        self.xx = self.xy = None
+        self.yy = 0.0
+
+    @property
+    def n_features(self):
+        return None if self.xx is None else len(self.xx)
+
+    def _init(self, n_features):
+        self.x_mean = np.zeros(n_features)
+        self.y_mean = 0.0
+        self.xx = np.zeros((n_features, n_features))
+        self.xy = np.zeros(n_features)
+
+    def _combine(self, n, x_mean, y_mean, xx, xy, yy):
+        if self.xx is None:
+            self._init(len(xx))
+        elif len(xx) != len(self.xx):
+            raise ValueError(f"jumlah fitur berbeda: {len(xx)} != {len(self.xx)}")
+        total = self.n + n
+        dx, dy = x_mean - self.x_mean, y_mean - self.y_mean
+        weight = self.n * n / total
+        self.xx += xx + weight * np.outer(dx, dx)
+        self.xy += xy + weight * dx * dy
+        self.yy += yy + weight * dy * dy
+        self.x_mean = self.x_mean + dx * n / total
+        self.y_mean = self.y_mean + dy * n / total
+        self.n = total
+        return self
+
+    def update(self, X, y):
+        X, y = _as_float(X), _as_float(y)
+        if not len(X):
+            return self
+        x_mean, y_mean = X.mean(axis=0), y.mean()
+        Xc, yc = X - x_mean, y - y_mean
+        return self._combine(len(X), x_mean, y_mean, Xc.T @ Xc, Xc.T @ yc, float(yc @ yc))
+
+    def merge(self, other):
+        """Gabungkan akumulator lain (misalnya dari worker atau hari lain), in place."""
+        if other.n:
+            self._combine(other.n, other.x_mean, other.y_mean, other.xx, other.xy, other.yy)
+        return self
+
+    def subset(self, columns):
+        """Akumulator untuk sebagian kolom saja (indeks posisi), tanpa membaca ulang data."""
+        columns = np.asarray(columns)
+        sub = GramAccumulator()
+        sub.n, sub.y_mean, sub.yy = self.n, self.y_mean, self.yy
+        sub.x_mean = self.x_mean[columns]
+        sub.xx = self.xx[np.ix_(columns, columns)]
+        sub.xy = self.xy[columns]
+        return sub
+
+    def square_root(self):
+        """Sistem ``(X̃, ỹ)`` dengan X̃ᵀX̃ = XᵀX dan X̃ᵀỹ = Xᵀy (terpusat).
+
+        Kolom diskalakan ke varians satu sebelum ``eigh`` agar fitur
+        berskala besar (misalnya ``LotArea``) tidak menenggelamkan dummy;
+        arah dengan eigenvalue ~0 (kolom kolinear) dibuang.
+        """
+        diag = np.diag(self.xx)
+        scale = np.where(diag > 0, 1 / np.sqrt(np.where(diag > 0, diag, 1)), 1.0)
+        eigval, eigvec = np.linalg.eigh(self.xx * np.outer(scale, scale))
+        keep = eigval > eigval.max(initial=0) * len(eigval) * np.finfo('float64').eps
+        root = np.sqrt(eigval[keep])
+        basis = eigvec[:, keep]
+        X = (basis * root).T / scale
+        y = (basis.T @ (self.xy * scale)) / root
+        return X, y
+
+    def sse(self, coefs, intercepts):
+        """Jumlah kuadrat residu prediksi ``X @ coefs + intercepts`` pada data akumulator ini.
+
+        ``coefs`` berbentuk (fitur,) atau (fitur, k) untuk k model sekaligus.
+        """
+        coefs = np.asarray(coefs)
+        offset = self.y_mean - (self.x_mean @ coefs + intercepts)
+        quad = np.einsum('i...,ij,j...->...', coefs, self.xx, coefs)
+        return self.yy - 2 * (self.xy @ coefs) + quad + self.n * offset ** 2
+
+
+class _StreamingLinearModel(RegressorMixin, BaseEstimator):
+    """Dasar estimator dengan ``partial_fit`` di atas :class:`GramAccumulator`."""
+
+    def fit(self, X, y):
+        self.gram_ = GramAccumulator()
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X, y):
+        if not hasattr(self, 'gram_'):
+            self.gram_ = GramAccumulator()
+        if isinstance(X, pd.DataFrame) and not hasattr(self, 'feature_names_in_'):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.gram_.update(X, y)
+        return self.fit_gram(self.gram_)
+
+    def fit_gram(self, gram):
+        """Fit dari akumulator yang sudah terisi (tanpa data mentah)."""
+        self.gram_ = gram
+        self.n_features_in_ = gram.n_features
+        self.coef_ = self._solve(gram)
+        self.intercept_ = float(gram.y_mean - gram.x_mean @ self.coef_)
+        return self
+
+    def predict(self, X):
+        return _as_float(X) @ self.coef_ + self.intercept_
+
+
+class StreamingLinearRegression(_StreamingLinearModel):
+    """Padanan ``LinearRegression`` (OLS, solusi norma minimum) yang dilatih per chunk.
+
+    Jika ``columns`` (indeks posisi) diisi, OLS hanya memakai kolom itu
+    (misalnya hasil seleksi Lasso) dan koefisien kolom lain nol, sehingga
+    model tetap menerima seluruh keluaran preprocessor.
+    """
+
+    def __init__(self, columns=None):
+        self.columns = columns
+
+    def _solve(self, gram):
+        if self.columns is None:
+            X, y = gram.square_root()
+            return np.linalg.lstsq(X, y, rcond=None)[0]
+        columns = np.asarray(self.columns, dtype='intp')
+        X, y = gram.subset(columns).square_root()
+        coef = np.zeros(gram.n_features)
+        coef[columns] = np.linalg.lstsq(X, y, rcond=None)[0]
+        return coef
+
+
+class StreamingLasso(_StreamingLinearModel):
+    """Padanan ``Lasso(alpha)`` yang dilatih per chunk.
+
+    Setiap ``partial_fit`` me-refit dari XᵀX gabungan dengan warm start dari
+    koefisien sebelumnya, jadi model selalu siap dipakai di antara chunk.
+    """
+
+    def __init__(self, alpha=1.0, max_iter=10000, tol=1e-4):
+        self.alpha = alpha
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def _solve(self, gram, coef_init=None):
+        X, y = gram.square_root()
+        model = _compressed_lasso(gram, X, y, self.alpha, self.max_iter, self.tol)
+        init = getattr(self, 'coef_', None) if coef_init is None else coef_init
+        if init is not None and len(init) == X.shape[1]:
+            model.set_params(warm_start=True).coef_ = np.array(init, dtype='float64')
+        return model.fit(X, y).coef_
+
+
+def _compressed_lasso(gram, X, y, alpha, max_iter, tol):
+    """``Lasso`` pada sistem terkompresi dengan objektif yang setara fit penuh.
+
+    Lasso meminimalkan ‖y - Xw‖²/(2n) + alpha‖w‖₁; pada sistem dengan
+    ``len(X)`` baris alpha harus dikali ``n/len(X)``. Toleransi dual gap
+    scikit-learn relatif terhadap ‖y‖², jadi diskalakan ke yᵀy data asli.
+    """
+    ratio = gram.n / len(X)
+    tol = tol * gram.yy / max(float(y @ y), np.finfo('float64').tiny)
+    return Lasso(alpha=alpha * ratio, fit_intercept=False, max_iter=max_iter, tol=tol)
+
+
+class StreamingLassoSearch:
+    """:class:`ames_housing.tuning.LassoPathSearch` untuk data yang datang per chunk.
+
+    Setiap baris masuk ke fold ``nomor_baris % cv`` (urutan kedatangan),
+    dan setiap fold punya :class:`GramAccumulator` sendiri. Data latih fold
+    k = gabungan akumulator fold lain, sedangkan R² di fold k dihitung dari
+    akumulator fold k itu sendiri, jadi seluruh pencarian cukup satu
+    lintasan data. Setelah ``solve`` (atau ``fit``): ``best_alpha_``,
+    ``best_score_``, ``cv_scores_`` dan ``best_estimator_``
+    (:class:`StreamingLasso` di seluruh data, bisa dilanjutkan
+    ``partial_fit``).
+    """
+
+    def __init__(self, alphas, cv=5, max_iter=10000, tol=1e-4):
+        self.alphas = alphas
+        self.cv = cv
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def fit(self, X, y):
+        self.folds_ = None
+        return self.partial_fit(X, y).solve()
+
+    def partial_fit(self, X, y):
+        """Tambahkan satu chunk ke akumulator fold (tanpa fit)."""
+        if getattr(self, 'folds_', None) is None:
+            self.folds_ = [GramAccumulator() for _ in range(self.cv)]
+            self.n_rows_ = 0
+        if isinstance(X, pd.DataFrame):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        X, y = _as_float(X), _as_float(y)
+        fold = (self.n_rows_ + np.arange(len(X))) % self.cv
+        for k, acc in enumerate(self.folds_):
+            rows = fold == k
+            acc.update(X[rows], y[rows])
+        self.n_rows_ += len(X)
+        return self
+
+    def _path(self, gram, alphas):
+        X, y = gram.square_root()
+        ratio = gram.n / len(X)
+        tol = self.tol * gram.yy / max(float(y @ y), np.finfo('float64').tiny)
+        _, coefs, _ = lasso_path(np.asfortranarray(X), y, alphas=alphas * ratio,
+                                 max_iter=self.max_iter, tol=tol)
+        return coefs
+
+    def solve(self):
+        """Jalur Lasso per fold dan pada seluruh data dari akumulator yang terkumpul."""
+        alphas = np.sort(np.asarray(self.alphas, dtype='float64'))[::-1]
+        scores = []
+        for k, test in enumerate(self.folds_):
+            train = GramAccumulator()
+            for j, acc in enumerate(self.folds_):
+                if j != k:
+                    train.merge(acc)
+            coefs = self._path(train, alphas)
+            intercepts = train.y_mean - train.x_mean @ coefs
+            scores.append(1 - test.sse(coefs, intercepts) / test.yy)
+
+        self.cv_scores_ = pd.DataFrame(np.column_stack(scores), index=pd.Index(alphas, name='alpha'),
+                                       columns=[f"fold{i}" for i in range(len(self.folds_))])
+        mean = self.cv_scores_.mean(axis=1)
+        best = mean[mean == mean.max()].index.min()
+        self.best_alpha_ = float(best)
+        self.best_score_ = float(mean[best])
+
+        full = GramAccumulator()
+        for acc in self.folds_:
+            full.merge(acc)
+        full_coefs = self._path(full, alphas)
+        model = StreamingLasso(alpha=self.best_alpha_, max_iter=self.max_iter, tol=self.tol)
+        model.coef_ = full_coefs[:, int(np.flatnonzero(alphas == best)[0])].copy()
+        if hasattr(self, 'feature_names_in_'):
+            model.feature_names_in_ = self.feature_names_in_
+        self.best_estimator_ = model.fit_gram(full)
+        return self
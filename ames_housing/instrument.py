@@ -0,0 +1,270 @@
+"""Instrumentasi ringan per tahap pipeline.
+
+Contoh::
+
+    from ames_housing import instrument
+
+    instrument.configure(log_path='logs/stages.jsonl', metrics_path='metrics/ames.prom')
+
+    with instrument.stage('outliers.iqr', rows_in=len(df)) as s:
+        df = iqr_outliers(df, columns, action='drop')
+        s.rows_out = len(df)
+
+    @instrument.instrumented('encode')
+    def encode(df): ...
+
+Setiap tahap mencatat waktu wall, waktu CPU (proses ini ditambah proses
+anak yang sudah selesai, misalnya worker pool yang ditutup di dalam
+tahap), peak RSS proses dan kenaikannya, jumlah baris masuk/keluar, serta
+(opsional, ``trace_memory=True``) peak alokasi memori tahap itu sendiri
+lewat ``tracemalloc``. Tahap boleh bersarang; namanya digabung dengan
+``/``.
+
+Setiap catatan dikirim sebagai satu baris JSON ke logger
+``ames_housing.instrument`` dan, jika ``log_path`` diisi, ke file JSONL.
+Agregat per tahap bisa ditulis ke file teks format Prometheus
+(``metrics_path``), yang bisa dibaca textfile collector node_exporter atau
+receiver Prometheus di OpenTelemetry Collector.
+
+Saat nonaktif (default), ``stage`` hanya memeriksa satu flag lalu
+mengembalikan context manager kosong, dan fungsi ber-``instrumented``
+langsung dipanggil. Variabel lingkungan ``AMES_INSTRUMENT_LOG`` dan
+``AMES_INSTRUMENT_METRICS`` mengaktifkannya tanpa mengubah kode.
+"""
+
+import functools
+import json
+import logging
+import os
+import resource
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_METRICS = (
+    # nama metrik, field catatan, tipe, keterangan
+    ('ames_stage_calls_total', None, 'counter', 'Jumlah eksekusi tahap'),
+    ('ames_stage_wall_seconds_total', 'wall_seconds', 'counter', 'Total waktu wall tahap'),
+    ('ames_stage_cpu_seconds_total', 'cpu_seconds', 'counter', 'Total waktu CPU tahap'),
+    ('ames_stage_rows_in_total', 'rows_in', 'counter', 'Total baris masuk'),
+    ('ames_stage_rows_out_total', 'rows_out', 'counter', 'Total baris keluar'),
+    ('ames_stage_peak_rss_bytes', 'peak_rss_mb', 'gauge', 'Peak RSS proses setelah tahap terakhir'),
+    ('ames_stage_traced_peak_bytes', 'traced_peak_mb', 'gauge', 'Peak alokasi tahap terakhir (tracemalloc)'),
+)
+_MB = 1024 * 1024
+
+
+def _rss_mb():
+    # Linux melaporkan ru_maxrss dalam KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _count_rows(value):
+    if hasattr(value, 'shape') and len(getattr(value, 'shape', ())) > 0:
+        return int(value.shape[0])
+    return None
+
+
+class _Recorder:
+    def __init__(self):
+        self.enabled = False
+        self.log_path = None
+        self.metrics_path = None
+        self.trace_memory = False
+        self.records = []
+        self.totals = {}
+        self.stack = []
+
+
+_recorder = _Recorder()
+
+
+def configure(enabled=True, log_path=None, metrics_path=None, trace_memory=False):
+    """Aktifkan (atau matikan) instrumentasi dan tentukan tujuan keluarannya."""
+    _recorder.enabled = enabled
+    _recorder.log_path = log_path
+    _recorder.metrics_path = metrics_path
+    _recorder.trace_memory = trace_memory
+    if enabled and trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    for path in (log_path, metrics_path):
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+def is_enabled():
+    return _recorder.enabled
+
+
+def reset():
+    """Hapus catatan dan agregat yang sudah terkumpul."""
+    _recorder.records.clear()
+    _recorder.totals.clear()
+
+
+class _NullStage:
+    rows_in = rows_out = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """Context manager satu eksekusi tahap; isi ``rows_out`` di dalam blok."""
+
+    def __init__(self, name, rows_in=None, **labels):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.labels = labels
+        self._child_peak = 0
+
+    def __enter__(self):
+        stack = _recorder.stack
+        self.path = '/'.join([s.name for s in stack] + [self.name])
+        if _recorder.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Peak tahap induk sejauh ini harus disimpan sebelum di-reset.
+                stack[-1]._child_peak = max(stack[-1]._child_peak, peak - stack[-1]._traced_start)
+            tracemalloc.reset_peak()
+            self._traced_start = current
+        stack.append(self)
+        self._rss_start = _rss_mb()
+        self._cpu_start = _cpu_seconds()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall_start
+        cpu = _cpu_seconds() - self._cpu_start
+        rss = _rss_mb()
+        _recorder.stack.pop()
+        record = {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'stage': self.path,
+            'wall_seconds': wall,
+            'cpu_seconds': cpu,
+            'peak_rss_mb': rss,
+            'rss_increase_mb': rss - self._rss_start,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'status': 'ok' if exc_type is None else f'error: {exc_type.__name__}',
+            **self.labels,
+        }
+        if _recorder.trace_memory and tracemalloc.is_tracing():
+            traced = max(tracemalloc.get_traced_memory()[1] - self._traced_start, self._child_peak)
+            record['traced_peak_mb'] = traced / _MB
+            if _recorder.stack:
+                parent = _recorder.stack[-1]
+                parent._child_peak = max(parent._child_peak, traced + self._traced_start - parent._traced_start)
+        _emit(record)
+        return False
+
+
+def stage(name, rows_in=None, **labels):
+    """Context manager pengukur satu tahap (kosong jika instrumentasi nonaktif)."""
+    if not _recorder.enabled:
+        return _NULL_STAGE
+    return Stage(name, rows_in, **labels)
+
+
+def instrumented(name=None):
+    """Dekorator: ukur setiap panggilan fungsi sebagai tahap ``name``.
+
+    Baris masuk diambil dari ``shape[0]`` argumen pertama, baris keluar
+    dari ``shape[0]`` hasil (jika keduanya punya ``shape``).
+    """
+    def decorator(fn):
+        stage_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _recorder.enabled:
+                return fn(*args, **kwargs)
+            with Stage(stage_name, _count_rows(args[0]) if args else None) as s:
+                result = fn(*args, **kwargs)
+                s.rows_out = _count_rows(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _emit(record):
+    _recorder.records.append(record)
+    totals = _recorder.totals.setdefault(record['stage'], {'calls': 0})
+    totals['calls'] += 1
+    for _, field, kind, _ in _METRICS:
+        if field is None or record.get(field) is None:
+            continue
+        if kind == 'counter':
+            totals[field] = totals.get(field, 0) + record[field]
+        else:
+            totals[field] = record[field]
+
+    line = json.dumps(record, default=str)
+    logger.info(line)
+    if _recorder.log_path:
+        with open(_recorder.log_path, 'a') as f:
+            f.write(line + '\n')
+    # File metrik ditulis ulang hanya saat tahap terluar selesai.
+    if _recorder.metrics_path and not _recorder.stack:
+        write_prometheus(_recorder.metrics_path)
+
+
+def records():
+    """Semua catatan tahap sebagai DataFrame (satu baris per eksekusi)."""
+    return pd.DataFrame(_recorder.records)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text():
+    """Agregat per tahap dalam format teks eksposisi Prometheus."""
+    lines = []
+    for metric, field, kind, help_text in _METRICS:
+        samples = []
+        for name, totals in _recorder.totals.items():
+            value = totals['calls'] if field is None else totals.get(field)
+            if value is None:
+                continue
+            if field is not None and field.endswith('_mb'):
+                value *= _MB
+            samples.append(f'{metric}{{stage="{_label(name)}"}} {value:.17g}')
+        if samples:
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} {kind}', *samples]
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path):
+    """Tulis ``prometheus_text`` ke ``path`` secara atomik (tmp lalu rename)."""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+    return path
+
+
+if os.environ.get('AMES_INSTRUMENT_LOG') or os.environ.get('AMES_INSTRUMENT_METRICS'):
+    configure(log_path=os.environ.get('AMES_INSTRUMENT_LOG'),
+              metrics_path=os.environ.get('AMES_INSTRUMENT_METRICS'))
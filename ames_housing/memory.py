@@ -0,0 +1,97 @@
+"""Penghematan memori DataFrame lewat downcasting dtype.
+
+- Integer diperkecil ke lebar terkecil yang masih memuat min/max; integer
+  tak bertanda tetap tak bertanda (``uint8`` ... ``uint64``).
+- Float yang seluruh nilainya bulat dan tanpa NaN (misalnya kode ordinal
+  hasil encoding) menjadi integer; float lain menjadi float32 hanya jika
+  setiap nilai kembali persis sama setelah float64 -> float32 -> float64.
+  ``float_rtol > 0`` (opt-in) mengizinkan pembulatan sampai selisih
+  relatif tersebut.
+- Kolom string menjadi ``category`` jika jumlah nilai uniknya paling banyak
+  ``category_ratio`` x jumlah baris.
+
+Hati-hati dengan aritmetika setelah downcast: penjumlahan dua kolom int16
+bisa overflow tanpa peringatan.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api import types
+
+_INT_DTYPES = ('int8', 'int16', 'int32', 'int64')
+_UINT_DTYPES = ('uint8', 'uint16', 'uint32', 'uint64')
+
+
+def _smallest_int(lo, hi, unsigned=False):
+    """Dtype integer terkecil yang memuat ``[lo, hi]``, atau None jika tidak ada."""
+    lo, hi = int(lo), int(hi)  # bandingkan sebagai int Python agar uint64 > 2**63 tetap eksak
+    for dtype in _UINT_DTYPES if unsigned else _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return None
+
+
+def _nullable(dtype):
+    # int8 -> Int8, uint8 -> UInt8
+    return 'UInt' + dtype[4:] if dtype.startswith('uint') else 'Int' + dtype[3:]
+
+
+def downcast_series(series, float_rtol=0.0, category_ratio=0.5):
+    """Versi ``series`` dengan dtype sekecil mungkin tanpa mengubah nilainya (lihat modul)."""
+    dtype = series.dtype
+    if types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype) or series.empty:
+        return series
+    if types.is_integer_dtype(dtype):
+        if series.isna().all():
+            return series
+        target = _smallest_int(series.min(), series.max(), types.is_unsigned_integer_dtype(dtype))
+        if target is None:
+            return series
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            target = _nullable(target)  # Int64 -> Int8, tetap nullable
+        return series.astype(target)
+    if types.is_float_dtype(dtype):
+        values = series.to_numpy(dtype='float64')
+        if np.isfinite(values).all() and (values == np.round(values)).all():
+            target = _smallest_int(values.min(), values.max())
+            if target is not None:
+                return series.astype(target)
+        with np.errstate(over='ignore', invalid='ignore'):
+            roundtrip = values.astype('float32').astype('float64')  # overflow -> inf, selalu ditolak
+        if float_rtol:
+            lossless = np.allclose(roundtrip, values, rtol=float_rtol, atol=0, equal_nan=True)
+        else:
+            lossless = ((roundtrip == values) | (np.isnan(roundtrip) & np.isnan(values))).all()
+        if lossless:
+            return series.astype('float32')
+        return series
+    if types.is_object_dtype(dtype) or types.is_string_dtype(dtype):
+        if series.nunique(dropna=True) <= category_ratio * len(series):
+            return series.astype('category')
+    return series
+
+
+def downcast(df, float_rtol=0.0, category_ratio=0.5, exclude=()):
+    """Downcast semua kolom ``df`` dan laporkan penghematan byte per kolom.
+
+    Mengembalikan ``(report, hasil)``. ``report`` berisi Column, Before,
+    After, Bytes Before, Bytes After dan Saved (byte, termasuk isi string),
+    terurut dari penghematan terbesar, dengan baris ``TOTAL`` di akhir.
+    Kolom di ``exclude`` dibiarkan apa adanya.
+    """
+    columns, rows = {}, []
+    for col, series in df.items():
+        new = series if col in exclude else downcast_series(series, float_rtol, category_ratio)
+        before = int(series.memory_usage(index=False, deep=True))
+        after = int(new.memory_usage(index=False, deep=True))
+        columns[col] = new
+        rows.append({'Column': col, 'Before': str(series.dtype), 'After': str(new.dtype),
+                     'Bytes Before': before, 'Bytes After': after, 'Saved': before - after})
+    result = pd.DataFrame(columns, index=df.index)
+
+    report = pd.DataFrame(rows, columns=['Column', 'Before', 'After', 'Bytes Before', 'Bytes After', 'Saved'])
+    report = report.sort_values(by='Saved', ascending=False, kind='stable').reset_index(drop=True)
+    total = report[['Bytes Before', 'Bytes After', 'Saved']].sum()
+    report.loc[len(report)] = {'Column': 'TOTAL', 'Before': '', 'After': '', **total.to_dict()}
+    return report, result
@@ -0,0 +1,271 @@
+"""Pelatihan dan perbandingan beberapa model regresi secara paralel.
+
+Setiap kandidat di-fit di proses terpisah (``ProcessPoolExecutor``). Array
+``X_train``/``X_test``/``y_train`` ditaruh sekali di shared memory dan
+worker hanya menerima nama segmen, bentuk dan dtype-nya, bukan salinan
+data yang di-pickle. Estimator yang sudah di-fit (dan prediksinya)
+disimpan berdasarkan konfigurasi (kelas + parameter) dan hash data, di
+memori dan opsional di :class:`ames_housing.cache.ArtifactCache`, jadi
+model yang sama pada data yang sama tidak dilatih dua kali, juga antar
+eksekusi.
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error, r2_score
+from threadpoolctl import threadpool_limits
+
+
+def _as_array(values):
+    return np.ascontiguousarray(np.asarray(values, dtype='float64'))
+
+
+def data_fingerprint(*arrays):
+    """Hash isi, bentuk dan dtype beberapa array (kunci cache data latih).
+
+    Untuk DataFrame nama kolom ikut di-hash, karena estimator menyimpannya.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for values in arrays:
+        if isinstance(values, pd.DataFrame):
+            h.update(repr(list(values.columns)).encode())
+            dtypes = [str(dtype) for dtype in values.dtypes]
+        else:
+            dtypes = str(values.dtype if hasattr(values, 'dtype') else np.asarray(values).dtype)
+        # dtype asli (sebelum dijadikan float64) ikut di-hash: float32 vs float64 bukan data yang sama.
+        h.update(repr(dtypes).encode())
+        values = _as_array(values)
+        h.update(repr(values.shape).encode())
+        h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def estimator_config(estimator):
+    """Representasi deterministik kelas + parameter estimator."""
+    params = sorted((k, repr(v)) for k, v in estimator.get_params(deep=False).items() if k != 'n_jobs')
+    cls = type(estimator)
+    return f"{cls.__module__}.{cls.__qualname__}{params}"
+
+
+def estimator_key(estimator, data_hash):
+    """Kunci cache fit: konfigurasi estimator + versi scikit-learn + hash data."""
+    config = f"sklearn-{sklearn.__version__}:{estimator_config(estimator)}"
+    config = hashlib.blake2b(config.encode(), digest_size=16).hexdigest()
+    return f"{config}-{data_hash}"
+
+
+class SharedArray:
+    """Array NumPy di ``multiprocessing.shared_memory`` milik proses induk."""
+
+    def __init__(self, values):
+        values = _as_array(values)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self.spec = (self._shm.name, values.shape, values.dtype.str)
+        np.ndarray(values.shape, dtype=values.dtype, buffer=self._shm.buf)[...] = values
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _call_shared(fn, specs, args):
+    handles, arrays = [], []
+    try:
+        for spec in specs:
+            shm, values = _attach(spec)
+            handles.append(shm)
+            arrays.append(values)
+        return fn(*arrays, *args)
+    finally:
+        del arrays
+        for shm in handles:
+            shm.close()
+
+
+def map_shared(fn, arrays, tasks, n_jobs=1):
+    """``[fn(*arrays, *task) for task in tasks]``, paralel jika ``n_jobs != 1``.
+
+    Di mode paralel ``arrays`` disalin sekali ke shared memory dan setiap
+    worker hanya menerima argumen ``task``-nya. ``fn`` harus fungsi tingkat
+    modul dan tidak boleh menyimpan referensi ke array masukan.
+    """
+    tasks = list(tasks)
+    if n_jobs == 1 or len(tasks) <= 1:
+        arrays = [_as_array(values) for values in arrays]
+        return [fn(*arrays, *task) for task in tasks]
+    max_workers = None if n_jobs in (None, -1) else n_jobs
+    shared = [SharedArray(values) for values in arrays]
+    try:
+        specs = [s.spec for s in shared]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_call_shared, [fn] * len(tasks), [specs] * len(tasks), tasks))
+    finally:
+        for s in shared:
+            s.close()
+
+
+def _fit_predict(estimator, n_jobs, feature_names, X_spec, y_spec, test_spec):
+    """Worker: fit di atas array shared memory lalu prediksi ``X_test``."""
+    handles = []
+
+    def attach(spec):
+        shm, values = _attach(spec)
+        handles.append(shm)
+        return values
+
+    try:
+        with threadpool_limits(limits=n_jobs):
+            start = time.perf_counter()
+            estimator.fit(attach(X_spec), attach(y_spec))
+            fit_time = time.perf_counter() - start
+            y_pred = None
+            if test_spec is not None:
+                y_pred = np.asarray(estimator.predict(attach(test_spec)), dtype='float64')
+        if feature_names is not None:
+            # Sama seperti fit dengan DataFrame, agar prediksi dengan DataFrame tetap divalidasi.
+            estimator.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        return estimator, y_pred, fit_time
+    finally:
+        for shm in handles:
+            shm.close()
+
+
+class ModelRunner:
+    """Fit dan evaluasi banyak estimator sekaligus di process pool.
+
+    ``n_jobs`` adalah jumlah core total (-1/None = semua core). Core dibagi
+    rata ke model yang berjalan bersamaan: estimator dengan parameter
+    ``n_jobs`` (misalnya Random Forest) mendapat bagiannya, dan thread
+    BLAS/OpenMP di setiap worker dibatasi ke jumlah yang sama sehingga
+    tidak terjadi oversubscription. ``model_n_jobs`` bisa menimpa jatah
+    per model berdasarkan nama.
+
+    Dengan ``cache`` (:class:`~ames_housing.cache.ArtifactCache`) estimator
+    ter-fit dan prediksinya juga disimpan di disk. Estimator yang
+    dikembalikan berasal dari cache; gunakan ``clone`` jika ingin melatih
+    ulang dengan data lain.
+    """
+
+    def __init__(self, n_jobs=-1, model_n_jobs=None, cache=None):
+        self.n_jobs = n_jobs
+        self.model_n_jobs = model_n_jobs or {}
+        self.cache = cache
+        self._fitted = {}
+        self._predictions = {}
+
+    def _cores(self):
+        return (os.cpu_count() or 1) if self.n_jobs in (None, -1) else self.n_jobs
+
+    def _key(self, estimator, X, y):
+        return estimator_key(estimator, data_fingerprint(X, y))
+
+    def _load(self, store, key):
+        if key not in store and self.cache is not None:
+            value = self.cache.get(key)
+            if value is not None:
+                store[key] = value
+        return store.get(key)
+
+    def _save(self, store, key, value):
+        store[key] = value
+        if self.cache is not None:
+            self.cache.put(key, value)
+
+    def cached(self, estimator, X, y):
+        """Estimator ter-fit dari cache untuk konfigurasi dan data ini, atau None."""
+        return self._load(self._fitted, self._key(estimator, X, y))
+
+    def fit(self, estimator, X, y):
+        """Fit satu estimator (atau ambil dari cache) dan kembalikan hasilnya."""
+        return self.fit_many({'model': estimator}, X, y)['model']
+
+    def fit_predict(self, estimator, X_train, y_train, X_test):
+        """Seperti ``fit`` ditambah prediksi ``X_test`` (keduanya di-cache)."""
+        fitted = self.fit_many({'model': estimator}, X_train, y_train, X_test)['model']
+        return fitted, self.predictions_['model']
+
+    def fit_many(self, models, X_train, y_train, X_test=None):
+        """Fit semua ``models`` (dict nama -> estimator) secara paralel.
+
+        Mengembalikan dict nama -> estimator ter-fit. Jika ``X_test``
+        diberikan, prediksi setiap model tersedia di ``predictions_``.
+        """
+        feature_names = list(X_train.columns) if isinstance(X_train, pd.DataFrame) else None
+        data_hash = data_fingerprint(X_train, y_train)
+        keys = {name: estimator_key(est, data_hash) for name, est in models.items()}
+        todo = [name for name in models if self._load(self._fitted, keys[name]) is None]
+        test_hash = data_fingerprint(X_test) if X_test is not None else None
+        self.fit_times_ = {name: 0.0 for name in models}
+
+        fitted, predictions = {}, {}
+        if todo:
+            workers = min(len(todo), self._cores())
+            shares = {name: self.model_n_jobs.get(name, max(1, self._cores() // workers)) for name in todo}
+            shared = [SharedArray(X_train), SharedArray(y_train)]
+            test = SharedArray(X_test) if X_test is not None else None
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {}
+                    for name in todo:
+                        estimator = clone(models[name])
+                        if 'n_jobs' in estimator.get_params(deep=False):
+                            estimator.set_params(n_jobs=shares[name])
+                        futures[name] = pool.submit(_fit_predict, estimator, shares[name], feature_names,
+                                                    shared[0].spec, shared[1].spec,
+                                                    test.spec if test is not None else None)
+                    for name, future in futures.items():
+                        fitted[name], predictions[name], self.fit_times_[name] = future.result()
+                        self._save(self._fitted, keys[name], fitted[name])
+                        if X_test is not None:
+                            self._save(self._predictions, f"{keys[name]}-{test_hash}", predictions[name])
+            finally:
+                for s in shared + ([test] if test is not None else []):
+                    s.close()
+
+        for name in models:
+            if name not in fitted:
+                fitted[name] = self._fitted[keys[name]]
+                if X_test is not None:
+                    pred_key = f"{keys[name]}-{test_hash}"
+                    predictions[name] = self._load(self._predictions, pred_key)
+                    if predictions[name] is None:
+                        predictions[name] = np.asarray(fitted[name].predict(X_test), dtype='float64')
+                        self._save(self._predictions, pred_key, predictions[name])
+        self.predictions_ = predictions
+        return {name: fitted[name] for name in models}
+
+    def compare(self, models, X_train, y_train, X_test, y_test):
+        """Fit semua model paralel lalu hitung RMSE dan R² pada data uji.
+
+        Estimator ter-fit tersedia di ``fitted_``. Mengembalikan DataFrame
+        berindeks nama model dengan kolom ``RMSE``, ``R2`` dan ``fit_time``.
+        """
+        self.fitted_ = self.fit_many(models, X_train, y_train, X_test)
+        rows = {}
+        for name in models:
+            y_pred = self.predictions_[name]
+            rows[name] = {
+                'RMSE': np.sqrt(mean_squared_error(y_test, y_pred)),
+                'R2': r2_score(y_test, y_pred),
+                'fit_time': self.fit_times_[name],
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+    def clear_cache(self):
+        """Kosongkan cache di memori (cache disk tidak disentuh)."""
+        self._fitted.clear()
+        self._predictions.clear()
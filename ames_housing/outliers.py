@@ -0,0 +1,73 @@
+"""Deteksi dan penanganan outlier IQR dalam satu lintasan.
+
+Q1 dan Q3 semua kolom dihitung dengan satu panggilan ``quantile``, lalu
+satu mask boolean (baris x kolom) dibangun lewat broadcasting NumPy.
+Laporan per kolom, mask baris, dan frame hasil diturunkan dari mask yang
+sama tanpa salinan antara per kolom.
+"""
+
+import numpy as np
+import pandas as pd
+
+ACTIONS = ('drop', 'cap', 'mask')
+
+
+def bounds_from_quartiles(q1, q3, whisker=1.5):
+    """Batas bawah/atas IQR dari Series Q1 dan Q3 (index = nama kolom)."""
+    iqr = q3 - q1
+    return pd.DataFrame({'Q1': q1, 'Q3': q3,
+                         'lower': q1 - whisker * iqr, 'upper': q3 + whisker * iqr})
+
+
+def iqr_bounds(df, columns, whisker=1.5):
+    """Q1, Q3 dan batas outlier semua kolom dari satu panggilan ``quantile``."""
+    quartiles = df[list(columns)].quantile([0.25, 0.75])
+    return bounds_from_quartiles(quartiles.loc[0.25], quartiles.loc[0.75], whisker)
+
+
+def outlier_report(columns, counts, n_rows):
+    """Tabel laporan outlier (Column, Outliers, Percentage) seperti di notebook."""
+    counts = np.asarray(counts)
+    report = pd.DataFrame({
+        'Column': list(columns),
+        'Outliers': counts,
+        'Percentage': np.round(100 * counts / max(n_rows, 1), 2),
+    })
+    report = report[report['Outliers'] > 0]
+    return report.sort_values(by='Percentage', ascending=False).reset_index(drop=True)
+
+
+def outlier_mask(df, bounds):
+    """Mask boolean (baris x kolom) untuk nilai di luar batas IQR.
+
+    Missing value tidak dianggap outlier.
+    """
+    values = df[bounds.index].to_numpy(dtype='float64', na_value=np.nan)
+    return (values < bounds['lower'].to_numpy()) | (values > bounds['upper'].to_numpy())
+
+
+def iqr_outliers(df, columns, whisker=1.5, action='drop'):
+    """Laporan outlier IQR dan hasil penanganannya sekaligus.
+
+    ``action``:
+
+    - ``'drop'``: buang baris yang outlier di kolom mana pun (satu salinan).
+    - ``'mask'``: kembalikan mask baris yang dipertahankan saja.
+    - ``'cap'``: winsorize, nilai di luar batas dipotong ke batas IQR.
+
+    Semua batas dihitung dari ``df`` awal, bukan dari data yang sudah
+    difilter kolom sebelumnya. Mengembalikan ``(report, hasil)``.
+    """
+    if action not in ACTIONS:
+        raise ValueError(f"action harus salah satu dari {ACTIONS}, bukan {action!r}")
+    bounds = iqr_bounds(df, columns, whisker)
+    mask = outlier_mask(df, bounds)
+    report = outlier_report(bounds.index, mask.sum(axis=0), len(df))
+
+    if action == 'mask':
+        return report, ~mask.any(axis=1)
+    if action == 'drop':
+        return report, df.loc[~mask.any(axis=1)]
+    capped = df.copy()
+    capped[bounds.index] = df[bounds.index].clip(bounds['lower'], bounds['upper'], axis=1)
+    return report, capped
@@ -0,0 +1,312 @@
+"""Alur notebook sebagai fungsi: load, preprocess, train, evaluate, select.
+
+Urutan langkahnya sama dengan ``notebook.py`` (downcast, imputasi,
+pembuangan outlier IQR, encoding, split 80/20, perbandingan model,
+seleksi fitur), tetapi tanpa plot dan tanpa impor matplotlib/seaborn,
+sehingga bisa dipakai dari job batch maupun CLI (``python -m ames_housing
+train``).
+"""
+
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from .arff_io import iter_arff_chunks, load_dataset
+from .attribution import permutation_importance
+from .cache import ArtifactCache
+from .dedup import drop_duplicates, find_duplicates
+from .incremental import StreamingLassoSearch, StreamingLinearRegression
+from .instrument import stage
+from .memory import downcast
+from .modeling import ModelRunner
+from .outliers import bounds_from_quartiles, iqr_outliers, outlier_mask
+from .preprocessing import TARGET, HousePreprocessor, NativeCategoricalEncoder
+from .selection import FeatureCurve
+from .streaming import DescribeAccumulator
+from .tuning import LassoPathSearch
+from .validation import CrossValidator
+
+LASSO_ALPHAS = [0.001, 0.01, 0.1, 1, 10]
+
+
+def load(path, downcast_dtypes=True):
+    """Dataset dari ARFF (lewat cache Feather), dtype diperkecil jika ``downcast_dtypes``."""
+    with stage('load') as st:
+        df = load_dataset(path)
+        if downcast_dtypes:
+            _, df = downcast(df)
+        st.rows_out = len(df)
+    return df
+
+
+def deduplicate(df, **params):
+    """``(df tanpa duplikat, cluster)``: duplikat eksak dan listing ulang dibuang, wakil cluster dipertahankan.
+
+    ``params`` diteruskan ke :class:`ames_housing.dedup.Deduplicator`.
+    """
+    with stage('dedup', rows_in=len(df)) as st:
+        clusters = find_duplicates(df, **params)
+        df = drop_duplicates(df, clusters)
+        st.rows_out = len(df)
+    return df, clusters
+
+
+def preprocess(df, preprocessor=None):
+    """Fit preprocessor dan kembalikan ``(preprocessor, X, y)``.
+
+    Baris outlier IQR (kolom numerik sebelum imputasi, seperti notebook)
+    dibuang setelah imputasi dan sebelum encoding.
+    """
+    preprocessor = preprocessor or HousePreprocessor()
+    numerical_columns = df.select_dtypes(include='number').columns
+    with stage('preprocess.impute', rows_in=len(df)):
+        df = preprocessor.imputer.fit_transform(df)
+    with stage('preprocess.outliers_iqr', rows_in=len(df)) as st:
+        _, keep_mask = iqr_outliers(df, numerical_columns, action='mask')
+        df = df.loc[keep_mask]
+        st.rows_out = len(df)
+    with stage('preprocess.encode', rows_in=len(df)):
+        X = preprocessor.encoder.fit_transform(df)
+        _, X = downcast(X)
+    return preprocessor, X, df[TARGET]
+
+
+def split(X, y, test_size=0.2, random_state=42):
+    return train_test_split(X, y, test_size=test_size, random_state=random_state)
+
+
+def default_models():
+    """Tiga model pembanding notebook."""
+    return {
+        "Random Forest": RandomForestRegressor(n_estimators=100, random_state=42),
+        "Linear Regression": LinearRegression(),
+        "Gradient Boosting": GradientBoostingRegressor(n_estimators=100, random_state=42),
+    }
+
+
+def hist_gradient_boosting(categorical_features=None, **params):
+    """``HistGradientBoostingRegressor`` untuk data dari ``NativeCategoricalEncoder``.
+
+    Fitur di-bin (maks. 255 bin) sehingga split dicari dari histogram,
+    dibangun paralel dengan OpenMP. Kolom kategori dipakai langsung
+    (``categorical_features`` = ``encoder.categorical_mask_``), dan jumlah
+    iterasi ditentukan early stopping pada 10% data latih.
+    """
+    defaults = {'max_iter': 1000, 'learning_rate': 0.05, 'early_stopping': True,
+                'validation_fraction': 0.1, 'n_iter_no_change': 20, 'random_state': 42}
+    return HistGradientBoostingRegressor(categorical_features=categorical_features, **{**defaults, **params})
+
+
+# Model yang dilatih di atas NativeCategoricalEncoder (tanpa ordinal/one-hot/label
+# encoding notebook); factory menerima ``categorical_features``.
+NATIVE_MODELS = {
+    "Hist Gradient Boosting": hist_gradient_boosting,
+}
+
+
+def native_models(categorical_mask):
+    return {name: factory(categorical_features=categorical_mask) for name, factory in NATIVE_MODELS.items()}
+
+
+def make_runner(n_jobs=-1, cache_dir='.cache/models'):
+    return ModelRunner(n_jobs=n_jobs, cache=ArtifactCache(cache_dir) if cache_dir else None)
+
+
+def train(X_train, y_train, X_test, y_test, models=None, runner=None):
+    """Fit dan bandingkan ``models``; mengembalikan ``(runner, hasil)``."""
+    runner = runner or make_runner()
+    with stage('models.compare', rows_in=len(X_train)):
+        results = runner.compare(models or default_models(), X_train, y_train, X_test, y_test)
+    return runner, results
+
+
+def cross_validate(X, y, models=None, n_splits=5, n_jobs=-1, cache_dir='.cache/models'):
+    """RMSE/R² k-fold (rata-rata dan simpangan baku) dengan fold yang sama untuk semua model.
+
+    Mengembalikan ``(validator, ringkasan)``; skor per fold ada di
+    ``validator.fold_scores_``.
+    """
+    validator = CrossValidator(n_splits, n_jobs=n_jobs, cache=ArtifactCache(cache_dir) if cache_dir else None)
+    with stage('models.cross_validate', rows_in=len(X)):
+        summary = validator.evaluate(models or default_models(), X, y)
+    return validator, summary
+
+
+def evaluate(y_true, y_pred):
+    """``(RMSE, R²)``."""
+    return float(np.sqrt(mean_squared_error(y_true, y_pred))), float(r2_score(y_true, y_pred))
+
+
+def fit_evaluate(runner, model, X_train, y_train, X_test, y_test):
+    """Fit ``model`` lewat ``runner`` (cache dipakai jika ada) lalu ``evaluate`` di data uji."""
+    _, y_pred = runner.fit_predict(model, X_train, y_train, X_test)
+    return evaluate(y_test, y_pred)
+
+
+def select_by_importance(model, columns):
+    """Fitur dengan ``feature_importances_`` di atas rata-rata."""
+    importances = pd.Series(model.feature_importances_, index=columns)
+    return importances[importances > importances.mean()].index.tolist()
+
+
+def select_by_permutation(model, X_test, y_test, n_repeats=5, n_jobs=-1):
+    """Fitur yang menaikkan RMSE data uji saat diacak (importance rata-rata > 0)."""
+    with stage('models.permutation_importance', rows_in=len(X_test)):
+        importances = permutation_importance(model, X_test, y_test, n_repeats=n_repeats, n_jobs=n_jobs)
+    return importances[importances['importance_mean'] > 0].index.tolist(), importances
+
+
+def select_by_lasso(X_train, y_train, alphas=LASSO_ALPHAS, threshold=1e-4, n_jobs=-1):
+    """Fitur dengan |koefisien| Lasso terbaik (alpha dipilih lewat CV) di atas ``threshold``."""
+    with stage('models.lasso_search', rows_in=len(X_train)):
+        search = LassoPathSearch(alphas=alphas, cv=5, max_iter=10000, n_jobs=n_jobs).fit(X_train, y_train)
+    coef = pd.Series(search.best_estimator_.coef_, index=X_train.columns)
+    return coef[coef.abs() > threshold].index.tolist(), search
+
+
+def feature_selection(runner, models, X_train, y_train, X_test, y_test, n_jobs=-1):
+    """Evaluasi ulang model dengan fitur terpilih (importance untuk ensemble, Lasso untuk linear).
+
+    Mengembalikan DataFrame per model: jumlah fitur, RMSE dan R².
+    """
+    rows = {}
+    for name, model in models.items():
+        if hasattr(model, 'feature_importances_'):
+            selected = select_by_importance(model, X_train.columns)
+        else:
+            selected, _ = select_by_lasso(X_train, y_train, n_jobs=n_jobs)
+        rmse, r2 = fit_evaluate(runner, model, X_train[selected], y_train, X_test[selected], y_test)
+        rows[f"{name} + FS"] = {'n_features': len(selected), 'RMSE': rmse, 'R2': r2}
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def feature_curve(model, X_train, y_train, X_test, y_test, sizes=None, rank_method='auto', n_jobs=-1):
+    """Kurva RMSE vs jumlah fitur teratas (lihat :class:`ames_housing.selection.FeatureCurve`)."""
+    with stage('models.feature_curve', rows_in=len(X_train)):
+        return FeatureCurve(model, sizes=sizes, rank_method=rank_method, n_jobs=n_jobs).fit(
+            X_train, y_train, X_test, y_test)
+
+
+def save_artifacts(preprocessor, model, directory='artifacts'):
+    """Simpan preprocessor dan model untuk ``predict``/``serve``; mengembalikan kedua path."""
+    os.makedirs(directory, exist_ok=True)
+    preprocessor_path = os.path.join(directory, 'preprocessor.joblib')
+    model_path = os.path.join(directory, 'model.joblib')
+    preprocessor.save(preprocessor_path)
+    joblib.dump(model, model_path)
+    return preprocessor_path, model_path
+
+
+def run(path, artifacts='artifacts', cache_dir='.cache/models', n_jobs=-1, select=True, native=True, cv=0):
+    """Seluruh alur pelatihan dari file ARFF sampai artefak tersimpan.
+
+    Jika ``native``, model di ``NATIVE_MODELS`` ikut dibandingkan dengan
+    preprocessor ``NativeCategoricalEncoder`` (baris dan split yang sama).
+    Model dengan RMSE terendah disimpan ke ``artifacts`` bersama
+    preprocessor yang sesuai. Mengembalikan dict berisi ``results``
+    (perbandingan model, terurut RMSE), ``selection`` (jika ``select``),
+    ``best_model`` dan path artefak. Jika ``cv`` > 1, semua model juga
+    dievaluasi dengan validasi silang ``cv``-fold pada seluruh baris
+    (``cv``, terurut RMSE rata-rata).
+    """
+    df = load(path)
+    preprocessor, X, y = preprocess(df)
+    X_train, X_test, y_train, y_test = split(X, y)
+    runner, results = train(X_train, y_train, X_test, y_test, runner=make_runner(n_jobs, cache_dir))
+    encoded = dict(runner.fitted_)
+    candidates = {name: (preprocessor, model) for name, model in encoded.items()}
+    if native:
+        native_pre, Xn, yn = preprocess(df, HousePreprocessor(encoder=NativeCategoricalEncoder()))
+        Xn_train, Xn_test, yn_train, yn_test = split(Xn, yn)
+        _, native_results = train(Xn_train, yn_train, Xn_test, yn_test,
+                                  models=native_models(native_pre.encoder.categorical_mask_), runner=runner)
+        candidates.update({name: (native_pre, model) for name, model in runner.fitted_.items()})
+        results = pd.concat([results, native_results])
+    if cv > 1:
+        _, scores = cross_validate(X, y, n_splits=cv, n_jobs=n_jobs, cache_dir=cache_dir)
+        if native:
+            # Baris dan urutannya sama dengan X, jadi fold-nya juga sama.
+            _, native_scores = cross_validate(Xn, yn, native_models(native_pre.encoder.categorical_mask_),
+                                              n_splits=cv, n_jobs=n_jobs, cache_dir=cache_dir)
+            scores = pd.concat([scores, native_scores]).sort_values('RMSE_mean', kind='stable')
+    results = results.sort_values('RMSE', kind='stable')
+    best = results.index[0]
+    paths = save_artifacts(*candidates[best], artifacts)
+    summary = {'results': results, 'best_model': best, 'preprocessor_path': paths[0], 'model_path': paths[1]}
+    if cv > 1:
+        summary['cv'] = scores
+    if select:
+        summary['selection'] = feature_selection(runner, encoded, X_train, y_train, X_test, y_test, n_jobs)
+    return summary
+
+
+def _imputed_chunks(path, imputer, chunksize):
+    # iter_arff_chunks memberi INTEGER sebagai Int64 (nullable), yang tidak bisa
+    # diisi median pecahan; hasil encoding tetap float.
+    for chunk in iter_arff_chunks(path, chunksize):
+        nullable = chunk.select_dtypes(include='Int64').columns
+        yield imputer.transform(chunk.astype(dict.fromkeys(nullable, 'float64')))
+
+
+def iter_preprocessed(path, preprocessor, chunksize=100_000, bounds=None):
+    """``(X, y)`` per chunk file ARFF lewat ``preprocessor`` yang sudah di-fit.
+
+    Seperti ``preprocess``, baris yang outlier terhadap ``bounds`` (lihat
+    ``outliers.bounds_from_quartiles``) dibuang setelah imputasi dan
+    sebelum encoding.
+    """
+    for chunk in _imputed_chunks(path, preprocessor.imputer, chunksize):
+        if bounds is not None:
+            chunk = chunk.loc[~outlier_mask(chunk, bounds).any(axis=1)]
+        yield preprocessor.encoder.transform_array(chunk), chunk[TARGET].to_numpy(dtype='float64')
+
+
+def streaming_outlier_bounds(path, imputer, chunksize=100_000):
+    """Batas IQR kolom numerik data terimputasi, seperti ``preprocess``.
+
+    Kuartil diambil dari ``DescribeAccumulator`` (satu lintasan, memori
+    sebatas chunk; eksak sampai ukuran sampel reservoirnya).
+    """
+    describe = DescribeAccumulator(columns=imputer.numeric_columns_)
+    for chunk in _imputed_chunks(path, imputer, chunksize):
+        describe.update(chunk)
+    quartiles = describe.quantiles((0.25, 0.75))
+    return bounds_from_quartiles(quartiles.loc[0.25], quartiles.loc[0.75])
+
+
+def train_streaming(path, preprocessor, chunksize=100_000, alphas=LASSO_ALPHAS, threshold=1e-4, cv=5,
+                    remove_outliers=True):
+    """Seleksi fitur Lasso + regresi linear tanpa memuat seluruh data ke memori.
+
+    Setiap chunk diproses ``preprocessor`` yang sudah di-fit (misalnya
+    ``artifacts/preprocessor.joblib``); ``StreamingLassoSearch`` memilih
+    alpha lewat CV dalam satu lintasan, lalu OLS pada fitur terpilih
+    dihitung dari XᵀX yang sama tanpa lintasan tambahan. Jika
+    ``remove_outliers``, lintasan pertama menghitung batas IQR kolom numerik
+    seperti ``preprocess``. Mengembalikan dict ``search``, ``selected``
+    (nama fitur) dan ``model`` (``StreamingLinearRegression`` lebar penuh,
+    bisa dipakai ``ModelBundle`` dan dilanjutkan ``partial_fit``).
+    """
+    bounds = None
+    if remove_outliers:
+        with stage('streaming.outlier_bounds'):
+            bounds = streaming_outlier_bounds(path, preprocessor.imputer, chunksize)
+    search = StreamingLassoSearch(alphas, cv=cv)
+    with stage('streaming.accumulate') as st:
+        for X, y in iter_preprocessed(path, preprocessor, chunksize, bounds):
+            if np.isnan(X).any():
+                raise ValueError("keluaran preprocessor mengandung NaN; model linear butuh CategoricalEncoder")
+            search.partial_fit(X, y)
+        st.rows_out = search.n_rows_
+    with stage('streaming.solve', rows_in=search.n_rows_):
+        search.solve()
+        columns = np.flatnonzero(np.abs(search.best_estimator_.coef_) > threshold)
+        model = StreamingLinearRegression(columns=columns).fit_gram(search.best_estimator_.gram_)
+    names = list(preprocessor.feature_names_)
+    return {'search': search, 'selected': [names[i] for i in columns], 'model': model}
@@ -0,0 +1,398 @@
+"""Preprocessing yang di-fit sekali dan bisa diputar ulang pada listing baru.
+
+Langkah-langkahnya sama dengan notebook (imputasi missing value, encoding
+ordinal, one-hot, frekuensi ``Neighborhood`` dan label encoding), tetapi
+semua state yang dipelajari (median, modus, kosakata kategori, tabel
+frekuensi) disimpan di objek sehingga ``transform`` tidak pernah me-refit.
+"""
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+
+TARGET = 'SalePrice'
+
+SPARSE_COLUMNS = ['PoolQC', 'MiscFeature', 'Alley']
+NONE_COLUMNS = ['FireplaceQu', 'Fence', 'GarageType', 'GarageFinish', 'GarageQual',
+                'GarageCond', 'BsmtQual', 'BsmtCond', 'BsmtExposure', 'BsmtFinType1',
+                'BsmtFinType2', 'MasVnrType']
+ZERO_COLUMNS = ['MasVnrArea', 'GarageYrBlt']
+MODE_COLUMNS = ['Electrical']
+GROUP_MEDIAN_COLUMNS = {'LotFrontage': 'Neighborhood'}
+# Aturan imputasi per kolom: ('constant', nilai), 'median', 'mode' atau
+# ('group_median', kolom_grup). Median grup yang tidak dikenal jatuh ke median global.
+IMPUTATION_SPEC = {
+    **{col: ('constant', 'None') for col in NONE_COLUMNS},
+    **{col: ('constant', 0) for col in ZERO_COLUMNS},
+    **{col: 'mode' for col in MODE_COLUMNS},
+    **{col: ('group_median', key) for col, key in GROUP_MEDIAN_COLUMNS.items()},
+}
+IMPUTATION_STRATEGIES = ('constant', 'median', 'mode', 'group_median')
+
+LOW_VARIANCE_COLUMNS = ['Street', 'Utilities', 'Condition2', 'RoofMatl', 'BsmtFinType2']
+ORDINAL_MAPS = {
+    'ExterQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'ExterCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'BsmtQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'BsmtCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'BsmtExposure': ['No', 'Mn', 'Av', 'Gd', 'Ex'],
+    'HeatingQC': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'KitchenQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'FireplaceQu': ['No', 'Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'GarageQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'GarageCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
+    'GarageFinish': ['Unf', 'RFn', 'Fin'],
+    'PavedDrive': ['N', 'P', 'Y'],
+}
+ONEHOT_COLUMNS = ['LotConfig', 'HouseStyle', 'Exterior1st', 'Exterior2nd',
+                  'SaleType', 'SaleCondition', 'BldgType', 'Foundation',
+                  'GarageType', 'Fence', 'MasVnrType', 'CentralAir',
+                  'Electrical', 'Functional', 'GarageFinish']
+FREQUENCY_COLUMNS = ['Neighborhood']
+LABEL_COLUMNS = ['MSZoning', 'LotShape', 'LandContour', 'LandSlope', 'Condition1',
+                 'RoofStyle', 'BsmtFinType1', 'Heating']
+
+
+def _codes(values, vocabulary):
+    """Posisi setiap nilai di ``vocabulary`` (``pd.Index``); -1 untuk nilai tak dikenal/NaN."""
+    if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+        # Cukup petakan kategorinya lalu ambil lewat kode, tanpa materialisasi string.
+        mapping = np.append(vocabulary.get_indexer(values.cat.categories), -1)
+        return mapping[values.cat.codes.to_numpy()]
+    return vocabulary.get_indexer(np.asarray(values, dtype=object))
+
+
+def _vocabulary(series):
+    # Nilai teramati terurut, sama seperti LabelEncoder dan pd.get_dummies.
+    return pd.Index(sorted(pd.unique(series.dropna()).tolist()), dtype=object)
+
+
+def _parse_rule(column, rule):
+    """``(strategi, argumen)`` dari satu aturan ``IMPUTATION_SPEC``."""
+    strategy, *args = (rule,) if isinstance(rule, str) else tuple(rule)
+    if strategy not in IMPUTATION_STRATEGIES:
+        raise ValueError(f"strategi imputasi {strategy!r} untuk {column!r} tidak dikenal; "
+                         f"pilih salah satu dari {IMPUTATION_STRATEGIES}")
+    if len(args) != (1 if strategy in ('constant', 'group_median') else 0):
+        raise ValueError(f"aturan imputasi {column!r} tidak valid: {rule!r}")
+    return strategy, (args[0] if args else None)
+
+
+class Imputer(BaseEstimator, TransformerMixin):
+    """Imputasi missing value deklaratif dengan nilai yang dipelajari saat ``fit``.
+
+    ``spec`` memetakan kolom ke aturan (lihat ``IMPUTATION_SPEC``). ``fit``
+    menghitung semua median global dengan satu ``median()``, semua modus
+    dengan satu ``mode()``, dan median grup dengan satu agregasi
+    ``groupby`` per kolom grup, tanpa callback Python per grup. Nilai isian
+    skalar disimpan di ``fill_values_``, tabel median grup di
+    ``group_medians_`` dan aturan yang di-parse di ``rules_``; ``transform``
+    hanya memakai state hasil ``fit`` (mengubah ``spec`` setelah fit tidak
+    berpengaruh sampai fit ulang). Kolom skalar diisi dengan ``fillna``
+    per kolom dan median grup lewat lookup array kode grup.
+
+    Imputer ter-pickle dari versi sebelum ``spec`` (parameter
+    ``none_columns``/``zero_columns``/``mode_columns``/``group_median``)
+    dimigrasikan saat dimuat, jadi artefak lama tetap bisa dipakai.
+    """
+
+    def __init__(self, drop=SPARSE_COLUMNS, spec=IMPUTATION_SPEC):
+        self.drop = drop
+        self.spec = spec
+
+    def _rules(self):
+        return {col: _parse_rule(col, rule) for col, rule in self.spec.items()}
+
+    @staticmethod
+    def _columns(rules, strategy):
+        return [col for col, (s, _) in rules.items() if s == strategy]
+
+    @property
+    def none_columns(self):
+        """Kolom yang missing-nya berarti "tidak ada" (diisi konstanta ``'None'``)."""
+        return [col for col, (s, value) in self._rules().items() if s == 'constant' and value == 'None']
+
+    def fit(self, df, y=None):
+        self.feature_names_in_ = np.asarray(df.columns, dtype=object)
+        self.numeric_columns_ = df.select_dtypes(include='number').columns.tolist()
+        self.rules_ = rules = self._rules()
+        groups = {}
+        for col, (strategy, key) in rules.items():
+            if strategy == 'group_median':
+                groups.setdefault(key, []).append(col)
+
+        median_columns = self._columns(rules, 'median') + [col for cols in groups.values() for col in cols]
+        self.medians_ = df[median_columns].median().to_dict() if median_columns else {}
+        mode_columns = self._columns(rules, 'mode')
+        self.modes_ = df[mode_columns].mode().iloc[0].to_dict() if mode_columns else {}
+        self.group_medians_ = {}
+        for key, cols in groups.items():
+            table = df.groupby(key, observed=True)[cols].median()
+            self.group_medians_.update({col: table[col].dropna() for col in cols})
+
+        self.fill_values_ = self._fill_values(rules)
+        return self
+
+    def _fill_values(self, rules):
+        fills = {}
+        for col, (strategy, value) in rules.items():
+            if strategy == 'constant':
+                fills[col] = value
+            elif strategy == 'median':
+                fills[col] = self.medians_[col]
+            elif strategy == 'mode':
+                fills[col] = self.modes_[col]
+        return fills
+
+    def __setstate__(self, state):
+        legacy = 'spec' not in state and 'none_columns' in state
+        if legacy:
+            # Format lama: empat parameter daftar kolom, tanpa spec/rules_/fill_values_.
+            state = dict(state)
+            state['spec'] = {
+                **{col: ('constant', 'None') for col in state.pop('none_columns')},
+                **{col: ('constant', 0) for col in state.pop('zero_columns')},
+                **{col: 'mode' for col in state.pop('mode_columns')},
+                **{col: ('group_median', key) for col, key in state.pop('group_median').items()},
+            }
+        super().__setstate__(state)
+        if legacy and hasattr(self, 'modes_'):
+            self.rules_ = self._rules()
+            self.fill_values_ = self._fill_values(self.rules_)
+
+    def _group_fill(self, keys, col):
+        """Median grup untuk nilai kunci ``keys`` (median global untuk grup tak dikenal)."""
+        table = self.group_medians_[col]
+        codes = _codes(keys, pd.Index(table.index, dtype=object))
+        values = np.append(table.to_numpy(dtype='float64'), self.medians_[col])
+        return values[codes]  # kode -1 (grup tak dikenal/NaN) -> elemen terakhir
+
+    def transform(self, df):
+        df = df.drop(columns=[c for c in self.drop if c in df.columns])
+        # Per kolom, bukan df.fillna(dict) yang menyalin seluruh frame.
+        for col, value in self.fill_values_.items():
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+                series = series.cat.add_categories([value])
+            elif not series.hasnans:
+                continue
+            df[col] = series.fillna(value)
+        for col, (strategy, key) in self.rules_.items():
+            if strategy == 'group_median' and col in df.columns:
+                values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+                missing = np.isnan(values)
+                if missing.any():
+                    values[missing] = self._group_fill(df[key][missing], col)
+                # float32 (hasil downcast) dipertahankan; integer/nullable menjadi float64.
+                dtype = df[col].dtype
+                df[col] = values.astype(dtype) if isinstance(dtype, np.dtype) and dtype.kind == 'f' else values
+        return df
+
+
+class CategoricalEncoder(BaseEstimator, TransformerMixin):
+    """Encoding ordinal, one-hot, frekuensi dan label dengan kosakata tersimpan.
+
+    Urutan dan nama kolom keluaran sama dengan versi notebook
+    (``OrdinalEncoder`` lalu ``pd.get_dummies(drop_first=True)``, frekuensi
+    ``Neighborhood``, ``LabelEncoder``). Kategori yang belum pernah dilihat
+    menjadi -1 (ordinal/label), 0 pada semua dummy, atau frekuensi 0.
+
+    ``transform_sparse`` menghasilkan matriks CSR dengan urutan kolom yang
+    sama; dummy one-hot langsung dibangun dari kode kategori sehingga
+    memorinya sebanding dengan jumlah non-zero, bukan kategori x baris.
+    ``feature_index_`` memetakan nama fitur ke posisi kolomnya.
+    """
+
+    def __init__(self, drop=LOW_VARIANCE_COLUMNS, ordinal_maps=ORDINAL_MAPS, onehot_columns=ONEHOT_COLUMNS,
+                 frequency_columns=FREQUENCY_COLUMNS, label_columns=LABEL_COLUMNS, exclude=(TARGET, 'Id')):
+        self.drop = drop
+        self.ordinal_maps = ordinal_maps
+        self.onehot_columns = onehot_columns
+        self.frequency_columns = frequency_columns
+        self.label_columns = label_columns
+        self.exclude = exclude
+
+    def _ordinal(self, columns):
+        return {col: _codes(columns[col], cats).astype('float64') for col, cats in self.ordinal_vocab_.items()}
+
+    def fit(self, df, y=None):
+        self.ordinal_vocab_ = {col: pd.Index(cats, dtype=object) for col, cats in self.ordinal_maps.items()}
+        ordinal = self._ordinal(df)
+        self.onehot_vocab_ = {}
+        for col in self.onehot_columns:
+            values = pd.Series(ordinal[col]) if col in ordinal else df[col]
+            self.onehot_vocab_[col] = _vocabulary(values)
+        self.frequencies_ = {}
+        for col in self.frequency_columns:
+            freq = df[col].value_counts(normalize=True)
+            self.frequencies_[col] = pd.Series(freq.to_numpy('float64'), index=pd.Index(freq.index, dtype=object))
+        self.label_vocab_ = {col: _vocabulary(df[col]) for col in self.label_columns}
+
+        encoded = set(self.onehot_columns) | set(self.frequency_columns)
+        skip = set(self.drop) | encoded | set(self.exclude)
+        self.passthrough_ = [c for c in df.columns if c not in skip]
+        self.dummy_names_ = [f"{col}_{value}" for col in self.onehot_columns
+                             for value in self.onehot_vocab_[col][1:]]
+        self.feature_names_ = (self.passthrough_ + self.dummy_names_
+                               + [f"{col}_freq" for col in self.frequency_columns])
+        self.feature_index_ = pd.Index(self.feature_names_)
+        return self
+
+    def _dense_parts(self, columns, ordinal):
+        passthrough = {}
+        for col in self.passthrough_:
+            if col in ordinal:
+                passthrough[col] = ordinal[col]
+            elif col in self.label_vocab_:
+                passthrough[col] = _codes(columns[col], self.label_vocab_[col]).astype('int64')
+            else:
+                passthrough[col] = columns[col].to_numpy()
+        frequency = {}
+        for col in self.frequency_columns:
+            freq = self.frequencies_[col]
+            idx = _codes(columns[col], freq.index)
+            frequency[f"{col}_freq"] = np.where(idx >= 0, freq.to_numpy()[idx], 0.0)
+        return passthrough, frequency
+
+    def _onehot_codes(self, columns, ordinal):
+        return {col: _codes(ordinal[col] if col in ordinal else columns[col], self.onehot_vocab_[col])
+                for col in self.onehot_columns}
+
+    def _encode(self, df):
+        columns = dict(df.items())
+        ordinal = self._ordinal(columns)
+        out, frequency = self._dense_parts(columns, ordinal)
+        for col, codes in self._onehot_codes(columns, ordinal).items():
+            for k, value in enumerate(self.onehot_vocab_[col][1:], start=1):
+                out[f"{col}_{value}"] = codes == k
+        out.update(frequency)
+        return out
+
+    def transform(self, df):
+        return pd.DataFrame(self._encode(df), index=df.index, columns=self.feature_names_)
+
+    def transform_array(self, df):
+        """Seperti ``transform`` tetapi langsung berupa array float64 (jalur scoring)."""
+        out = self._encode(df)
+        return np.column_stack([out[name] for name in self.feature_names_]).astype('float64', copy=False)
+
+    def transform_sparse(self, df):
+        """Seperti ``transform`` tetapi berupa ``scipy.sparse.csr_matrix`` float64."""
+        columns = dict(df.items())
+        ordinal = self._ordinal(columns)
+        passthrough, frequency = self._dense_parts(columns, ordinal)
+        n_rows = len(df)
+
+        # Kolom dummy ke-(k-1) untuk kode k >= 1; kode 0 (kategori yang di-drop) dan -1 kosong.
+        rows, cols, offset = [], [], 0
+        for col, codes in self._onehot_codes(columns, ordinal).items():
+            hit = np.flatnonzero(codes >= 1)
+            rows.append(hit)
+            cols.append(offset + codes[hit] - 1)
+            offset += len(self.onehot_vocab_[col]) - 1
+        rows, cols = np.concatenate(rows or [[]]), np.concatenate(cols or [[]])
+        onehot = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_rows, offset))
+
+        def dense_block(parts):
+            values = np.column_stack(list(parts.values())) if parts else np.empty((n_rows, 0))
+            return sparse.csr_matrix(values.astype('float64', copy=False))
+
+        return sparse.hstack([dense_block(passthrough), onehot, dense_block(frequency)], format='csr')
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.feature_names_, dtype=object)
+
+
+class NativeCategoricalEncoder(BaseEstimator, TransformerMixin):
+    """Encoding minimal untuk model dengan dukungan kategori native.
+
+    Kolom di ``ordinal_maps`` menjadi kode ordinal (urutan kualitas tetap
+    bermakna untuk split). Kolom kategorikal lain menjadi kode kategori
+    0..k-1 dari kosakata yang dipelajari saat ``fit``, tanpa one-hot,
+    frekuensi atau label encoding. Missing value dan kategori yang belum
+    pernah dilihat menjadi NaN. ``categorical_mask_`` menandai kolom kode
+    kategori, untuk ``HistGradientBoostingRegressor(categorical_features=...)``.
+    """
+
+    def __init__(self, drop=LOW_VARIANCE_COLUMNS, ordinal_maps=ORDINAL_MAPS, exclude=(TARGET, 'Id')):
+        self.drop = drop
+        self.ordinal_maps = ordinal_maps
+        self.exclude = exclude
+
+    def fit(self, df, y=None):
+        skip = set(self.drop) | set(self.exclude)
+        self.feature_names_ = [c for c in df.columns if c not in skip]
+        self.ordinal_vocab_ = {col: pd.Index(cats, dtype=object) for col, cats in self.ordinal_maps.items()
+                               if col in self.feature_names_}
+        categorical = df[self.feature_names_].select_dtypes(include=['object', 'category']).columns
+        self.category_vocab_ = {col: _vocabulary(df[col]) for col in categorical if col not in self.ordinal_vocab_}
+        self.categorical_mask_ = np.array([col in self.category_vocab_ for col in self.feature_names_])
+        self.feature_index_ = pd.Index(self.feature_names_)
+        return self
+
+    def _encode(self, df):
+        out = {}
+        for col in self.feature_names_:
+            vocab = self.ordinal_vocab_.get(col, self.category_vocab_.get(col))
+            if vocab is None:
+                out[col] = df[col].to_numpy(dtype='float64', na_value=np.nan)
+            else:
+                codes = _codes(df[col], vocab).astype('float64')
+                codes[codes < 0] = np.nan
+                out[col] = codes
+        return out
+
+    def transform(self, df):
+        return pd.DataFrame(self._encode(df), index=df.index, columns=self.feature_names_)
+
+    def transform_array(self, df):
+        out = self._encode(df)
+        return np.column_stack([out[name] for name in self.feature_names_])
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.feature_names_, dtype=object)
+
+
+class HousePreprocessor(BaseEstimator, TransformerMixin):
+    """Imputer + encoder dalam satu objek yang bisa disimpan ke disk.
+
+    Saat pelatihan kedua tahap bisa di-fit terpisah (misalnya outlier
+    dibuang di antara imputasi dan encoding); saat scoring cukup
+    ``transform`` pada listing mentah.
+    """
+
+    def __init__(self, imputer=None, encoder=None):
+        self.imputer = imputer if imputer is not None else Imputer()
+        self.encoder = encoder if encoder is not None else CategoricalEncoder()
+
+    def fit(self, df, y=None):
+        self.encoder.fit(self.imputer.fit_transform(df))
+        return self
+
+    def transform(self, df):
+        return self.encoder.transform(self.imputer.transform(df))
+
+    def transform_array(self, df):
+        return self.encoder.transform_array(self.imputer.transform(df))
+
+    def transform_sparse(self, df):
+        return self.encoder.transform_sparse(self.imputer.transform(df))
+
+    @property
+    def feature_names_(self):
+        return self.encoder.feature_names_
+
+    def save(self, path):
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        obj = joblib.load(path)
+        if not isinstance(obj, cls):
+            raise TypeError(f"{path} tidak berisi {cls.__name__}")
+        return obj
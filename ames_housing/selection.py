@@ -0,0 +1,140 @@
+"""Kurva RMSE terhadap jumlah fitur (eliminasi fitur berbasis peringkat).
+
+Fitur diurutkan sekali (``feature_importances_``, ``|coef_|`` atau
+permutation importance) lalu kolom X disusun ulang sesuai peringkat dan
+disimpan transpos di shared memory. Subset "k fitur teratas" di worker
+cukup ``Xt[:k].T``: view berurutan kolom (Fortran) tanpa salinan, bukan
+``X_train[selected_features]`` per kandidat.
+
+Setiap k dievaluasi di process pool lewat
+:func:`ames_housing.modeling.map_shared`. Model linear dengan
+``warm_start`` (misalnya ``Lasso``) mengevaluasi k yang berurutan dalam
+satu task dan memulai dari koefisien k sebelumnya (fitur baru mulai dari
+nol). Ensemble pohon tidak bisa memakai ulang pohon antar subset fitur
+(``warm_start`` hanya menambah pohon pada fitur yang sama), jadi setiap k
+di-fit baru.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import BaseEnsemble
+from threadpoolctl import threadpool_limits
+
+from .attribution import permutation_importance
+from .modeling import map_shared
+
+
+def default_sizes(n_features, n_points=20):
+    """Jumlah fitur yang dievaluasi: kira-kira geometris dari 1 sampai ``n_features``."""
+    sizes = np.unique(np.round(np.geomspace(1, n_features, n_points)).astype(int))
+    return sizes.tolist()
+
+
+def rank_features(model, X_test=None, y_test=None, method='auto', n_jobs=-1):
+    """Nama fitur dari yang paling penting, dari model yang sudah di-fit.
+
+    ``method``: ``'importance'`` (``feature_importances_``), ``'coef'``
+    (``|coef_|``), ``'permutation'`` (butuh ``X_test``/``y_test``) atau
+    ``'auto'`` (importance, lalu coef).
+    """
+    if method == 'auto':
+        method = 'importance' if hasattr(model, 'feature_importances_') else 'coef'
+    if method == 'permutation':
+        scores = permutation_importance(model, X_test, y_test, n_jobs=n_jobs)['importance_mean']
+        return scores.index.tolist()
+    if method == 'importance':
+        values = model.feature_importances_
+    elif method == 'coef':
+        values = np.abs(np.ravel(model.coef_))
+    else:
+        raise ValueError(f"method tidak dikenal: {method!r}")
+    names = getattr(model, 'feature_names_in_', None)
+    names = list(names) if names is not None else list(range(len(values)))
+    scores = pd.Series(values, index=names)
+    return scores.sort_values(ascending=False, kind='stable').index.tolist()
+
+
+def _uses_warm_start(estimator):
+    return 'warm_start' in estimator.get_params(deep=False) and not isinstance(estimator, BaseEnsemble)
+
+
+def _curve_task(Xt_train, y_train, Xt_test, y_test, estimator, sizes, n_threads):
+    """Worker: fit/evaluasi estimator pada k fitur teratas untuk setiap k di ``sizes``."""
+    warm = _uses_warm_start(estimator)
+    rows, coef = [], None
+    with threadpool_limits(limits=n_threads):
+        for k in sizes:
+            model = clone(estimator)
+            if warm and coef is not None:
+                model.set_params(warm_start=True)
+                model.coef_ = np.concatenate([coef, np.zeros(k - len(coef))])
+            start = time.perf_counter()
+            model.fit(Xt_train[:k].T, y_train)
+            fit_time = time.perf_counter() - start
+            y_pred = np.asarray(model.predict(Xt_test[:k].T), dtype='float64')
+            if warm:
+                coef = np.ravel(model.coef_)
+            sse = float(((y_test - y_pred) ** 2).sum())
+            sst = float(((y_test - y_test.mean()) ** 2).sum())
+            rows.append({'n_features': k, 'RMSE': np.sqrt(sse / len(y_test)), 'R2': 1 - sse / sst,
+                         'fit_time': fit_time})
+    return rows
+
+
+class FeatureCurve:
+    """RMSE/R² data uji untuk k fitur teratas, untuk setiap k di ``sizes``.
+
+    ``ranking`` (daftar nama kolom, terpenting dulu) bisa diberikan; jika
+    tidak, ``estimator`` di-fit sekali pada semua fitur lalu diperingkat
+    dengan ``rank_features(method=rank_method)``. ``n_jobs`` adalah jumlah
+    core total, dibagi rata ke task yang berjalan bersamaan.
+
+    Setelah ``fit``: ``ranking_``, ``curve_`` (DataFrame per k),
+    ``best_n_features_`` dan ``selected_features_``.
+    """
+
+    def __init__(self, estimator, sizes=None, ranking=None, rank_method='auto', n_jobs=-1):
+        self.estimator = estimator
+        self.sizes = sizes
+        self.ranking = ranking
+        self.rank_method = rank_method
+        self.n_jobs = n_jobs
+
+    def _cores(self):
+        return (os.cpu_count() or 1) if self.n_jobs in (None, -1) else self.n_jobs
+
+    def fit(self, X_train, y_train, X_test, y_test):
+        ranking = self.ranking
+        if ranking is None:
+            model = clone(self.estimator).fit(X_train, y_train)
+            ranking = rank_features(model, X_test, y_test, self.rank_method, self.n_jobs)
+        self.ranking_ = list(ranking)
+        sizes = sorted(set(self.sizes or default_sizes(len(self.ranking_))))
+
+        # Transpos berurutan baris = kolom X berurutan: Xt[:k].T adalah view Fortran k fitur teratas.
+        Xt_train = np.ascontiguousarray(X_train[self.ranking_].to_numpy(dtype='float64').T)
+        Xt_test = np.ascontiguousarray(X_test[self.ranking_].to_numpy(dtype='float64').T)
+
+        workers = max(1, min(len(sizes), self._cores()))
+        if _uses_warm_start(self.estimator):
+            groups = np.array_split(np.asarray(sizes), workers)
+        else:
+            # Selang-seling agar k besar (fit paling mahal) tersebar ke semua worker.
+            groups = [np.asarray(sizes[i::workers]) for i in range(workers)]
+        n_threads = max(1, self._cores() // workers)
+        estimator = clone(self.estimator)
+        if 'n_jobs' in estimator.get_params(deep=False):
+            estimator.set_params(n_jobs=n_threads)
+        tasks = [(estimator, [int(k) for k in g], n_threads) for g in groups if len(g)]
+        outputs = map_shared(_curve_task, [Xt_train, y_train, Xt_test, y_test], tasks, workers)
+
+        self.curve_ = (pd.DataFrame([row for rows in outputs for row in rows])
+                       .sort_values('n_features').reset_index(drop=True))
+        best = self.curve_.loc[self.curve_['RMSE'].idxmin()]
+        self.best_n_features_ = int(best['n_features'])
+        self.selected_features_ = self.ranking_[:self.best_n_features_]
+        return self
@@ -0,0 +1,295 @@
+"""Layanan scoring HTTP dengan micro-batching.
+
+Preprocessor dan model dimuat sekali saat startup. Request yang datang
+bersamaan dikumpulkan di antrian asyncio menjadi satu batch (dibatasi
+``max_batch_size`` dan ``max_wait_ms``), lalu ``predict`` dipanggil sekali
+per batch di thread terpisah agar event loop tetap responsif.
+
+Endpoint:
+
+- ``POST /predict`` dengan satu listing (objek JSON) atau daftar listing.
+- ``POST /explain`` dengan body yang sama: nilai dasar, prediksi dan fitur
+  dengan kontribusi terbesar per listing (model pohon saja).
+- ``GET /health``.
+
+Listing yang nilainya tidak bisa dikonversi (misalnya ``GrLivArea``
+berupa teks) dijawab 400 tanpa menggagalkan request lain di batch yang sama.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .preprocessing import HousePreprocessor
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            500: 'Internal Server Error'}
+
+
+class InvalidListing(ValueError):
+    """Listing yang nilainya tidak bisa dikonversi ke tipe kolom data latih (HTTP 400)."""
+
+
+# Batas baris untuk jalur pohon terkompilasi; di atas ini loop C scikit-learn lebih cepat.
+COMPILED_MAX_ROWS = 128
+
+
+class ModelBundle:
+    """Preprocessor + model terlatih yang siap dipakai untuk scoring.
+
+    Jika ``compile`` dan modelnya RandomForest/GradientBoosting, pohonnya
+    diratakan sekali saat dimuat (:mod:`ames_housing.compiled`) dan batch
+    sampai ``COMPILED_MAX_ROWS`` baris diprediksi lewat jalur itu.
+
+    :mod:`ames_housing.compiled` dan :mod:`ames_housing.attribution`
+    (``sklearn.ensemble``, ``sklearn.metrics``) baru diimpor saat
+    dibutuhkan, agar cold start scoring model linear tidak ikut membayarnya.
+    """
+
+    def __init__(self, preprocessor, model, compile=True):
+        self.preprocessor = preprocessor
+        self.model = model
+        self.compiled = None
+        # Model pohon selalu sudah memuat sklearn.tree saat di-unpickle; tanpa itu tidak ada yang dikompilasi.
+        if compile and 'sklearn.tree' in sys.modules:
+            from . import compiled
+
+            if compiled.supports(model):
+                self.compiled = compiled.compile_ensemble(model)
+        self._attribution = None
+        self.columns = list(preprocessor.imputer.feature_names_in_)
+        # JSON ``null`` membuat kolom numerik ber-dtype object; samakan dengan data latih.
+        self.numeric_dtypes = {col: 'float64' for col in preprocessor.imputer.numeric_columns_}
+
+    @classmethod
+    def load(cls, preprocessor_path, model_path, compile=True):
+        return cls(HousePreprocessor.load(preprocessor_path), joblib.load(model_path), compile)
+
+    def predict_records(self, records):
+        return self.predict_frame(pd.DataFrame.from_records(records))
+
+    def _features(self, frame):
+        try:
+            frame = frame.reindex(columns=self.columns).astype(self.numeric_dtypes)
+        except (ValueError, TypeError) as exc:
+            raise InvalidListing(f"nilai listing tidak valid: {exc}") from exc
+        return self.preprocessor.transform_array(frame)
+
+    def explain_records(self, records, top=10):
+        """Kontribusi fitur per listing (lihat ``AttributionService.explain``)."""
+        from . import compiled
+        from .attribution import AttributionService
+
+        if not compiled.supports(self.model):
+            raise TypeError(f"atribusi per listing tidak tersedia untuk {type(self.model).__name__}")
+        if self._attribution is None:
+            self._attribution = AttributionService(self.model, self.preprocessor.feature_names_,
+                                                   compiled=self.compiled)
+        return self._attribution.explain(self._features(pd.DataFrame.from_records(records)), top)
+
+    def predict_frame(self, frame):
+        """Prediksi DataFrame listing mentah (kolom ekstra diabaikan, kolom hilang = missing)."""
+        X = self._features(frame)
+        if self.compiled is not None and len(X) <= COMPILED_MAX_ROWS:
+            return self.compiled.predict(X)
+        with warnings.catch_warnings():
+            # Model dilatih dengan DataFrame; urutan kolom array sudah sama.
+            warnings.filterwarnings('ignore', message='X does not have valid feature names')
+            return np.asarray(self.model.predict(X), dtype='float64')
+
+
+class MicroBatcher:
+    """Menggabungkan request tunggal yang bersamaan menjadi satu panggilan ``predict``.
+
+    Jika prediksi satu batch gagal, listing di batch itu diprediksi ulang
+    satu per satu sehingga hanya request yang bermasalah yang menerima
+    exception; request lain yang kebetulan satu batch tetap berhasil.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=256, max_wait_ms=2.0):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = None
+        self._task = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, record):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def predict_batch(self, records):
+        """Prediksi daftar listing yang sudah berupa batch, tanpa lewat antrian."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.predict_fn, records)
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            records = [record for record, _ in batch]
+            try:
+                predictions = await self.predict_batch(records)
+            except Exception as exc:
+                if len(batch) == 1:
+                    self._settle(batch[0][1], exc=exc)
+                else:
+                    await self._run_one_by_one(batch)
+                continue
+            for (_, future), value in zip(batch, predictions):
+                self._settle(future, float(value))
+
+    async def _run_one_by_one(self, batch):
+        for record, future in batch:
+            try:
+                value = float((await self.predict_batch([record]))[0])
+            except Exception as exc:
+                self._settle(future, exc=exc)
+            else:
+                self._settle(future, value)
+
+    @staticmethod
+    def _settle(future, value=None, exc=None):
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(value)
+
+
+class ScoringServer:
+    """Server HTTP/1.1 minimal (keep-alive, JSON) di atas ``asyncio.start_server``."""
+
+    def __init__(self, bundle, max_batch_size=256, max_wait_ms=2.0):
+        self.bundle = bundle
+        self.batcher = MicroBatcher(bundle.predict_records, max_batch_size, max_wait_ms)
+
+    async def _route(self, method, path, body):
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path not in ('/predict', '/explain'):
+            return 404, {'error': f'path tidak dikenal: {path}'}
+        if method != 'POST':
+            return 405, {'error': 'gunakan POST'}
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError as exc:
+            return 400, {'error': f'JSON tidak valid: {exc}'}
+        if path == '/explain':
+            records = [payload] if isinstance(payload, dict) else payload
+            if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+                return 400, {'error': 'body harus objek listing atau daftar objek listing'}
+            try:
+                explanations = await asyncio.to_thread(self.bundle.explain_records, records)
+            except (TypeError, InvalidListing) as exc:
+                return 400, {'error': str(exc)}
+            return 200, {'explanation': explanations[0]} if isinstance(payload, dict) else \
+                {'explanations': explanations}
+        try:
+            if isinstance(payload, dict):
+                return 200, {'prediction': await self.batcher.submit(payload)}
+            if isinstance(payload, list) and all(isinstance(r, dict) for r in payload):
+                # Daftar listing sudah berupa batch, langsung diprediksi.
+                values = await self.batcher.predict_batch(payload)
+                return 200, {'predictions': [float(v) for v in values]}
+        except InvalidListing as exc:
+            return 400, {'error': str(exc)}
+        return 400, {'error': 'body harus objek listing atau daftar objek listing'}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                try:
+                    status, payload = await self._route(method, path, body)
+                except Exception as exc:
+                    status, payload = 500, {'error': str(exc)}
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self, host='127.0.0.1', port=8000):
+        self.batcher.start()
+        server = await asyncio.start_server(self._handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan scoring harga rumah dengan micro-batching")
+    parser.add_argument('--preprocessor', default='artifacts/preprocessor.joblib')
+    parser.add_argument('--model', default='artifacts/model.joblib')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+    parser.add_argument('--no-compile', action='store_true', help="selalu pakai model.predict scikit-learn")
+    args = parser.parse_args(argv)
+
+    bundle = ModelBundle.load(args.preprocessor, args.model, compile=not args.no_compile)
+    server = ScoringServer(bundle, args.max_batch_size, args.max_wait_ms)
+    asyncio.run(server.serve_forever(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
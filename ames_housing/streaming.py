@@ -0,0 +1,305 @@
+"""Ringkasan EDA bertahap untuk data yang dibaca per chunk.
+
+Setiap akumulator punya ``update(chunk)`` dan ``result()`` sehingga ringkasan
+missing value, ``describe()``, korelasi, jumlah duplikat dan laporan outlier
+IQR bisa dihitung dari :func:`ames_housing.arff_io.iter_arff_chunks` tanpa
+memuat seluruh file ke memori.
+"""
+
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .arff_io import iter_arff_chunks
+from .outliers import bounds_from_quartiles, outlier_mask, outlier_report
+
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+
+
+def _numeric_block(chunk, columns):
+    return chunk[columns].to_numpy(dtype='float64', na_value=np.nan)
+
+
+class MissingCounter:
+    """Jumlah dan persentase missing value per kolom."""
+
+    def __init__(self):
+        self.n_rows = 0
+        self.counts = None
+
+    def update(self, chunk):
+        counts = chunk.isna().sum()
+        self.counts = counts if self.counts is None else self.counts + counts
+        self.n_rows += len(chunk)
+        return self
+
+    def result(self):
+        missing = self.counts[self.counts > 0].sort_values(ascending=False)
+        return pd.DataFrame({
+            'Missing Values': missing,
+            'Percentage (%)': (missing / self.n_rows) * 100,
+        })
+
+
+class DescribeAccumulator:
+    """Padanan ``df.describe()`` untuk kolom numerik.
+
+    count, mean, std, min dan max dihitung eksak dengan penggabungan momen
+    (Chan et al.). Kuartil diambil dari sampel reservoir berukuran
+    ``sample_size`` baris, jadi eksak selama jumlah baris tidak melebihinya
+    dan merupakan aproksimasi di atas itu.
+    """
+
+    def __init__(self, columns=None, sample_size=200_000, random_state=0):
+        self.columns = None if columns is None else list(columns)
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(random_state)
+        self.n_rows = 0
+        self._count = self._mean = self._m2 = self._min = self._max = None
+        self._sample = self._sample_keys = None
+
+    def _init(self, chunk):
+        if self.columns is None:
+            self.columns = chunk.select_dtypes(include='number').columns.tolist()
+        k = len(self.columns)
+        self._count = np.zeros(k)
+        self._mean = np.zeros(k)
+        self._m2 = np.zeros(k)
+        self._min = np.full(k, np.inf)
+        self._max = np.full(k, -np.inf)
+        self._sample = np.empty((0, k))
+        self._sample_keys = np.empty(0)
+
+    def update(self, chunk):
+        if self._count is None:
+            self._init(chunk)
+        values = _numeric_block(chunk, self.columns)
+        valid = ~np.isnan(values)
+        n_c = valid.sum(axis=0)
+        has = n_c > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_c = np.where(has, np.nansum(values, axis=0) / n_c, 0.0)
+        m2_c = np.nansum((values - mean_c) ** 2, axis=0)
+
+        n = self._count + n_c
+        delta = mean_c - self._mean
+        safe_n = np.where(n > 0, n, 1)
+        self._mean = self._mean + delta * n_c / safe_n
+        self._m2 = self._m2 + m2_c + delta ** 2 * self._count * n_c / safe_n
+        self._count = n
+        if len(values):
+            self._min = np.fmin(self._min, np.nanmin(np.where(valid, values, np.inf), axis=0))
+            self._max = np.fmax(self._max, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+
+        # Reservoir: simpan baris dengan kunci acak terkecil.
+        keys = np.concatenate([self._sample_keys, self._rng.random(len(values))])
+        sample = np.concatenate([self._sample, values])
+        if len(keys) > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            keys, sample = keys[keep], sample[keep]
+        self._sample_keys, self._sample = keys, sample
+        self.n_rows += len(values)
+        return self
+
+    @property
+    def is_exact(self):
+        return self.n_rows <= self.sample_size
+
+    def quantiles(self, q=DESCRIBE_PERCENTILES):
+        """Kuartil per kolom (baris = q, kolom = fitur)."""
+        with np.errstate(all='ignore'):
+            values = np.nanquantile(self._sample, q, axis=0) if len(self._sample) else \
+                np.full((len(q), len(self.columns)), np.nan)
+        return pd.DataFrame(values, index=list(q), columns=self.columns)
+
+    def result(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self._m2 / (self._count - 1))
+        has = self._count > 0
+        quant = self.quantiles().to_numpy()
+        rows = {
+            'count': self._count,
+            'mean': np.where(has, self._mean, np.nan),
+            'std': std,
+            'min': np.where(has, self._min, np.nan),
+            '25%': quant[0],
+            '50%': quant[1],
+            '75%': quant[2],
+            'max': np.where(has, self._max, np.nan),
+        }
+        return pd.DataFrame(rows, index=self.columns).T
+
+
+class CorrelationAccumulator:
+    """Matriks korelasi/kovarians Pearson yang bisa diperbarui per chunk.
+
+    Untuk setiap pasangan kolom (i, j) disimpan jumlah baris yang keduanya
+    terisi ``N``, serta Σx_i, Σx_i² dan Σx_i·x_j atas baris-baris itu,
+    sehingga hasilnya sama dengan ``df.corr()`` (pairwise complete) pada
+    seluruh data. Nilai digeser dengan rata-rata chunk pertama agar jumlah
+    kuadrat tidak kehilangan presisi. Biaya ``update`` O(baris baru x
+    kolom²); dua akumulator (misalnya dari worker berbeda) digabung dengan
+    ``merge``. State bisa disimpan dengan ``save`` lalu diteruskan dengan
+    data harian berikutnya.
+    """
+
+    def __init__(self, columns=None, target='SalePrice'):
+        self.columns = None if columns is None else list(columns)
+        self.target = target
+        self.n_rows = 0
+        self.shift = self._n = self._sum = self._sumsq = self._cross = None
+
+    def _init(self, shift):
+        k = len(self.columns)
+        self.shift = shift
+        self._n = np.zeros((k, k))
+        self._sum = np.zeros((k, k))
+        self._sumsq = np.zeros((k, k))
+        self._cross = np.zeros((k, k))
+
+    def update(self, chunk):
+        if self.columns is None:
+            self.columns = chunk.select_dtypes(include='number').columns.tolist()
+        values = _numeric_block(chunk, self.columns)
+        if self._n is None:
+            with np.errstate(invalid='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # kolom tanpa nilai
+                shift = np.nanmean(values, axis=0) if len(values) else np.zeros(len(self.columns))
+            self._init(np.nan_to_num(shift))
+        valid = ~np.isnan(values)
+        mask = valid.astype('float64')
+        x = np.where(valid, values - self.shift, 0.0)
+        # [i, j] = jumlah atas baris yang kolom i dan j sama-sama terisi.
+        self._n += mask.T @ mask
+        self._sum += x.T @ mask
+        self._sumsq += (x * x).T @ mask
+        self._cross += x.T @ x
+        self.n_rows += len(values)
+        return self
+
+    def _rebased(self, shift):
+        """Jumlah-jumlah dengan pergeseran ``shift`` (dipakai saat merge)."""
+        d = (self.shift - shift)[:, None]
+        s, n = self._sum, self._n
+        return (s + d * n,
+                self._sumsq + 2 * d * s + d ** 2 * n,
+                self._cross + d * s.T + d.T * s + d * d.T * n)
+
+    def merge(self, other):
+        """Gabungkan akumulator lain dengan kolom yang sama (in place)."""
+        if other._n is None:
+            return self
+        if self._n is None:
+            self.columns = list(other.columns)
+            self._init(other.shift.copy())
+        elif list(other.columns) != list(self.columns):
+            raise ValueError("kolom kedua akumulator berbeda")
+        s, q, c = other._rebased(self.shift)
+        self._n += other._n
+        self._sum += s
+        self._sumsq += q
+        self._cross += c
+        self.n_rows += other.n_rows
+        return self
+
+    def covariance(self):
+        """Kovarians sampel (ddof=1), sama seperti ``df.cov()``."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = (self._cross - self._sum * self._sum.T / self._n) / (self._n - 1)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def result(self):
+        """Matriks korelasi Pearson, sama seperti ``df.corr()``."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self._cross - self._sum * self._sum.T / self._n
+            var = self._sumsq - self._sum ** 2 / self._n
+            corr = cov / np.sqrt(var * var.T)
+        corr = np.clip(corr, -1, 1)
+        corr[self._n < 2] = np.nan
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def corr_with(self, target=None):
+        """Korelasi setiap kolom terhadap ``target`` (default ``SalePrice``)."""
+        return self.result()[target or self.target]
+
+    def save(self, path):
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        return joblib.load(path)
+
+
+class DuplicateCounter:
+    """Menghitung baris duplikat eksak lewat hash 64-bit per baris.
+
+    Yang disimpan hanya hash unik (8 byte per baris unik), bukan barisnya.
+    """
+
+    def __init__(self):
+        self.n_duplicates = 0
+        self._seen = np.empty(0, dtype='uint64')
+
+    def update(self, chunk):
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        unique = np.unique(hashes)
+        self.n_duplicates += len(hashes) - len(unique)
+        pos = np.searchsorted(self._seen, unique)
+        pos[pos == len(self._seen)] = 0
+        seen_before = (self._seen[pos] == unique) if len(self._seen) else np.zeros(len(unique), bool)
+        self.n_duplicates += int(seen_before.sum())
+        self._seen = np.union1d(self._seen, unique[~seen_before])
+        return self
+
+    def result(self):
+        return self.n_duplicates
+
+
+class OutlierCounter:
+    """Menghitung outlier per kolom terhadap batas IQR yang sudah diketahui."""
+
+    def __init__(self, q1, q3, whisker=1.5):
+        self.bounds = bounds_from_quartiles(pd.Series(q1, dtype='float64'),
+                                            pd.Series(q3, dtype='float64'), whisker)
+        self.n_rows = 0
+        self.counts = np.zeros(len(self.bounds), dtype='int64')
+
+    def update(self, chunk):
+        self.counts += outlier_mask(chunk, self.bounds).sum(axis=0)
+        self.n_rows += len(chunk)
+        return self
+
+    def result(self):
+        return outlier_report(self.bounds.index, self.counts, self.n_rows)
+
+
+def summarize_arff(path, chunksize=100_000, outliers=True):
+    """Ringkasan EDA sebuah file ARFF dengan memori sebatas satu chunk.
+
+    Lintasan pertama menghitung missing value, ``describe()``, korelasi dan duplikat;
+    jika ``outliers`` aktif, lintasan kedua menghitung laporan outlier IQR
+    memakai kuartil dari lintasan pertama.
+    """
+    missing, describe, duplicates = MissingCounter(), DescribeAccumulator(), DuplicateCounter()
+    correlation = CorrelationAccumulator()
+    for chunk in iter_arff_chunks(path, chunksize):
+        missing.update(chunk)
+        describe.update(chunk)
+        correlation.update(chunk)
+        duplicates.update(chunk)
+    summary = {
+        'missing': missing.result(),
+        'describe': describe.result(),
+        'correlation': correlation.result(),
+        'duplicates': duplicates.result(),
+    }
+    if outliers:
+        quartiles = describe.quantiles((0.25, 0.75))
+        counter = OutlierCounter(quartiles.loc[0.25], quartiles.loc[0.75])
+        for chunk in iter_arff_chunks(path, chunksize):
+            counter.update(chunk)
+        summary['outliers'] = counter.result()
+    return summary
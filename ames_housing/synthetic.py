@@ -0,0 +1,264 @@
+"""Generator data sintetis berskema Ames untuk uji skala.
+
+Skema (nama kolom, tipe, kategori) diambil dari header ARFF. Distribusi
+dipelajari dari data asli, bersyarat pada ``Neighborhood``:
+
+- Kolom nominal: peluang tiap kategori (termasuk missing) per grup,
+  di-shrink ke distribusi global agar grup kecil tidak terlalu kaku.
+- Kolom numerik: fungsi kuantil empiris per grup (sehingga misalnya median
+  ``LotFrontage`` per ``Neighborhood`` ikut terjaga) plus tingkat missing
+  per grup. Ketergantungan antar kolom numerik (misalnya ``GrLivArea`` dan
+  ``SalePrice``) dipertahankan lewat Gaussian copula dari rank dalam grup.
+- Kolom seperti ``Id`` (integer unik dan menaik) dibuat berurutan.
+
+Sampling sepenuhnya vektor per chunk; keluaran bisa berupa DataFrame,
+file ARFF (ditulis dengan CSV writer pyarrow) atau Feather/Arrow IPC.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import special
+
+from .arff_io import arff_header, load_dataset, quote_arff, read_arff_header, schema_from_frame
+
+
+def _normal_scores(values, groups):
+    """Skor normal dari rank dalam grup; NaN menjadi 0 (median)."""
+    ranks = pd.Series(values).groupby(groups).rank(pct=False)
+    counts = pd.Series(values).groupby(groups).transform('count')
+    u = ((ranks - 0.5) / counts).to_numpy(dtype='float64')
+    return np.nan_to_num(special.ndtri(u), nan=0.0)
+
+
+_Z_MAX = 4.0  # batas grid skor normal untuk fungsi kuantil
+_LUT_BINS = 1024
+
+
+def _nearest_correlation(corr):
+    eigval, eigvec = np.linalg.eigh(corr)
+    fixed = eigvec @ np.diag(np.clip(eigval, 1e-6, None)) @ eigvec.T
+    scale = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(scale, scale)
+
+
+class AmesSynthesizer:
+    """Mempelajari distribusi dataset Ames dan membangkitkan baris baru.
+
+    ``shrinkage`` adalah bobot (dalam jumlah baris semu) distribusi global
+    yang dicampurkan ke distribusi tiap grup; ``n_quantiles`` menentukan
+    resolusi fungsi kuantil numerik.
+
+    Fungsi kuantil disimpan pada grid skor normal (bukan grid peluang)
+    sehingga sampel normal dari copula langsung menjadi indeks grid tanpa
+    melewati CDF normal. Kategori nominal diambil dengan tabel lookup
+    ``_LUT_BINS`` bin yang lalu dikoreksi ke invers CDF eksak.
+    """
+
+    def __init__(self, group='Neighborhood', n_quantiles=201, shrinkage=1.0, copula=True):
+        self.group = group
+        self.n_quantiles = n_quantiles
+        self.shrinkage = shrinkage
+        self.copula = copula
+
+    @classmethod
+    def from_arff(cls, path, **kwargs):
+        """Fit langsung dari file ARFF (skema dari header, data lewat ``load_dataset``)."""
+        return cls(**kwargs).fit(load_dataset(path), read_arff_header(path))
+
+    def _shrunk(self, counts):
+        total = counts.sum(axis=0)
+        global_p = total / max(total.sum(), 1)
+        n = counts.sum(axis=1, keepdims=True)
+        return (counts + self.shrinkage * global_p) / (n + self.shrinkage)
+
+    def fit(self, df, schema=None):
+        self.schema_ = schema if schema is not None else schema_from_frame(df)
+        self.dtypes_ = df.dtypes.to_dict()
+        group = df[self.group]
+        self.group_categories_ = list(group.cat.categories)
+        g = group.cat.codes.to_numpy()
+        n_groups = len(self.group_categories_)
+        self.group_p_ = np.bincount(g[g >= 0], minlength=n_groups) / max((g >= 0).sum(), 1)
+        g = np.where(g >= 0, g, np.argmax(self.group_p_))
+
+        self.nominal_, self.numeric_, self.sequence_ = {}, {}, {}
+        levels = special.ndtr(np.linspace(-_Z_MAX, _Z_MAX, self.n_quantiles))
+        levels[0], levels[-1] = 0.0, 1.0
+        bins = np.arange(_LUT_BINS) / _LUT_BINS
+        scores = []
+        for attr in self.schema_.attributes:
+            col = attr.name
+            if col == self.group:
+                continue
+            series = df[col]
+            if attr.kind == 'nominal':
+                codes = series.cat.codes.to_numpy()
+                k = len(attr.categories)
+                # Kategori terakhir (indeks k) = missing value.
+                counts = np.zeros((n_groups, k + 1))
+                np.add.at(counts, (g, np.where(codes >= 0, codes, k)), 1)
+                cdf = np.cumsum(self._shrunk(counts), axis=1)
+                cdf[:, -1] = 1.0
+                # Kode untuk tepi kiri setiap bin; sampling lalu maju selama u >= cdf[kode].
+                lut = np.stack([np.searchsorted(row, bins, side='right') for row in cdf])
+                self.nominal_[col] = (cdf, lut.astype('int16').ravel())
+                continue
+
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            if (attr.kind == 'integer' and series.notna().all() and series.is_unique
+                    and series.is_monotonic_increasing):
+                self.sequence_[col] = (values[0], values[1] - values[0] if len(values) > 1 else 1)
+                continue
+            missing = np.isnan(values)
+            present = values[~missing]
+            # REAL yang seluruh nilainya bulat (LotFrontage, MasVnrArea, ...) tetap dibulatkan.
+            integral = attr.kind == 'integer' or bool((present == np.round(present)).all())
+            quantiles = np.empty((n_groups, self.n_quantiles))
+            global_q = np.quantile(present, levels) if len(present) else np.zeros(self.n_quantiles)
+            for idx in range(n_groups):
+                observed = values[(g == idx) & ~missing]
+                quantiles[idx] = np.quantile(observed, levels) if len(observed) else global_q
+            miss_counts = np.zeros((n_groups, 2))
+            np.add.at(miss_counts, (g, missing.astype(int)), 1)
+            quantiles = np.hstack([quantiles, quantiles[:, -1:]])  # titik akhir: selisih 0
+            self.numeric_[col] = {
+                'quantiles': quantiles[:, :-1].ravel(),
+                'steps': np.diff(quantiles, axis=1).ravel(),
+                'missing': self._shrunk(miss_counts)[:, 1],
+                'integer': integral,
+            }
+            scores.append(_normal_scores(values, g))
+
+        # CDF semua kolom nominal dipad ke lebar yang sama agar offset grup cukup dihitung sekali.
+        self.cdf_width_ = max((cdf.shape[1] for cdf, _ in self.nominal_.values()), default=1)
+        for col, (cdf, lut) in self.nominal_.items():
+            padded = np.ones((n_groups, self.cdf_width_))
+            padded[:, :cdf.shape[1]] = cdf
+            self.nominal_[col] = (padded.ravel(), lut)
+
+        if self.copula and len(scores) > 1:
+            corr = np.corrcoef(np.column_stack(scores), rowvar=False)
+            self.cholesky_ = np.linalg.cholesky(_nearest_correlation(np.nan_to_num(corr)))
+        else:
+            self.cholesky_ = None
+        return self
+
+    def _grid_positions(self, rng, n_rows):
+        """Posisi pecahan pada grid kuantil untuk setiap kolom numerik (baris x kolom)."""
+        z = rng.standard_normal((n_rows, len(self.numeric_)), dtype='float32')
+        if self.cholesky_ is not None:
+            z = z @ self.cholesky_.T.astype('float32')
+        pos = (z + _Z_MAX) * ((self.n_quantiles - 1) / (2 * _Z_MAX))
+        return np.clip(pos, 0, self.n_quantiles - 1, out=pos)
+
+    @staticmethod
+    def _nominal_codes(rng, lut_base, cdf_base, cdf, lut):
+        u = rng.random(len(lut_base))
+        codes = lut[lut_base + (u * _LUT_BINS).astype(np.intp)].astype(np.intp)
+        while True:
+            step = u >= cdf[cdf_base + codes]
+            if not step.any():
+                return codes
+            codes += step
+
+    def sample(self, n_rows, seed=None, start=0):
+        """DataFrame ``n_rows`` baris dengan dtype sama seperti data yang di-fit.
+
+        ``start`` menggeser kolom berurutan (``Id``) untuk chunk berikutnya.
+        """
+        rng = np.random.default_rng(seed)
+        g = rng.choice(len(self.group_p_), n_rows, p=self.group_p_)
+        positions = self._grid_positions(rng, n_rows)
+        columns = {}
+        numeric_pos = {col: j for j, col in enumerate(self.numeric_)}
+        lut_base, cdf_base = g * _LUT_BINS, g * self.cdf_width_
+        q_base = g * self.n_quantiles
+        for attr in self.schema_.attributes:
+            col = attr.name
+            if col == self.group:
+                columns[col] = pd.Categorical.from_codes(g, categories=self.group_categories_)
+            elif col in self.nominal_:
+                k = len(attr.categories)
+                codes = self._nominal_codes(rng, lut_base, cdf_base, *self.nominal_[col])
+                codes[codes == k] = -1
+                columns[col] = pd.Categorical.from_codes(codes, categories=list(attr.categories))
+            elif col in self.sequence_:
+                first, step = self.sequence_[col]
+                columns[col] = (first + step * np.arange(start, start + n_rows)).astype(self.dtypes_[col])
+            else:
+                spec = self.numeric_[col]
+                pos = positions[:, numeric_pos[col]]
+                lo = pos.astype(np.intp)
+                idx = q_base + lo
+                values = spec['quantiles'][idx] + spec['steps'][idx] * (pos - lo)
+                if spec['integer']:
+                    np.round(values, out=values)
+                if spec['missing'].any():
+                    values[rng.random(n_rows) < spec['missing'][g]] = np.nan
+                if pd.api.types.is_integer_dtype(self.dtypes_[col]) and not np.isnan(values).any():
+                    values = values.astype(self.dtypes_[col])
+                columns[col] = values
+        return pd.DataFrame(columns)
+
+    def iter_chunks(self, n_rows, chunksize=1_000_000, seed=0):
+        """Generator DataFrame berukuran ``chunksize`` sampai total ``n_rows`` baris.
+
+        Setiap chunk memakai seed turunan sendiri, jadi hasilnya
+        deterministik untuk ``seed`` dan ``chunksize`` yang sama.
+        """
+        seeds = np.random.SeedSequence(seed).spawn(-(-n_rows // chunksize))
+        for i, child in enumerate(seeds):
+            start = i * chunksize
+            yield self.sample(min(chunksize, n_rows - start), seed=child, start=start)
+
+    def _arff_table(self, chunk):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        arrays = []
+        for attr in self.schema_.attributes:
+            series = chunk[attr.name]
+            if attr.kind == 'nominal':
+                labels = pa.array([quote_arff(c) for c in attr.categories] + ['?'])
+                codes = series.cat.codes.to_numpy().astype('int32')
+                arrays.append(pc.take(labels, np.where(codes >= 0, codes, len(attr.categories))))
+            else:
+                values = pa.array(series.to_numpy(), from_pandas=True)
+                if pa.types.is_floating(values.type) and attr.kind == 'integer':
+                    values = pc.cast(values, pa.int64())
+                arrays.append(pc.fill_null(pc.cast(values, pa.string()), '?'))
+        return pa.table(arrays, names=self.schema_.names)
+
+    def write_arff(self, path, n_rows, chunksize=1_000_000, seed=0):
+        """Tulis ``n_rows`` baris ke file ARFF secara streaming (memori sebatas satu chunk)."""
+        from pyarrow import csv
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(arff_header(self.schema_))
+        options = csv.WriteOptions(include_header=False, quoting_style='none')
+        with open(path, 'ab') as f:
+            writer = None
+            for chunk in self.iter_chunks(n_rows, chunksize, seed):
+                table = self._arff_table(chunk)
+                if writer is None:
+                    writer = csv.CSVWriter(f, table.schema, write_options=options)
+                writer.write_table(table)
+            if writer is not None:
+                writer.close()
+        return path
+
+    def write_feather(self, path, n_rows, chunksize=1_000_000, seed=0):
+        """Tulis ``n_rows`` baris ke file Feather v2 (Arrow IPC) secara streaming."""
+        import pyarrow as pa
+
+        writer = None
+        try:
+            for chunk in self.iter_chunks(n_rows, chunksize, seed):
+                batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pa.ipc.new_file(str(path), batch.schema)
+                writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        return path
@@ -0,0 +1,136 @@
+"""Validasi silang k-fold untuk banyak model sekaligus.
+
+Indeks fold dibangun sekali (``KFold`` dengan seed tetap) dan dipakai
+bersama oleh semua model, sehingga perbandingan antar model memakai
+potongan data yang persis sama. Semua pasangan fold x model dikirim
+sebagai satu daftar task ke process pool lewat
+:func:`ames_housing.modeling.map_shared`: X, y dan nomor fold setiap baris
+ada di shared memory, task hanya membawa estimator dan nomor fold.
+
+Preprocessing yang tidak bergantung pada target (imputasi, kosakata
+kategori, tabel frekuensi) di-fit sekali sebelum CV, bukan per fold;
+langkah yang memakai target sebaiknya dibungkus ``sklearn.pipeline.Pipeline``
+di dalam estimator agar ikut di-fit per fold.
+"""
+
+import hashlib
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import KFold
+from threadpoolctl import threadpool_limits
+
+from .modeling import data_fingerprint, estimator_key, map_shared
+
+
+def fold_ids(n_rows, n_splits=5, shuffle=True, random_state=42):
+    """Nomor fold uji setiap baris (array int, panjang ``n_rows``)."""
+    ids = np.empty(n_rows, dtype='int64')
+    kfold = KFold(n_splits, shuffle=shuffle, random_state=random_state if shuffle else None)
+    for k, (_, test) in enumerate(kfold.split(np.empty((n_rows, 1)))):
+        ids[test] = k
+    return ids
+
+
+def _fold_task(X, y, folds, estimator, fold, n_threads):
+    """Worker: fit pada baris di luar ``fold``, prediksi baris ``fold``."""
+    test = folds == fold
+    with threadpool_limits(limits=n_threads):
+        start = time.perf_counter()
+        estimator.fit(X[~test], y[~test])
+        fit_time = time.perf_counter() - start
+        y_pred = np.asarray(estimator.predict(X[test]), dtype='float64')
+    return y_pred, fit_time
+
+
+class CrossValidator:
+    """RMSE dan R² k-fold untuk beberapa model dengan fold yang sama.
+
+    ``n_jobs`` adalah jumlah core total; core dibagi rata ke task yang
+    berjalan bersamaan seperti :class:`~ames_housing.modeling.ModelRunner`.
+    Dengan ``cache`` (:class:`~ames_housing.cache.ArtifactCache`) prediksi
+    per fold disimpan berdasarkan konfigurasi model, data dan fold, jadi
+    hanya model/fold yang berubah yang dilatih ulang.
+
+    Setelah ``evaluate``: ``folds_`` (nomor fold per baris),
+    ``fold_scores_`` (RMSE, R² dan waktu fit per model x fold) dan
+    ``oof_predictions_`` (prediksi out-of-fold per model).
+    """
+
+    def __init__(self, n_splits=5, shuffle=True, random_state=42, n_jobs=-1, cache=None):
+        self.n_splits = n_splits
+        self.shuffle = shuffle
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.cache = cache
+
+    def _cores(self):
+        return (os.cpu_count() or 1) if self.n_jobs in (None, -1) else self.n_jobs
+
+    def _cache_key(self, estimator, data_hash, fold):
+        folds_hash = hashlib.blake2b(self.folds_.tobytes(), digest_size=8).hexdigest()
+        return f"cv-{estimator_key(estimator, data_hash)}-{folds_hash}-{fold}"
+
+    def evaluate(self, models, X, y):
+        """Evaluasi ``models`` (dict nama -> estimator); mengembalikan ringkasan per model.
+
+        Kolom: ``RMSE_mean``, ``RMSE_std``, ``R2_mean``, ``R2_std`` dan
+        ``fit_time`` (rata-rata per fold), terurut RMSE rata-rata.
+        """
+        X_values = X.to_numpy(dtype='float64') if isinstance(X, pd.DataFrame) else X
+        y_values = np.asarray(y, dtype='float64')
+        if getattr(self, 'folds_', None) is None or len(self.folds_) != len(y_values):
+            self.folds_ = fold_ids(len(y_values), self.n_splits, self.shuffle, self.random_state)
+        data_hash = data_fingerprint(X, y) if self.cache is not None else None
+
+        keys = [(name, fold) for name in models for fold in range(self.n_splits)]
+        results = {}
+        todo = []
+        for name, fold in keys:
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.get(self._cache_key(models[name], data_hash, fold))
+            if cached is not None:
+                results[name, fold] = cached
+            else:
+                todo.append((name, fold))
+
+        if todo:
+            workers = min(len(todo), self._cores())
+            n_threads = max(1, self._cores() // workers)
+            tasks = []
+            for name, fold in todo:
+                estimator = clone(models[name])
+                if 'n_jobs' in estimator.get_params(deep=False):
+                    estimator.set_params(n_jobs=n_threads)
+                tasks.append((estimator, fold, n_threads))
+            outputs = map_shared(_fold_task, [X_values, y_values, self.folds_], tasks,
+                                 n_jobs=1 if workers == 1 else workers)
+            for (name, fold), output in zip(todo, outputs):
+                results[name, fold] = output
+                if self.cache is not None:
+                    self.cache.put(self._cache_key(models[name], data_hash, fold), output)
+
+        rows, oof = [], {}
+        for name in models:
+            oof[name] = np.empty(len(y_values))
+            for fold in range(self.n_splits):
+                test = self.folds_ == fold
+                y_pred, fit_time = results[name, fold]
+                oof[name][test] = y_pred
+                y_true = y_values[test]
+                sse = float(((y_true - y_pred) ** 2).sum())
+                sst = float(((y_true - y_true.mean()) ** 2).sum())
+                rows.append({'model': name, 'fold': fold, 'RMSE': np.sqrt(sse / len(y_true)),
+                             'R2': 1 - sse / sst, 'fit_time': fit_time})
+        self.fold_scores_ = pd.DataFrame(rows)
+        self.oof_predictions_ = pd.DataFrame(oof, index=getattr(y, 'index', None))
+
+        summary = self.fold_scores_.groupby('model', sort=False).agg(
+            RMSE_mean=('RMSE', 'mean'), RMSE_std=('RMSE', 'std'),
+            R2_mean=('R2', 'mean'), R2_std=('R2', 'std'), fit_time=('fit_time', 'mean'))
+        summary.index.name = None
+        return summary.sort_values('RMSE_mean', kind='stable')
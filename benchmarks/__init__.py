@@ -0,0 +1 @@
+"""Benchmark waktu dan memori setiap tahap pipeline Ames Housing."""
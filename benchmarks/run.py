@@ -0,0 +1,280 @@
+"""Benchmark waktu dan peak RSS setiap tahap pipeline pada beberapa ukuran data.
+
+Contoh::
+
+    python -m benchmarks.run --sizes 1000 100000 --output benchmarks/results/baseline.json
+    python -m benchmarks.run --sizes 1000 100000 --compare benchmarks/results/baseline.json
+
+Data dibangkitkan oleh ``AmesSynthesizer``; ``--source dataset.arff``
+membuat distribusinya mengikuti dataset asli.
+
+Setiap pasangan (tahap, ukuran) dijalankan di proses anak hasil fork:
+persiapan input (data sintetis, imputasi, encoding, ...) tidak ikut
+diukur, lalu tahapnya dijalankan ``repeat`` kali. Yang dicatat adalah
+waktu minimum/median dan peak RSS proses anak (``ru_maxrss``) beserta
+kenaikannya selama tahap berjalan. Tahap model dilewati di atas
+``--max-fit-rows`` karena fit ensemble pada jutaan baris bisa berjam-jam.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+from ames_housing.arff_io import read_arff
+from ames_housing.association import CramersVEngine
+from ames_housing.dedup import find_duplicates
+from ames_housing.outliers import iqr_outliers
+from ames_housing.preprocessing import CategoricalEncoder, Imputer
+from ames_housing.tuning import LassoPathSearch
+
+from .synthetic import make_frame, synthesizer, use_source, write_arff
+
+LASSO_ALPHAS = [0.001, 0.01, 0.1, 1, 10]
+
+
+def _rss_mb():
+    # Linux melaporkan ru_maxrss dalam KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _imputed(n_rows):
+    return Imputer().fit_transform(make_frame(n_rows))
+
+
+def _split(n_rows):
+    df = _imputed(n_rows)
+    X = CategoricalEncoder().fit_transform(df)
+    return train_test_split(X, df['SalePrice'], test_size=0.2, random_state=42)
+
+
+def _numeric_columns(df):
+    return df.select_dtypes(include='number').columns
+
+
+def setup_load(n_rows, workdir):
+    path = os.path.join(workdir, f'ames_{n_rows}.arff')
+    if not os.path.exists(path):
+        write_arff(path, n_rows)
+    return path
+
+
+def run_load(path):
+    return read_arff(path)
+
+
+def setup_impute(n_rows, workdir):
+    return make_frame(n_rows)
+
+
+def run_impute(df):
+    return Imputer().fit_transform(df)
+
+
+def setup_cramers_v(n_rows, workdir):
+    df = make_frame(n_rows)
+    return df, df.select_dtypes(include=['object', 'category']).columns
+
+
+def run_cramers_v(args):
+    df, columns = args
+    return CramersVEngine().matrix(df, columns)
+
+
+def setup_corr(n_rows, workdir):
+    df = make_frame(n_rows)
+    return df[_numeric_columns(df)]
+
+
+def run_corr(df):
+    return df.corr()
+
+
+def setup_dedup(n_rows, workdir):
+    return make_frame(n_rows)
+
+
+def run_dedup(df):
+    return find_duplicates(df)
+
+
+def setup_iqr(n_rows, workdir):
+    df = _imputed(n_rows)
+    return df, _numeric_columns(df)
+
+
+def run_iqr(args):
+    df, columns = args
+    return iqr_outliers(df, columns, action='drop')
+
+
+def setup_encode(n_rows, workdir):
+    return _imputed(n_rows)
+
+
+def run_encode(df):
+    return CategoricalEncoder().fit_transform(df)
+
+
+def setup_fit(n_rows, workdir):
+    X_train, _, y_train, _ = _split(n_rows)
+    return X_train, y_train
+
+
+def run_fit_rf(args):
+    return RandomForestRegressor(n_estimators=100, random_state=42).fit(*args)
+
+
+def run_fit_lr(args):
+    return LinearRegression().fit(*args)
+
+
+def run_fit_gb(args):
+    return GradientBoostingRegressor(n_estimators=100, random_state=42).fit(*args)
+
+
+def run_lasso_search(args):
+    return LassoPathSearch(LASSO_ALPHAS, cv=5, max_iter=10000).fit(*args)
+
+
+# nama -> (setup, run, termasuk tahap model)
+STAGES = {
+    'load': (setup_load, run_load, False),
+    'impute': (setup_impute, run_impute, False),
+    'cramers_v': (setup_cramers_v, run_cramers_v, False),
+    'corr': (setup_corr, run_corr, False),
+    'dedup': (setup_dedup, run_dedup, False),
+    'iqr': (setup_iqr, run_iqr, False),
+    'encode': (setup_encode, run_encode, False),
+    'fit_rf': (setup_fit, run_fit_rf, True),
+    'fit_lr': (setup_fit, run_fit_lr, True),
+    'fit_gb': (setup_fit, run_fit_gb, True),
+    'lasso_search': (setup_fit, run_lasso_search, True),
+}
+
+
+def _measure(stage, n_rows, repeat, workdir, conn):
+    try:
+        setup, run, _ = STAGES[stage]
+        data = setup(n_rows, workdir)
+        rss_before = _rss_mb()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run(data)
+            times.append(time.perf_counter() - start)
+        rss_after = _rss_mb()
+        conn.send({'seconds': min(times), 'median_seconds': float(np.median(times)), 'times': times,
+                   'peak_rss_mb': rss_after, 'rss_increase_mb': rss_after - rss_before})
+    except Exception as exc:
+        conn.send({'error': f'{type(exc).__name__}: {exc}'})
+    finally:
+        conn.close()
+
+
+def run_stage(stage, n_rows, repeat=3, workdir=None):
+    """Ukur satu tahap di proses anak yang baru; hasilnya dict siap JSON."""
+    ctx = multiprocessing.get_context('fork')
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure, args=(stage, n_rows, repeat, workdir or tempfile.gettempdir(), child))
+    proc.start()
+    child.close()
+    try:
+        result = parent.recv()
+    except EOFError:
+        result = {'error': 'proses benchmark berhenti tanpa hasil'}
+    proc.join()
+    if proc.exitcode and 'error' not in result:
+        result['error'] = f'exit code {proc.exitcode}'
+    return {'stage': stage, 'rows': n_rows, **result}
+
+
+def _metadata():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Baris (tahap, ukuran) yang lebih lambat dari ``baseline`` lebih dari ``tolerance``."""
+    previous = {(r['stage'], r['rows']): r for r in baseline['results'] if 'seconds' in r}
+    regressions = []
+    for r in results:
+        old = previous.get((r['stage'], r['rows']))
+        if old is not None and 'seconds' in r and r['seconds'] > old['seconds'] * (1 + tolerance):
+            regressions.append({'stage': r['stage'], 'rows': r['rows'], 'baseline_seconds': old['seconds'],
+                                'seconds': r['seconds'], 'ratio': r['seconds'] / old['seconds']})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tahap-tahap pipeline Ames Housing")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000],
+                        help="jumlah baris (mis. 1000 100000 10000000)")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-fit-rows', type=int, default=200_000,
+                        help="tahap model dilewati di atas jumlah baris ini")
+    parser.add_argument('--source', default=None, help="file ARFF asli untuk fit generator data sintetis")
+    parser.add_argument('--workdir', default=None, help="direktori file ARFF sintetis")
+    parser.add_argument('--output', default='benchmarks/results/latest.json')
+    parser.add_argument('--compare', default=None, help="file JSON baseline untuk deteksi regresi")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='ames_bench_')
+    use_source(args.source)
+    synthesizer()  # fit sekali di proses induk; proses anak mewarisinya lewat fork
+    results = []
+    for n_rows in args.sizes:
+        for stage in args.stages:
+            if STAGES[stage][2] and n_rows > args.max_fit_rows:
+                results.append({'stage': stage, 'rows': n_rows, 'skipped': f'> max_fit_rows ({args.max_fit_rows})'})
+                continue
+            # Satu pengulangan saja untuk data besar.
+            repeat = args.repeat if n_rows <= 100_000 else 1
+            result = run_stage(stage, n_rows, repeat, workdir)
+            results.append(result)
+            if 'error' in result:
+                print(f"{stage:>13} {n_rows:>10,}  ERROR {result['error']}", flush=True)
+            else:
+                print(f"{stage:>13} {n_rows:>10,}  {result['seconds']:9.3f}s  "
+                      f"peak {result['peak_rss_mb']:8.1f} MB (+{result['rss_increase_mb']:.1f})", flush=True)
+
+    report = {'metadata': {**_metadata(), 'source': args.source}, 'results': results}
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Hasil disimpan ke {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for r in regressions:
+            print(f"REGRESI {r['stage']} {r['rows']:,}: {r['baseline_seconds']:.3f}s -> {r['seconds']:.3f}s "
+                  f"(x{r['ratio']:.2f})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Data sintetis berbentuk Ames Housing untuk benchmark.
+
+Data dibangkitkan oleh :class:`ames_housing.synthetic.AmesSynthesizer`.
+Jika file ARFF asli tersedia (``use_source``), generator di-fit dari file
+itu; jika tidak, dari ``seed_frame``: frame bawaan yang kolom, kategori dan
+tingkat missing value-nya mengikuti dataset asli secara kasar.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ames_housing.synthetic import AmesSynthesizer
+
+_QUALITY = ['Po', 'Fa', 'TA', 'Gd', 'Ex']
+
+NOMINAL = {
+    'MSZoning': ['RL', 'RM', 'FV', 'RH', 'C (all)'],
+    'Street': ['Pave', 'Grvl'],
+    'Alley': ['Grvl', 'Pave'],
+    'LotShape': ['Reg', 'IR1', 'IR2', 'IR3'],
+    'LandContour': ['Lvl', 'Bnk', 'HLS', 'Low'],
+    'Utilities': ['AllPub', 'NoSeWa'],
+    'LotConfig': ['Inside', 'Corner', 'CulDSac', 'FR2', 'FR3'],
+    'LandSlope': ['Gtl', 'Mod', 'Sev'],
+    'Neighborhood': ['NAmes', 'CollgCr', 'OldTown', 'Edwards', 'Somerst', 'Gilbert', 'NridgHt', 'Sawyer',
+                     'NWAmes', 'SawyerW', 'BrkSide', 'Crawfor', 'Mitchel', 'NoRidge', 'Timber', 'IDOTRR',
+                     'ClearCr', 'StoneBr', 'SWISU', 'MeadowV', 'Blmngtn', 'BrDale', 'Veenker', 'NPkVill',
+                     'Blueste'],
+    'Condition1': ['Norm', 'Feedr', 'Artery', 'RRAn', 'PosN', 'RRAe', 'PosA', 'RRNn', 'RRNe'],
+    'Condition2': ['Norm', 'Feedr', 'Artery'],
+    'BldgType': ['1Fam', 'TwnhsE', 'Duplex', 'Twnhs', '2fmCon'],
+    'HouseStyle': ['1Story', '2Story', '1.5Fin', 'SLvl', 'SFoyer', '1.5Unf', '2.5Unf', '2.5Fin'],
+    'RoofStyle': ['Gable', 'Hip', 'Flat', 'Gambrel', 'Mansard', 'Shed'],
+    'RoofMatl': ['CompShg', 'Tar&Grv', 'WdShngl', 'WdShake'],
+    'Exterior1st': ['VinylSd', 'HdBoard', 'MetalSd', 'Wd Sdng', 'Plywood', 'CemntBd', 'BrkFace', 'WdShing',
+                    'Stucco', 'AsbShng'],
+    'Exterior2nd': ['VinylSd', 'MetalSd', 'HdBoard', 'Wd Sdng', 'Plywood', 'CmentBd', 'Wd Shng', 'Stucco',
+                    'BrkFace', 'AsbShng', 'ImStucc', 'Brk Cmn'],
+    'MasVnrType': ['None', 'BrkFace', 'Stone', 'BrkCmn'],
+    'ExterQual': _QUALITY,
+    'ExterCond': _QUALITY,
+    'Foundation': ['PConc', 'CBlock', 'BrkTil', 'Slab', 'Stone', 'Wood'],
+    'BsmtQual': _QUALITY,
+    'BsmtCond': _QUALITY,
+    'BsmtExposure': ['No', 'Av', 'Gd', 'Mn'],
+    'BsmtFinType1': ['Unf', 'GLQ', 'ALQ', 'BLQ', 'Rec', 'LwQ'],
+    'BsmtFinType2': ['Unf', 'Rec', 'LwQ', 'BLQ', 'ALQ', 'GLQ'],
+    'Heating': ['GasA', 'GasW', 'Grav', 'Wall', 'OthW', 'Floor'],
+    'HeatingQC': _QUALITY,
+    'CentralAir': ['Y', 'N'],
+    'Electrical': ['SBrkr', 'FuseA', 'FuseF', 'FuseP', 'Mix'],
+    'KitchenQual': _QUALITY,
+    'Functional': ['Typ', 'Min2', 'Min1', 'Mod', 'Maj1', 'Maj2', 'Sev'],
+    'FireplaceQu': _QUALITY,
+    'GarageType': ['Attchd', 'Detchd', 'BuiltIn', 'Basment', 'CarPort', '2Types'],
+    'GarageFinish': ['Unf', 'RFn', 'Fin'],
+    'GarageQual': _QUALITY,
+    'GarageCond': _QUALITY,
+    'PavedDrive': ['Y', 'N', 'P'],
+    'PoolQC': ['Gd', 'Ex', 'Fa'],
+    'Fence': ['MnPrv', 'GdPrv', 'GdWo', 'MnWw'],
+    'MiscFeature': ['Shed', 'Gar2', 'Othr', 'TenC'],
+    'SaleType': ['WD', 'New', 'COD', 'ConLD', 'ConLI', 'ConLw', 'CWD', 'Oth', 'Con'],
+    'SaleCondition': ['Normal', 'Partial', 'Abnorml', 'Family', 'Alloca', 'AdjLand'],
+}
+
+COLUMNS = (
+    'Id MSSubClass MSZoning LotFrontage LotArea Street Alley LotShape LandContour Utilities LotConfig '
+    'LandSlope Neighborhood Condition1 Condition2 BldgType HouseStyle OverallQual OverallCond YearBuilt '
+    'YearRemodAdd RoofStyle RoofMatl Exterior1st Exterior2nd MasVnrType MasVnrArea ExterQual ExterCond '
+    'Foundation BsmtQual BsmtCond BsmtExposure BsmtFinType1 BsmtFinSF1 BsmtFinType2 BsmtFinSF2 BsmtUnfSF '
+    'TotalBsmtSF Heating HeatingQC CentralAir Electrical 1stFlrSF 2ndFlrSF LowQualFinSF GrLivArea '
+    'BsmtFullBath BsmtHalfBath FullBath HalfBath BedroomAbvGr KitchenAbvGr KitchenQual TotRmsAbvGrd '
+    'Functional Fireplaces FireplaceQu GarageType GarageYrBlt GarageFinish GarageCars GarageArea GarageQual '
+    'GarageCond PavedDrive WoodDeckSF OpenPorchSF EnclosedPorch 3SsnPorch ScreenPorch PoolArea PoolQC Fence '
+    'MiscFeature MiscVal MoSold YrSold SaleType SaleCondition SalePrice'
+).split()
+
+REAL = {'LotFrontage', 'MasVnrArea', 'GarageYrBlt'}
+
+MISSING_RATE = {
+    'LotFrontage': 0.18, 'Alley': 0.94, 'MasVnrType': 0.005, 'MasVnrArea': 0.005, 'BsmtQual': 0.025,
+    'BsmtCond': 0.025, 'BsmtExposure': 0.026, 'BsmtFinType1': 0.025, 'BsmtFinType2': 0.026,
+    'Electrical': 0.001, 'FireplaceQu': 0.47, 'GarageType': 0.055, 'GarageYrBlt': 0.055,
+    'GarageFinish': 0.055, 'GarageQual': 0.055, 'GarageCond': 0.055, 'PoolQC': 0.995, 'Fence': 0.8,
+    'MiscFeature': 0.96,
+}
+
+_AREA_COLUMNS = {'GrLivArea', '1stFlrSF', 'TotalBsmtSF', 'GarageArea', 'BsmtUnfSF', 'BsmtFinSF1',
+                 'LotFrontage', 'MasVnrArea'}
+_RARE_COLUMNS = {'PoolArea', '3SsnPorch', 'MiscVal', 'LowQualFinSF'}
+
+
+def _numeric(col, n, quality, rng):
+    if col == 'Id':
+        return np.arange(1, n + 1)
+    if col == 'OverallQual':
+        return quality
+    if col == 'SalePrice':
+        return np.clip(30000 + quality * 20000 + rng.normal(0, 15000, n), 20000, None).astype('int64')
+    if col in ('YearBuilt', 'YearRemodAdd', 'GarageYrBlt'):
+        return rng.integers(1900, 2010, n)
+    if col == 'YrSold':
+        return rng.integers(2006, 2011, n)
+    if col == 'MoSold':
+        return rng.integers(1, 13, n)
+    if col in _RARE_COLUMNS:
+        return np.where(rng.random(n) < 0.02, rng.integers(50, 500, n), 0)
+    if col == 'LotArea':
+        return np.exp(rng.normal(9, 0.4, n)).astype('int64')
+    if col in _AREA_COLUMNS:
+        return np.exp(rng.normal(6.5, 0.4, n)).astype('int64') + (quality * 50 if col == 'GrLivArea' else 0)
+    return rng.integers(0, 5, n)
+
+
+def seed_frame(n_rows=1460, seed=0):
+    """Frame bawaan ``n_rows`` baris dengan dtype seperti hasil ``load_dataset``."""
+    rng = np.random.default_rng(seed)
+    quality = rng.integers(1, 11, n_rows)
+    columns = {}
+    for col in COLUMNS:
+        if col in NOMINAL:
+            categories = NOMINAL[col]
+            p = 0.6 ** np.arange(len(categories))
+            codes = rng.choice(len(categories), n_rows, p=p / p.sum())
+            if col in MISSING_RATE:
+                codes[rng.random(n_rows) < MISSING_RATE[col]] = -1
+            columns[col] = pd.Categorical.from_codes(codes, categories=categories)
+        else:
+            values = _numeric(col, n_rows, quality, rng)
+            if col in REAL or col in MISSING_RATE:
+                values = values.astype('float64')
+                if col in MISSING_RATE:
+                    values[rng.random(n_rows) < MISSING_RATE[col]] = np.nan
+            columns[col] = values
+    return pd.DataFrame(columns)
+
+
+_source = None
+_synthesizer = None
+
+
+def use_source(path):
+    """Fit generator dari file ARFF ``path`` (None: kembali ke ``seed_frame``)."""
+    global _source, _synthesizer
+    _source, _synthesizer = path, None
+
+
+def synthesizer():
+    """``AmesSynthesizer`` yang sudah di-fit (dibuat sekali per proses)."""
+    global _synthesizer
+    if _synthesizer is None:
+        if _source is not None:
+            _synthesizer = AmesSynthesizer.from_arff(_source)
+        else:
+            _synthesizer = AmesSynthesizer().fit(seed_frame())
+    return _synthesizer
+
+
+def make_frame(n_rows, seed=0):
+    """Frame sintetis ``n_rows`` baris dengan dtype seperti hasil ``load_dataset``."""
+    return synthesizer().sample(n_rows, seed=seed)
+
+
+def write_arff(path, n_rows, seed=0):
+    """Tulis ``n_rows`` baris sintetis ke file ARFF secara streaming."""
+    return synthesizer().write_arff(path, n_rows, seed=seed)
@@ -2,33 +2,51 @@
 # # **Import Library**
 
 # %%
-import arff
+import os
+import joblib
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
-from scipy.stats import chi2_contingency
-from sklearn.preprocessing import OrdinalEncoder
-from sklearn.preprocessing import LabelEncoder
 from sklearn.linear_model import Lasso
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
+from ames_housing.arff_io import load_dataset
+from ames_housing.streaming import summarize_arff
+from ames_housing.association import CramersVEngine
+from ames_housing.outliers import iqr_outliers
+from ames_housing.memory import downcast
+from ames_housing.preprocessing import HousePreprocessor, CategoricalEncoder, ONEHOT_COLUMNS
+from ames_housing.modeling import ModelRunner
+from ames_housing.tuning import LassoPathSearch
+from ames_housing.cache import ArtifactCache
+from ames_housing.pipeline import cross_validate, fit_evaluate, select_by_importance
+# Instrumentasi per tahap (waktu, CPU, memori, jumlah baris) nonaktif secara default;
+# aktifkan dengan instrument.configure(log_path=..., metrics_path=...) atau variabel
+# lingkungan AMES_INSTRUMENT_LOG / AMES_INSTRUMENT_METRICS
+from ames_housing.instrument import stage
 
 # %% [markdown]
 # # **Memuat Dataset**
 
 # %%
-with open("dataset.arff", 'r') as f:
-    data = arff.load(f)
-
-columns = [attr[0] for attr in data['attributes']]
-
-df = pd.DataFrame(data['data'], columns=columns)
+# Parse ARFF sekali, berikutnya dibaca dari cache Feather (.cache/)
+with stage('load') as st:
+    df = load_dataset("dataset.arff")
+    st.rows_out = len(df)
 
 df.head()
 
+# %%
+# Perkecil dtype (integer selebar mungkin, string -> category, float -> float32
+# jika presisi cukup) dan tampilkan penghematan memori per kolom
+with stage('downcast', rows_in=len(df)) as st:
+    memory_report, df = downcast(df)
+    st.rows_out = len(df)
+memory_report.head(10)
+
 
 # %% [markdown]
 # # **Exploratory Data Analysis (EDA)**
@@ -68,12 +86,24 @@ print(missing_df)
 print("Jumlah data duplikat:", df.duplicated().sum())
 
 
+# %% [markdown]
+# ### Ringkasan Bertahap untuk File Besar
+# 
+# Untuk feed yang lebih besar dari RAM, ringkasan missing value, `describe()`, duplikat, dan outlier IQR dihitung per chunk sehingga memori puncak hanya sebesar satu chunk.
+
+# %%
+summary = summarize_arff("dataset.arff", chunksize=100_000)
+print(summary['missing'])
+print("Jumlah data duplikat:", summary['duplicates'])
+print(summary['outliers'])
+
+
 # %% [markdown]
 # ## Analisis Distribusi dan Korelasi
 
 # %%
 # Pilih hanya kolom numerik
-numerical_columns = df.select_dtypes(include=['int64', 'float64']).columns
+numerical_columns = df.select_dtypes(include='number').columns
 
 plt.figure(figsize=(16, 10))
 
@@ -248,8 +278,8 @@ plt.show()
 # 
 
 # %%
-# Ambil semua kolom kategorikal (tipe objek)
-categorical_columns = df.select_dtypes(include='object').columns
+# Ambil semua kolom kategorikal (atribut nominal ARFF bertipe category)
+categorical_columns = df.select_dtypes(include=['object', 'category']).columns
 
 # Ukuran grid
 n_cols = 5
@@ -320,29 +350,13 @@ plt.show()
 # 
 
 # %%
-# Fungsi untuk menghitung Cramér's V
-def cramers_v(x, y):
-    confusion_matrix = pd.crosstab(x, y)
-    chi2 = chi2_contingency(confusion_matrix)[0]
-    n = confusion_matrix.sum().sum()
-    phi2 = chi2 / n
-    r, k = confusion_matrix.shape
-    phi2corr = max(0, phi2 - ((k-1)*(r-1)) / (n-1))
-    rcorr = r - ((r-1)**2)/(n-1)
-    kcorr = k - ((k-1)**2)/(n-1)
-    return np.sqrt(phi2corr / min((kcorr-1), (rcorr-1)))
-
 # Ambil kolom kategorikal
-cat_cols = df.select_dtypes(include='object').columns
+cat_cols = df.select_dtypes(include=['object', 'category']).columns
 
-# Hitung matriks Cramér's V
-cramer_matrix = pd.DataFrame(index=cat_cols, columns=cat_cols, dtype=float)
-for col1 in cat_cols:
-    for col2 in cat_cols:
-        try:
-            cramer_matrix.loc[col1, col2] = cramers_v(df[col1], df[col2])
-        except:
-            cramer_matrix.loc[col1, col2] = np.nan
+# Hitung matriks Cramér's V (segitiga atas saja, di-cache per isi kolom)
+cramer_engine = CramersVEngine()
+with stage('eda.cramers_v', rows_in=len(df)):
+    cramer_matrix = cramer_engine.matrix(df, cat_cols)
 
 # Urutkan berdasarkan korelasi rata-rata
 ordered_cols = cramer_matrix.mean().sort_values(ascending=False).index
@@ -472,46 +486,40 @@ print(missing_df)
 # 
 
 # %%
-df.drop(['PoolQC', 'MiscFeature', 'Alley'], axis=1, inplace=True)
+# Semua langkah imputasi di bawah dipelajari sekali dan disimpan di preprocessor,
+# sehingga bisa diputar ulang pada listing baru tanpa fit ulang
+preprocessor = HousePreprocessor()
+with stage('preprocess.impute', rows_in=len(df)) as st:
+    df = preprocessor.imputer.fit_transform(df)
+    st.rows_out = len(df)
 
 
 # %% [markdown]
 # Menghapus kolom yang memiliki persentase missing values sangat tinggi (lebih dari 90%), sehingga dianggap tidak informatif atau terlalu banyak data hilang untuk dianalisis lebih lanjut.
 
 # %%
-none_cols = ['FireplaceQu', 'Fence', 'GarageType', 'GarageFinish', 'GarageQual', 
-             'GarageCond', 'BsmtQual', 'BsmtCond', 'BsmtExposure', 'BsmtFinType1', 
-             'BsmtFinType2', 'MasVnrType']
-df[none_cols] = df[none_cols].fillna('None')
+print(preprocessor.imputer.none_columns)
 
 
 # %% [markdown]
 # Agar model machine learning tidak menganggap nilai kosong (NaN) sebagai kesalahan data, tapi sebagai kondisi valid (misalnya: tidak ada garasi, tidak ada perapian, dll).
 
 # %%
-df['LotFrontage'] = df.groupby('Neighborhood')['LotFrontage'].transform(
-    lambda x: x.fillna(x.median()))
+# Median LotFrontage per Neighborhood yang dipelajari
+preprocessor.imputer.group_medians_['LotFrontage']
 
 
 # %% [markdown]
 # Agar imputasi LotFrontage lebih kontekstual dan akurat, dibanding hanya pakai median global. Median per Neighborhood lebih representatif karena ukuran lahan biasanya bergantung pada lokasi.
 
-# %%
-df['MasVnrArea'] = df['MasVnrArea'].fillna(0)
-
-
 # %% [markdown]
 # Menandakan bahwa jika tidak ada data luas veneer (batu bata hias pada dinding luar), maka diasumsikan tidak ada veneer yang dipasang (area = 0).
 
-# %%
-df['GarageYrBlt'] = df['GarageYrBlt'].fillna(0)
-
-
 # %% [markdown]
 # Menandakan bahwa tidak ada garasi yang dibangun, sehingga tidak relevan untuk mencantumkan tahun pembangunannya.
 
 # %%
-df['Electrical'] = df['Electrical'].fillna(df['Electrical'].mode()[0])
+preprocessor.imputer.modes_['Electrical']
 
 
 # %% [markdown]
@@ -525,26 +533,9 @@ df.isnull().sum()
 
 # %%
 # Buat DataFrame hasil deteksi outlier
-outlier_report = []
-
-for col in numerical_columns:
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-    num_outliers = outliers.shape[0]
-    perc_outliers = 100 * num_outliers / df.shape[0]
-    
-    if num_outliers > 0:
-        outlier_report.append({
-            'Column': col,
-            'Outliers': num_outliers,
-            'Percentage': round(perc_outliers, 2)
-        })
-
-outlier_df = pd.DataFrame(outlier_report).sort_values(by='Percentage', ascending=False)
+with stage('preprocess.outliers_iqr', rows_in=len(df)) as st:
+    outlier_df, keep_mask = iqr_outliers(df, numerical_columns, action='mask')
+    st.rows_out = int(keep_mask.sum())
 print(outlier_df)
 
 # %% [markdown]
@@ -582,43 +573,16 @@ print(outlier_df)
 # - Beberapa outlier bisa jadi mencerminkan kondisi nyata (misalnya properti sangat besar atau unik).
 
 # %%
-def remove_outliers_iqr(df, columns):
-    for col in columns:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        df = df[(df[col] >= lower_bound) & (df[col] <= upper_bound)]
-    return df
-
-df = remove_outliers_iqr(df, numerical_columns)
+# Pakai mask gabungan dari laporan di atas (semua kolom sekaligus);
+# iqr_outliers(..., action='cap') bisa dipakai untuk winsorize alih-alih membuang baris
+df = df.loc[keep_mask]
 
 # %% [markdown]
 # Membersihkan dataset dari nilai-nilai ekstrem (outliers) yang bisa mengganggu performa model machine learning dan membuat distribusi data lebih normal dan stabil.
 
 # %%
 # Buat DataFrame hasil deteksi outlier
-outlier_report = []
-
-for col in numerical_columns:
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-    num_outliers = outliers.shape[0]
-    perc_outliers = 100 * num_outliers / df.shape[0]
-    
-    if num_outliers > 0:
-        outlier_report.append({
-            'Column': col,
-            'Outliers': num_outliers,
-            'Percentage': round(perc_outliers, 2)
-        })
-
-outlier_df = pd.DataFrame(outlier_report).sort_values(by='Percentage', ascending=False)
+outlier_df, _ = iqr_outliers(df, numerical_columns, action='mask')
 print(outlier_df)
 
 # %% [markdown]
@@ -673,8 +637,8 @@ print(outlier_df)
 # ## Preprocessing Encoding
 
 # %%
-# Pilih hanya kolom bertipe object (kategorikal)
-categorical_columns = df.select_dtypes(include=['object'])
+# Pilih hanya kolom kategorikal
+categorical_columns = df.select_dtypes(include=['object', 'category'])
 
 # Hitung jumlah kategori unik di setiap kolom kategorikal
 category_counts = categorical_columns.nunique()
@@ -697,62 +661,27 @@ print(category_counts)
 # 
 
 # %%
-df.drop(columns=['Street', 'Utilities', 'Condition2', 'RoofMatl', 'BsmtFinType2'], inplace=True)
-
+# Drop kolom berkategori tunggal, encoding ordinal (ORDINAL_MAPS), one-hot,
+# frekuensi Neighborhood, dan label encoding; kosakata kategori disimpan di encoder
+with stage('preprocess.encode', rows_in=len(df)) as st:
+    X = preprocessor.encoder.fit_transform(df)
+    y = df['SalePrice']
 
-# %%
-ord_maps = {
-    'ExterQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'ExterCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'BsmtQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'BsmtCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'BsmtExposure': ['No', 'Mn', 'Av', 'Gd', 'Ex'],
-    'HeatingQC': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'KitchenQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'FireplaceQu': ['No', 'Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'GarageQual': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'GarageCond': ['Po', 'Fa', 'TA', 'Gd', 'Ex'],
-    'GarageFinish': ['Unf', 'RFn', 'Fin'],
-    'PavedDrive': ['N', 'P', 'Y'],
-}
+    # Kode ordinal/label hasil encoding cukup int8, frekuensi cukup float32
+    X_memory_report, X = downcast(X)
+    st.rows_out = len(X)
 
-# Lakukan encoding satu per satu kolom ordinal
-for col, categories in ord_maps.items():
-    encoder = OrdinalEncoder(categories=[categories], handle_unknown='use_encoded_value', unknown_value=-1)
-    df[[col]] = encoder.fit_transform(df[[col]])
+# Simpan preprocessor agar bisa dipakai ulang saat scoring
+os.makedirs("artifacts", exist_ok=True)
+preprocessor.save("artifacts/preprocessor.joblib")
 
 # %%
-onehot_cols = [
-    'LotConfig', 'HouseStyle', 'Exterior1st', 'Exterior2nd',
-    'SaleType', 'SaleCondition', 'BldgType', 'Foundation',
-    'GarageType', 'Fence', 'MasVnrType', 'CentralAir',
-    'Electrical', 'Functional', 'GarageFinish'
-]
-df = pd.get_dummies(df, columns=onehot_cols, drop_first=True)
-
-
-# %%
-df['Neighborhood_freq'] = df['Neighborhood'].map(df['Neighborhood'].value_counts(normalize=True))
-df.drop(columns=['Neighborhood'], inplace=True)
-
-
-# %%
-le = LabelEncoder()
-for col in ['MSZoning', 'LotShape', 'LandContour', 'LandSlope', 'Condition1',
-            'RoofStyle', 'BsmtFinType1', 'Heating']:
-    df[col] = le.fit_transform(df[col])
-
-# %%
-df.info()
+X.info()
 
 # %% [markdown]
 # ## Split Dataset
 
 # %%
-# Data fitur dan target
-X = df.drop(columns=['SalePrice', 'Id'])
-y = df['SalePrice']
-
 # Bagi data train-test supaya evaluasi fair
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
@@ -767,16 +696,34 @@ models = {
 }
 
 # %%
-for name, model in models.items():
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
-    rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-    r2 = r2_score(y_test, y_pred)
+# Semua model di-fit paralel (process pool, data lewat shared memory);
+# model + prediksi di-cache di .cache/models berdasarkan hash data dan
+# hyperparameter, sehingga eksekusi ulang melewati fit yang tidak berubah
+runner = ModelRunner(n_jobs=-1, cache=ArtifactCache(".cache/models"))
+with stage('models.compare', rows_in=len(X_train)):
+    results = runner.compare(models, X_train, y_train, X_test, y_test)
+models = runner.fitted_
+scores = results['RMSE'].to_dict()
+for name, row in results.iterrows():
     print(f"Model: {name}")
-    print(f"RMSE: {rmse:.2f}")
-    print(f"R²: {r2:.2f}")
+    print(f"RMSE: {row['RMSE']:.2f}")
+    print(f"R²: {row['R2']:.2f}")
     print("-" * 30)
 
+# %%
+# Simpan model dengan RMSE terendah untuk layanan scoring:
+# python -m ames_housing.serving --model artifacts/model.joblib
+best_model_name = min(scores, key=scores.get)
+joblib.dump(models[best_model_name], "artifacts/model.joblib")
+print("Model disimpan:", best_model_name)
+
+# %%
+# Satu split 80/20 cukup berisik. Validasi silang 5-fold memakai fold yang
+# sama untuk semua model; fold x model dijalankan sebagai satu batch task di
+# process pool dan prediksi per fold ikut di-cache di .cache/models
+cv_validator, cv_results = cross_validate(X, y, models, n_splits=5)
+print(cv_results.round(4))
+
 # %% [markdown]
 # ### Penjelasan Evaluasi Model Regresi
 # 
@@ -818,20 +765,16 @@ for name, model in models.items():
 
 # %%
 def evaluate_model(model, X_train, y_train, X_test, y_test):
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
-    rmse = mean_squared_error(y_test, y_pred, squared=False)
-    r2 = r2_score(y_test, y_pred)
-    return rmse, r2
+    # Fit + prediksi lewat runner (model di-clone, hasil diambil dari cache jika ada)
+    return fit_evaluate(runner, model, X_train, y_train, X_test, y_test)
 
 # %%
 # -------- RandomForestRegressor --------
-rf = RandomForestRegressor(n_estimators=100, random_state=42)
-rf.fit(X_train, y_train)
+# Konfigurasi dan data sama dengan tahap perbandingan, jadi diambil dari cache
+rf = runner.fit(RandomForestRegressor(n_estimators=100, random_state=42), X_train, y_train)
 
 # Tree-based feature importance
-importances_rf = pd.Series(rf.feature_importances_, index=X_train.columns)
-selected_features_rf = importances_rf[importances_rf > importances_rf.mean()].index.tolist()  # ambil fitur di atas rata-rata importance
+selected_features_rf = select_by_importance(rf, X_train.columns)  # ambil fitur di atas rata-rata importance
 
 # Train ulang hanya dengan fitur terpilih
 rmse_rf, r2_rf = evaluate_model(rf, X_train[selected_features_rf], y_train, X_test[selected_features_rf], y_test)
@@ -887,11 +830,9 @@ print(f"RMSE: {rmse_rf:.2f}, R²: {r2_rf:.2f}\n")
 
 # %%
 # -------- GradientBoostingRegressor --------
-gb = GradientBoostingRegressor(n_estimators=100, random_state=42)
-gb.fit(X_train, y_train)
+gb = runner.fit(GradientBoostingRegressor(n_estimators=100, random_state=42), X_train, y_train)
 
-importances_gb = pd.Series(gb.feature_importances_, index=X_train.columns)
-selected_features_gb = importances_gb[importances_gb > importances_gb.mean()].index.tolist()
+selected_features_gb = select_by_importance(gb, X_train.columns)
 
 rmse_gb, r2_gb = evaluate_model(gb, X_train[selected_features_gb], y_train, X_test[selected_features_gb], y_test)
 print("Gradient Boosting")
@@ -944,17 +885,14 @@ print(f"RMSE: {rmse_gb:.2f}, R²: {r2_gb:.2f}\n")
 
 # %%
 # -------- Linear Regression dengan Lasso Feature Selection --------
-# Cari alpha terbaik menggunakan cross-validation (bisa di-skip jika mau alpha default)
-from sklearn.model_selection import GridSearchCV
-
-lasso = Lasso(max_iter=10000, random_state=42)
-params = {'alpha': [0.001, 0.01, 0.1, 1, 10]}
-grid = GridSearchCV(lasso, params, cv=5)
-grid.fit(X_train, y_train)
-best_alpha = grid.best_params_['alpha']
+# Cari alpha terbaik menggunakan cross-validation: satu jalur regularisasi
+# warm-start per fold (fold paralel), model terbaik langsung dari jalur penuh
+search = LassoPathSearch(alphas=[0.001, 0.01, 0.1, 1, 10], cv=5, max_iter=10000, n_jobs=-1)
+with stage('models.lasso_search', rows_in=len(X_train)):
+    search.fit(X_train, y_train)
+best_alpha = search.best_alpha_
 
-lasso_best = Lasso(alpha=best_alpha, max_iter=10000, random_state=42)
-lasso_best.fit(X_train, y_train)
+lasso_best = search.best_estimator_
 
 coef = pd.Series(lasso_best.coef_, index=X_train.columns)
 selected_features_lasso = coef[coef.abs() > 1e-4].index.tolist()  # threshold untuk fitur penting
@@ -973,11 +911,11 @@ print(f"RMSE: {rmse_lr:.2f}, R²: {r2_lr:.2f}")
 # #### Apa yang dilakukan kode?
 # 
 # 1. **Pemilihan Parameter Alpha Terbaik**
-#    - Menggunakan **GridSearchCV** dengan validasi silang untuk mencari nilai alpha terbaik pada model Lasso (regularisasi L1).
+#    - Menggunakan **LassoPathSearch** (jalur regularisasi Lasso dengan warm start per fold) dengan validasi silang untuk mencari nilai alpha terbaik pada model Lasso (regularisasi L1).
 #    - Alpha mengontrol seberapa kuat penalti regularisasi diterapkan. Nilai optimal mencegah overfitting dan mengurangi fitur tidak penting.
 # 
 # 2. **Training Model Lasso**
-#    - Model Lasso dilatih menggunakan alpha terbaik.
+#    - Model Lasso dengan alpha terbaik diambil dari jalur yang dihitung pada seluruh data latih (tanpa refit terpisah).
 #    - Koefisien fitur dianalisis: fitur yang koefisiennya **tidak nol** (di atas ambang 1e-4) dianggap penting.
 # 
 # 3. **Seleksi Fitur**
@@ -1013,4 +951,26 @@ print(f"RMSE: {rmse_lr:.2f}, R²: {r2_lr:.2f}")
 # - Dengan menggunakan fitur yang dipilih Lasso, performa model tetap tinggi dengan **kompleksitas yang lebih rendah**.
 # 
 
+# %% [markdown]
+# ## Encoding Sparse untuk Model Linear
+
+# %%
+# Neighborhood di-one-hot (bukan frekuensi) dan hasil encoding berupa matriks CSR;
+# LinearRegression/Lasso menerima input sparse sehingga tidak perlu didensifikasi
+sparse_encoder = CategoricalEncoder(onehot_columns=ONEHOT_COLUMNS + ['Neighborhood'], frequency_columns=[])
+X_sparse = sparse_encoder.fit(df).transform_sparse(df)
+train_pos = df.index.get_indexer(X_train.index)
+test_pos = df.index.get_indexer(X_test.index)
 
+sparse_bytes = X_sparse.data.nbytes + X_sparse.indices.nbytes + X_sparse.indptr.nbytes
+print(f"Shape: {X_sparse.shape}, non-zero: {X_sparse.nnz}")
+print(f"Memori CSR: {sparse_bytes / 1e6:.2f} MB vs dense float64: {np.prod(X_sparse.shape) * 8 / 1e6:.2f} MB")
+
+sparse_models = {
+    "Linear Regression (sparse)": LinearRegression(),
+    "Lasso (sparse)": Lasso(alpha=best_alpha, max_iter=10000, random_state=42),
+}
+for name, model in sparse_models.items():
+    model.fit(X_sparse[train_pos], y_train)
+    y_pred = model.predict(X_sparse[test_pos])
+    print(f"{name} - RMSE: {np.sqrt(mean_squared_error(y_test, y_pred)):.2f}, R²: {r2_score(y_test, y_pred):.2f}")
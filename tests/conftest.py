@@ -0,0 +1,17 @@
+"""Fixture bersama: data sintetis berskema Ames (tanpa file dataset asli)."""
+
+import pytest
+
+from benchmarks.synthetic import make_frame, write_arff
+
+
+@pytest.fixture(scope='session')
+def frame():
+    return make_frame(1500, seed=7)
+
+
+@pytest.fixture(scope='session')
+def arff_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp('data') / 'ames.arff'
+    write_arff(str(path), 1200, seed=3)
+    return path
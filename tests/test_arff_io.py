@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+import pytest
+
+from ames_housing.arff_io import load_dataset, read_arff, read_arff_header
+
+
+def test_cache_roundtrip_matches_parse(arff_path, tmp_path):
+    parsed = read_arff(arff_path)
+    first = load_dataset(arff_path, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob('*.feather'))) == 1
+    cached = load_dataset(arff_path, cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(first, parsed)
+    pd.testing.assert_frame_equal(cached, parsed)
+
+
+def test_nominal_columns_keep_header_categories(arff_path):
+    frame = read_arff(arff_path)
+    categorical = frame.select_dtypes(include='category')
+    assert len(categorical.columns) > 0
+    nominal = {attr.name: attr.categories for attr in read_arff_header(arff_path).attributes
+               if attr.kind == 'nominal'}
+    assert set(categorical.columns) == set(nominal)
+    for column in categorical.columns:
+        assert tuple(categorical[column].cat.categories) == nominal[column]
+    assert categorical['MSZoning'].cat.categories[-1] == 'C (all)'
+
+
+def test_cache_rebuilt_when_file_changes(tmp_path):
+    path = tmp_path / 'small.arff'
+    path.write_text("@RELATION t\n@ATTRIBUTE a INTEGER\n@ATTRIBUTE b {x,y}\n@DATA\n1,x\n2,y\n")
+    cache_dir = tmp_path / 'cache'
+    assert load_dataset(path, cache_dir=cache_dir)['a'].tolist() == [1, 2]
+    stat = os.stat(path)
+    path.write_text("@RELATION t\n@ATTRIBUTE a INTEGER\n@ATTRIBUTE b {x,y}\n@DATA\n1,x\n?,y\n7,x\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = load_dataset(path, cache_dir=cache_dir)
+    assert reloaded['a'].isna().tolist() == [False, True, False]
+    assert len(list(cache_dir.glob('*.feather'))) == 1
+
+
+@pytest.mark.parametrize('use_cache', [True, False])
+def test_missing_values_become_nan(tmp_path, use_cache):
+    path = tmp_path / 'missing.arff'
+    path.write_text("@RELATION t\n@ATTRIBUTE a REAL\n@ATTRIBUTE b {'p q',r}\n@DATA\n?,'p q'\n1.5,?\n")
+    frame = load_dataset(path, cache_dir=tmp_path / 'cache', use_cache=use_cache)
+    assert frame['a'].isna().tolist() == [True, False]
+    assert frame['b'].tolist()[0] == 'p q' and pd.isna(frame['b'].tolist()[1])
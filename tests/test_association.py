@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency
+
+from ames_housing.association import CramersVEngine, cramers_v, cramers_v_from_table
+
+
+def _reference(x, y):
+    """Cramér's V terkoreksi bias versi notebook (pd.crosstab + scipy)."""
+    table = pd.crosstab(x, y)
+    chi2 = chi2_contingency(table)[0]
+    n = table.to_numpy().sum()
+    r, k = table.shape
+    phi2corr = max(0, chi2 / n - ((k - 1) * (r - 1)) / (n - 1))
+    rcorr = r - ((r - 1) ** 2) / (n - 1)
+    kcorr = k - ((k - 1) ** 2) / (n - 1)
+    return np.sqrt(phi2corr / min(kcorr - 1, rcorr - 1))
+
+
+@pytest.fixture(scope='module')
+def categorical(frame):
+    columns = list(frame.select_dtypes(include=['object', 'category']).columns[:12])
+    return frame[columns]
+
+
+def test_pairs_match_crosstab_reference(categorical):
+    columns = categorical.columns
+    for a, b in [(columns[0], columns[1]), (columns[2], columns[5]), (columns[3], columns[11])]:
+        np.testing.assert_allclose(cramers_v(categorical[a], categorical[b]),
+                                   _reference(categorical[a], categorical[b]), rtol=1e-10)
+
+
+def test_two_by_two_uses_yates_correction():
+    rng = np.random.default_rng(0)
+    x = pd.Series(rng.integers(0, 2, 400)).map({0: 'a', 1: 'b'})
+    y = pd.Series(np.where(rng.random(400) < 0.7, x, 'a'))
+    np.testing.assert_allclose(cramers_v(x, y), _reference(x, y), rtol=1e-10)
+
+
+def test_undefined_table_is_nan():
+    constant = pd.Series(['a'] * 50)
+    other = pd.Series(list('xyz') * 16 + ['x', 'y'])
+    assert np.isnan(cramers_v(constant, other))
+    assert np.isnan(cramers_v_from_table(np.zeros((0, 0))))
+
+
+def test_matrix_matches_pairs_and_is_symmetric(categorical):
+    matrix = CramersVEngine().matrix(categorical)
+    np.testing.assert_allclose(matrix.to_numpy(), matrix.to_numpy().T, equal_nan=True)
+    a, b = categorical.columns[1], categorical.columns[4]
+    np.testing.assert_allclose(matrix.loc[a, b], _reference(categorical[a], categorical[b]), rtol=1e-10)
+    assert (np.diag(matrix) == 1.0).all()
+
+
+def test_parallel_and_cached_results_are_identical(categorical):
+    engine = CramersVEngine()
+    serial = engine.matrix(categorical)
+    parallel = CramersVEngine(n_jobs=2, batch_size=8).matrix(categorical)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    changed = categorical.copy()
+    column = changed.columns[0]
+    changed[column] = changed[column].sample(frac=1, random_state=0).to_numpy()
+    updated = engine.matrix(changed)
+    pd.testing.assert_frame_equal(updated, CramersVEngine().matrix(changed))
+    pd.testing.assert_frame_equal(updated.iloc[1:, 1:], serial.iloc[1:, 1:])
@@ -0,0 +1,84 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from ames_housing.attribution import AttributionService, permutation_importance
+from ames_housing.cache import ArtifactCache
+from ames_housing.compiled import compile_ensemble
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(4)
+    X = pd.DataFrame(rng.normal(size=(500, 6)), columns=[f"f{i}" for i in range(6)])
+    y = 5 * X['f0'] + 2 * X['f1'] + 0.5 * X['f2'] + rng.normal(scale=0.1, size=500)
+    return X, y
+
+
+@pytest.fixture(scope='module')
+def forest(data):
+    X, y = data
+    return RandomForestRegressor(n_estimators=30, max_depth=6, random_state=0).fit(X, y)
+
+
+def _reference_importance(model, X, y, column, seed, n_repeats):
+    """Perulangan langsung: acak satu kolom, prediksi, hitung kenaikan RMSE."""
+    rng = np.random.default_rng(seed)
+    values = X.to_numpy()
+    baseline = np.sqrt(((y - model.predict(X)) ** 2).mean())
+    scores = []
+    for _ in range(n_repeats):
+        shuffled = values.copy()
+        shuffled[:, column] = values[rng.permutation(len(values)), column]
+        scores.append(np.sqrt(((y - model.predict(pd.DataFrame(shuffled, columns=X.columns))) ** 2).mean()))
+    return np.mean(scores) - baseline
+
+
+def test_permutation_importance_matches_direct_loop(data):
+    X, y = data
+    model = LinearRegression().fit(X, y)
+    result = permutation_importance(model, X, y, n_repeats=4, random_state=3, n_jobs=1)
+    assert list(result.index[:3]) == ['f0', 'f1', 'f2']
+    seeds = np.random.SeedSequence(3).generate_state(X.shape[1])
+    for column, name in enumerate(X.columns):
+        expected = _reference_importance(model, X, y.to_numpy(), column, seeds[column], 4)
+        assert result.loc[name, 'importance_mean'] == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_permutation_importance_independent_of_jobs_and_batching(data, forest):
+    X, y = data
+    serial = permutation_importance(forest, X, y, n_repeats=3, n_jobs=1)
+    parallel = permutation_importance(forest, X, y, n_repeats=3, n_jobs=2, max_rows=len(X))
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial.attrs['baseline_rmse'] == parallel.attrs['baseline_rmse']
+
+
+def test_dataframe_fitted_model_gets_feature_names(data):
+    X, y = data
+    model = LinearRegression().fit(X, y)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        permutation_importance(model, X.to_numpy(), y, n_repeats=2, n_jobs=1)
+        permutation_importance(model, X, y, n_repeats=2, n_jobs=2)
+
+
+def test_service_reuses_compiled_and_caches(data, forest, tmp_path):
+    X, y = data
+    compiled = compile_ensemble(forest)
+    cache = ArtifactCache(tmp_path / 'cache')
+    service = AttributionService(forest, cache=cache, compiled=compiled)
+    assert service.compiled is compiled
+    frame = service.contributions(X.iloc[:50])
+    assert list(frame.columns) == ['bias', *X.columns]
+    np.testing.assert_allclose(frame.sum(axis=1), forest.predict(X.iloc[:50]), rtol=1e-9)
+    explained = service.explain(X.iloc[:2], top=2)
+    assert explained[0]['prediction'] == pytest.approx(forest.predict(X.iloc[:1])[0])
+    assert set(explained[0]['contributions']) <= set(X.columns) and len(explained[0]['contributions']) == 2
+
+    again = AttributionService(forest, cache=cache)
+    pd.testing.assert_frame_equal(again.contributions(X.iloc[:50]), frame)
+    assert again._compiled is None  # hasil dari cache, tidak perlu kompilasi
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from benchmarks.run import STAGES, compare, main, run_stage
+
+
+def _result(stage, rows, seconds):
+    return {'stage': stage, 'rows': rows, 'seconds': seconds}
+
+
+def test_compare_flags_only_slower_stages():
+    baseline = {'results': [_result('load', 1000, 1.0), _result('impute', 1000, 2.0),
+                            {'stage': 'fit_rf', 'rows': 1000, 'error': 'x'}]}
+    results = [_result('load', 1000, 1.19), _result('impute', 1000, 2.5),
+               _result('fit_rf', 1000, 9.0), _result('corr', 1000, 5.0)]
+    regressions = compare(results, baseline, tolerance=0.2)
+    assert [(r['stage'], r['rows']) for r in regressions] == [('impute', 1000)]
+    assert regressions[0]['ratio'] == pytest.approx(1.25)
+
+
+def test_run_stage_reports_time_and_memory(tmp_path):
+    result = run_stage('impute', 200, repeat=2, workdir=str(tmp_path))
+    assert result['stage'] == 'impute' and result['rows'] == 200
+    assert 'error' not in result
+    assert len(result['times']) == 2 and result['seconds'] == min(result['times'])
+    assert result['peak_rss_mb'] > 0
+
+
+def test_main_writes_report_and_skips_large_fits(tmp_path):
+    output = tmp_path / 'latest.json'
+    code = main(['--sizes', '300', '--stages', 'corr', 'fit_lr', '--repeat', '1',
+                 '--max-fit-rows', '100', '--workdir', str(tmp_path), '--output', str(output)])
+    assert code == 0
+    report = json.loads(output.read_text())
+    by_stage = {r['stage']: r for r in report['results']}
+    assert 'seconds' in by_stage['corr']
+    assert 'skipped' in by_stage['fit_lr'] and STAGES['fit_lr'][2]
+    assert {'python', 'numpy', 'sklearn'} <= set(report['metadata'])
+
+    slower = {'metadata': {}, 'results': [{**by_stage['corr'], 'seconds': 1e-9}]}
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(slower))
+    assert main(['--sizes', '300', '--stages', 'corr', '--repeat', '1', '--workdir', str(tmp_path),
+                 '--output', str(output), '--compare', str(baseline)]) == 1
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from ames_housing import modeling
+from ames_housing.cache import ArtifactCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArtifactCache(tmp_path / 'cache')
+
+
+def test_roundtrip_and_missing_key(cache):
+    cache.put('a', {'x': 1})
+    assert cache.get('a') == {'x': 1}
+    assert cache.get('b', 'default') == 'default'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize('content', [b'', b'\x80\x04garbage', b'not a pickle at all'])
+def test_corrupt_entry_is_a_miss_and_removed(cache, content):
+    cache.put('a', np.arange(1000))
+    path = cache._path('a')
+    path.write_bytes(content)
+    assert cache.get('a') is None
+    assert not path.exists()
+    assert cache.misses == 1
+
+
+def test_truncated_entry_is_a_miss(cache):
+    cache.put('a', np.arange(100_000))
+    path = cache._path('a')
+    path.write_bytes(path.read_bytes()[:1000])
+    assert cache.get('a', 'refit') == 'refit'
+    assert not path.exists()
+
+
+def test_entry_evicted_after_load_is_still_a_hit(cache, monkeypatch):
+    cache.put('a', 1)
+
+    def evicted(path, times):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, 'utime', evicted)
+    assert cache.get('a') == 1
+
+
+def test_fingerprint_depends_on_dtype():
+    values = np.arange(10)
+    assert modeling.data_fingerprint(values) != modeling.data_fingerprint(values.astype('float32'))
+    frame = pd.DataFrame({'a': values})
+    assert modeling.data_fingerprint(frame) != modeling.data_fingerprint(frame.astype('float64'))
+
+
+def test_estimator_key_includes_sklearn_version(monkeypatch):
+    key = modeling.estimator_key(LinearRegression(), 'data')
+    monkeypatch.setattr(modeling.sklearn, '__version__', '0.0.0')
+    assert modeling.estimator_key(LinearRegression(), 'data') != key
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from ames_housing.cli import build_parser, main
+from ames_housing.preprocessing import TARGET, HousePreprocessor
+from ames_housing.serving import ModelBundle
+
+# Dicetak proses anak: modul yang termuat setelah satu perintah predict.
+_PROBE = """
+import sys
+from ames_housing.cli import main
+main(sys.argv[1:])
+print(' '.join(sorted(m for m in sys.modules if m.split('.')[0] in ('sklearn', 'scipy', 'matplotlib',
+      'seaborn', 'ames_housing'))), file=sys.stderr)
+"""
+
+
+@pytest.fixture(scope='module')
+def artifacts(frame, tmp_path_factory):
+    directory = tmp_path_factory.mktemp('artifacts')
+    preprocessor = HousePreprocessor().fit(frame)
+    X = preprocessor.transform(frame)
+    preprocessor.save(directory / 'preprocessor.joblib')
+    joblib.dump(LinearRegression().fit(X, frame[TARGET]), directory / 'linear.joblib')
+    joblib.dump(RandomForestRegressor(n_estimators=10, max_depth=5, random_state=0).fit(X, frame[TARGET]),
+                directory / 'forest.joblib')
+    frame.drop(columns=TARGET).iloc[:40].to_csv(directory / 'listings.csv', index=False)
+    return directory
+
+
+def _predict(artifacts, model):
+    args = ['predict', str(artifacts / 'listings.csv'), '--preprocessor', str(artifacts / 'preprocessor.joblib'),
+            '--model', str(artifacts / f'{model}.joblib'), '--output', str(artifacts / f'{model}.csv')]
+    run = subprocess.run([sys.executable, '-c', _PROBE, *args], capture_output=True, text=True, check=True)
+    return pd.read_csv(artifacts / f'{model}.csv'), set(run.stderr.split())
+
+
+@pytest.mark.parametrize('model', ['linear', 'forest'])
+def test_predict_output_and_imports(artifacts, model):
+    result, modules = _predict(artifacts, model)
+    bundle = ModelBundle.load(artifacts / 'preprocessor.joblib', artifacts / f'{model}.joblib')
+    listings = pd.read_csv(artifacts / 'listings.csv')
+    assert list(result.columns) == ['Id', 'SalePrice']
+    np.testing.assert_allclose(result['SalePrice'], bundle.predict_frame(listings), rtol=1e-9)
+
+    # Tidak pernah di jalur predict: plot dan modul pelatihan.
+    for name in ('matplotlib', 'seaborn', 'ames_housing.pipeline', 'ames_housing.modeling',
+                 'ames_housing.attribution', 'ames_housing.tuning'):
+        assert name not in modules
+    # Ikut termuat lewat sklearn.base, lihat docstring ames_housing.cli.
+    assert 'scipy.stats' in modules
+    assert ('sklearn.ensemble' in modules) == ('ames_housing.compiled' in modules) == (model == 'forest')
+
+
+def test_unknown_arguments_are_rejected():
+    with pytest.raises(SystemExit):
+        main(['predict', 'x.csv', '--bogus'])
+    args, extra = build_parser().parse_known_args(['serve', '--port', '9000'])
+    assert args.command == 'serve' and extra == ['--port', '9000']
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from sklearn.dummy import DummyRegressor
+from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from ames_housing.compiled import compile_ensemble, supports
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 8))
+    X[rng.random(X.shape) < 0.05] = np.nan
+    y = np.nan_to_num(X[:, 0]) * 3 + np.nan_to_num(X[:, 1]) ** 2 + rng.normal(scale=0.1, size=600)
+    return X, y
+
+
+MODELS = [
+    DecisionTreeRegressor(max_depth=8, random_state=0),
+    RandomForestRegressor(n_estimators=20, max_depth=7, random_state=0),
+    ExtraTreesRegressor(n_estimators=15, random_state=0),
+    GradientBoostingRegressor(n_estimators=40, max_depth=3, random_state=0),
+]
+
+
+@pytest.fixture(scope='module', params=MODELS, ids=lambda m: type(m).__name__)
+def fitted(request, data):
+    X, y = data
+    model = request.param
+    # Hanya DecisionTree dan RandomForest yang menerima NaN (jalur missing_go_to_left).
+    X_fit = X if isinstance(model, (DecisionTreeRegressor, RandomForestRegressor)) else np.nan_to_num(X)
+    return model.fit(X_fit, y), X_fit
+
+
+def test_predict_matches_sklearn(fitted):
+    model, X = fitted
+    compiled = compile_ensemble(model, batch_size=97, compact_every=2)
+    np.testing.assert_allclose(compiled.predict(X), model.predict(X), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(compiled.predict(X[:1]), model.predict(X[:1]), rtol=1e-9, atol=1e-9)
+
+
+def test_contributions_sum_to_prediction(fitted):
+    model, X = fitted
+    compiled = compile_ensemble(model)
+    contributions = compiled.contributions(X[:200])
+    assert contributions.shape == (200, X.shape[1])
+    np.testing.assert_allclose(compiled.expected_value + contributions.sum(axis=1), model.predict(X[:200]),
+                               rtol=1e-9, atol=1e-6)
+
+
+def test_rejects_wrong_width(fitted):
+    model, X = fitted
+    with pytest.raises(ValueError):
+        compile_ensemble(model).predict(X[:, :-1])
+
+
+def test_gradient_boosting_init(data):
+    X, y = np.nan_to_num(data[0]), data[1]
+    zero = GradientBoostingRegressor(n_estimators=20, init='zero', random_state=0).fit(X, y)
+    np.testing.assert_allclose(compile_ensemble(zero).predict(X), zero.predict(X), rtol=1e-9, atol=1e-9)
+    median = GradientBoostingRegressor(n_estimators=20, init=DummyRegressor(strategy='median'),
+                                       random_state=0).fit(X, y)
+    np.testing.assert_allclose(compile_ensemble(median).predict(X), median.predict(X), rtol=1e-9, atol=1e-9)
+
+    # Init yang bergantung pada baris tidak bisa menjadi satu konstanta: ditolak, bukan diprediksi salah.
+    linear = GradientBoostingRegressor(n_estimators=20, init=LinearRegression(), random_state=0).fit(X, y)
+    assert not supports(linear)
+    with pytest.raises(TypeError):
+        compile_ensemble(linear)
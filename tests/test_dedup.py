@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ames_housing.dedup import Deduplicator, UnionFind, drop_duplicates, find_duplicates
+
+
+@pytest.fixture(scope='module')
+def planted(frame):
+    """``frame`` plus salinan eksak (Id baru) dan listing ulang (luas +1%, harga berubah), diacak.
+
+    Mengembalikan ``(data, pasangan)`` dengan pasangan (Id asli, Id salinan, eksak?).
+    """
+    exact = frame.sample(15, random_state=1).copy()
+    relisted = frame.drop(exact.index).sample(25, random_state=2).copy()
+    pairs = [(i, 100_000 + k, True) for k, i in enumerate(exact['Id'])]
+    pairs += [(i, 200_000 + k, False) for k, i in enumerate(relisted['Id'])]
+    exact['Id'] = np.arange(100_000, 100_015)
+    relisted['Id'] = np.arange(200_000, 200_025)
+    relisted['GrLivArea'] = (relisted['GrLivArea'] * 1.01).round().astype(relisted['GrLivArea'].dtype)
+    relisted['SalePrice'] = relisted['SalePrice'] + 1000
+    data = pd.concat([frame, exact, relisted], ignore_index=True)
+    order = np.random.default_rng(0).permutation(len(data))
+    return data.iloc[order].reset_index(drop=True), pairs
+
+
+def test_finds_planted_duplicates(planted, frame):
+    data, pairs = planted
+    dedup = Deduplicator()
+    clusters = dedup.update(data).result()
+    cluster_of = pd.Series(dedup.labels_, index=data['Id'].to_numpy())
+    exact_of = pd.Series(dedup.exact_, index=data['Id'].to_numpy())
+    for source, copy, exact in pairs:
+        assert cluster_of[source] == cluster_of[copy]
+        # Yang datang belakangan dari pasangan eksak ditandai ``exact``.
+        assert exact_of[[source, copy]].any() == exact
+    assert dedup.summary()['exact_duplicates'] == 15
+    assert len(drop_duplicates(data, clusters)) == len(frame)
+
+
+def test_chunked_equals_in_memory(planted):
+    data = planted[0]
+    chunked = Deduplicator()
+    for start in range(0, len(data), 211):
+        chunked.update(data.iloc[start:start + 211])
+    pd.testing.assert_frame_equal(chunked.result(), find_duplicates(data))
+
+
+def test_exact_only_matches_duplicated(frame):
+    data = pd.concat([frame, frame.iloc[:9]], ignore_index=True)
+    dedup = Deduplicator(exclude=(), near=False)
+    dedup.update(data).result()
+    np.testing.assert_array_equal(dedup.exact_, data.duplicated().to_numpy())
+
+
+def test_union_find_roots_are_smallest_member():
+    forest = UnionFind(8).union([5, 3, 7, 1], [3, 6, 6, 0])
+    np.testing.assert_array_equal(forest.labels(), [0, 0, 2, 3, 4, 3, 3, 3])
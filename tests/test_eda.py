@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from scipy.stats import gaussian_kde
+
+from ames_housing import eda
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+COLUMNS = ['LotArea', 'GrLivArea', 'SalePrice', 'MSZoning', 'Street', 'CentralAir']
+
+
+@pytest.fixture(scope='module')
+def small(frame):
+    return frame[COLUMNS].iloc[:400].copy()
+
+
+def test_histogram_stats_match_numpy_and_kde():
+    values = np.random.default_rng(0).normal(10, 2, size=5000)
+    values[:20] = np.nan
+    stats = eda._histogram_stats(values)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=eda.HIST_BINS)
+    assert stats['counts'] == counts.tolist()
+    np.testing.assert_allclose(stats['edges'], edges)
+    # KDE ter-bin ~ gaussian_kde (bandwidth Scott) yang diskalakan ke jumlah per bin.
+    x = np.asarray(stats['kde_x'])
+    scale = (len(values) - 20) * (edges[1] - edges[0])
+    expected = gaussian_kde(values[~np.isnan(values)])(x) * scale
+    np.testing.assert_allclose(stats['kde_y'], expected, atol=0.02 * expected.max())
+
+
+def test_report_rerenders_only_changed_figures(small, tmp_path):
+    first = eda.build_report(small, tmp_path, n_jobs=2)
+    names = {'hist_LotArea', 'hist_GrLivArea', 'hist_SalePrice', 'correlation',
+             'count_MSZoning', 'count_Street', 'count_CentralAir', 'cramers_v'}
+    assert set(first['rendered']) == names and first['reused'] == []
+    html = (tmp_path / 'report.html').read_text()
+    assert html.count('data:image/png;base64,') == len(names)
+
+    again = eda.build_report(small, tmp_path, n_jobs=1)
+    assert again['rendered'] == [] and set(again['reused']) == names
+
+    changed = small.assign(LotArea=small['LotArea'] * 2)
+    third = eda.build_report(changed, tmp_path, n_jobs=1)
+    assert set(third['rendered']) == {'hist_LotArea', 'correlation'}
+
+
+def test_deleted_figure_is_rendered_again(small, tmp_path):
+    eda.build_report(small, tmp_path, n_jobs=1)
+    (tmp_path / 'figures' / 'count_Street.png').unlink()
+    assert eda.build_report(small, tmp_path, n_jobs=1)['rendered'] == ['count_Street']
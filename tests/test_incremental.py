@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import Lasso, LinearRegression
+
+from ames_housing.incremental import GramAccumulator, StreamingLasso, StreamingLinearRegression
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(2000, 12)) * rng.uniform(0.1, 1000, size=12)
+    y = X @ rng.normal(size=12) + 50 + rng.normal(scale=5, size=2000)
+    return X, y
+
+
+def _chunks(X, y, size=333):
+    for start in range(0, len(X), size):
+        yield X[start:start + size], y[start:start + size]
+
+
+def test_chunked_ols_matches_linear_regression(data):
+    X, y = data
+    model = StreamingLinearRegression()
+    for X_chunk, y_chunk in _chunks(X, y):
+        model.partial_fit(X_chunk, y_chunk)
+    expected = LinearRegression().fit(X, y)
+    np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-7)
+    np.testing.assert_allclose(model.intercept_, expected.intercept_, rtol=1e-7)
+    np.testing.assert_allclose(model.predict(X), expected.predict(X), rtol=1e-9)
+
+
+def test_merged_accumulators_equal_single_pass(data):
+    X, y = data
+    single = GramAccumulator().update(X, y)
+    merged = GramAccumulator()
+    for X_chunk, y_chunk in _chunks(X, y):
+        merged.merge(GramAccumulator().update(X_chunk, y_chunk))
+    assert merged.n == single.n
+    np.testing.assert_allclose(merged.xx, single.xx, rtol=1e-9)
+    np.testing.assert_allclose(merged.xy, single.xy, rtol=1e-9)
+    np.testing.assert_allclose(merged.yy, single.yy, rtol=1e-9)
+
+
+def test_sse_matches_residuals(data):
+    X, y = data
+    model = StreamingLinearRegression().fit(X, y)
+    expected = ((y - model.predict(X)) ** 2).sum()
+    np.testing.assert_allclose(model.gram_.sse(model.coef_, model.intercept_), expected, rtol=1e-6)
+
+
+def test_streaming_lasso_matches_lasso(data):
+    X, y = data
+    X = X / X.std(axis=0)
+    model = StreamingLasso(alpha=0.5, tol=1e-8)
+    for X_chunk, y_chunk in _chunks(X, y):
+        model.partial_fit(X_chunk, y_chunk)
+    expected = Lasso(alpha=0.5, tol=1e-8, max_iter=100_000).fit(X, y)
+    np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-4, atol=1e-4)
@@ -0,0 +1,70 @@
+import json
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from ames_housing import instrument
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    instrument.reset()
+    instrument.configure(log_path=str(tmp_path / 'logs' / 'stages.jsonl'),
+                         metrics_path=str(tmp_path / 'ames.prom'), trace_memory=True)
+    yield tmp_path
+    instrument.configure(enabled=False)
+    instrument.reset()
+    tracemalloc.stop()
+
+
+def test_disabled_stage_records_nothing():
+    instrument.configure(enabled=False)
+    instrument.reset()
+    with instrument.stage('noop', rows_in=3) as s:
+        s.rows_out = 2
+    assert s is instrument.stage('other')
+    assert instrument.records().empty
+
+
+def test_nested_stages_and_decorator(recorder):
+    @instrument.instrumented('double')
+    def double(values):
+        return np.concatenate([values, values])
+
+    with instrument.stage('outer', rows_in=10, run='a') as s:
+        with instrument.stage('alloc'):
+            block = np.ones(4_000_000)
+        out = double(np.arange(10))
+        s.rows_out = len(out)
+        del block
+
+    frame = instrument.records()
+    assert list(frame['stage']) == ['outer/alloc', 'outer/double', 'outer']
+    double_row, outer = frame.iloc[1], frame.iloc[2]
+    assert (double_row['rows_in'], double_row['rows_out']) == (10, 20)
+    assert (outer['rows_in'], outer['rows_out'], outer['run']) == (10, 20, 'a')
+    # Peak tahap induk mencakup alokasi 32 MB di tahap anak.
+    assert outer['traced_peak_mb'] >= frame.iloc[0]['traced_peak_mb'] >= 30
+    assert (frame['wall_seconds'] >= 0).all() and (frame['status'] == 'ok').all()
+
+    lines = (recorder / 'logs' / 'stages.jsonl').read_text().splitlines()
+    assert [json.loads(line)['stage'] for line in lines] == list(frame['stage'])
+
+
+def test_errors_are_recorded_and_reraised(recorder):
+    with pytest.raises(KeyError):
+        with instrument.stage('fails'):
+            raise KeyError('x')
+    assert instrument.records().iloc[-1]['status'] == 'error: KeyError'
+
+
+def test_prometheus_totals(recorder):
+    for rows in (5, 7):
+        with instrument.stage('load', rows_in=rows) as s:
+            s.rows_out = rows - 1
+    text = (recorder / 'ames.prom').read_text()
+    assert 'ames_stage_calls_total{stage="load"} 2' in text
+    assert 'ames_stage_rows_in_total{stage="load"} 12' in text
+    assert 'ames_stage_rows_out_total{stage="load"} 10' in text
+    assert '# TYPE ames_stage_peak_rss_bytes gauge' in text
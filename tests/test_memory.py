@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ames_housing.memory import downcast, downcast_series
+
+
+@pytest.mark.parametrize('values, dtype, expected', [
+    ([1, 200], 'int64', 'int16'),
+    ([-5, 100], 'int64', 'int8'),
+    ([1, 200], 'uint64', 'uint8'),
+    ([1, 200], 'uint8', 'uint8'),
+    ([0, 70_000], 'uint32', 'uint32'),
+    ([0, 2 ** 40], 'uint64', 'uint64'),
+    ([1, None, 300], 'Int64', 'Int16'),
+    ([1, None, 200], 'UInt64', 'UInt8'),
+    ([1.0, 2.0, 3.0], 'float64', 'int8'),
+])
+def test_integer_ladders(values, dtype, expected):
+    series = pd.Series(values, dtype=dtype)
+    result = downcast_series(series)
+    assert str(result.dtype) == expected
+    pd.testing.assert_series_equal(result.astype(dtype), series)
+
+
+@pytest.mark.parametrize('dtype', ['uint64', 'UInt64'])
+def test_uint64_above_int64_range_is_unchanged(dtype):
+    series = pd.Series([1, 2 ** 63 + 12345], dtype=dtype)
+    result = downcast_series(series)
+    assert result.dtype == series.dtype
+    assert int(result.iloc[1]) == 2 ** 63 + 12345
+
+
+def test_float_without_loss_becomes_float32():
+    series = pd.Series([0.5, 1.25, np.nan])
+    assert downcast_series(series).dtype == 'float32'
+    huge = pd.Series([0.5, 1e300])
+    assert downcast_series(huge).dtype == 'float64'
+
+
+def test_float_rounding_is_opt_in():
+    series = pd.Series([0.1, 2.5, np.nan, 1234.5678])
+    assert downcast_series(series).dtype == 'float64'
+    rounded = downcast_series(series, float_rtol=1e-6)
+    assert rounded.dtype == 'float32'
+    np.testing.assert_allclose(rounded.astype('float64'), series, rtol=1e-6)
+
+
+def test_downcast_frame_preserves_values(frame):
+    frame = frame.assign(Ratio=frame['LotArea'] / frame['GrLivArea'])
+    report, result = downcast(frame)
+    assert report.iloc[-1]['Column'] == 'TOTAL'
+    assert report.iloc[-1]['Saved'] > 0
+    numeric = frame.select_dtypes(include='number').columns
+    # Tanpa toleransi: setiap nilai numerik harus kembali persis sama.
+    np.testing.assert_array_equal(result[numeric].to_numpy(dtype='float64', na_value=np.nan),
+                                  frame[numeric].to_numpy(dtype='float64', na_value=np.nan))
+    assert result['Ratio'].dtype == 'float64'
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import mean_squared_error
+
+from ames_housing.modeling import ModelRunner, map_shared
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(5)
+    X = pd.DataFrame(rng.normal(size=(400, 6)), columns=[f"f{i}" for i in range(6)])
+    y = X.to_numpy() @ rng.normal(size=6) + rng.normal(scale=0.3, size=400)
+    return X.iloc[:300], y[:300], X.iloc[300:], y[300:]
+
+
+MODELS = {
+    'linear': LinearRegression(),
+    'ridge': Ridge(alpha=3.0),
+    'forest': RandomForestRegressor(n_estimators=20, random_state=0, n_jobs=4),
+}
+
+
+def test_parallel_fits_match_serial_fits(data):
+    X_train, y_train, X_test, y_test = data
+    runner = ModelRunner(n_jobs=2)
+    results = runner.compare(MODELS, X_train, y_train, X_test, y_test)
+    assert list(results.index) == list(MODELS)
+    for name, model in MODELS.items():
+        expected = model.fit(X_train, y_train).predict(X_test)
+        np.testing.assert_allclose(runner.predictions_[name], expected, rtol=1e-10)
+        assert results.loc[name, 'RMSE'] == pytest.approx(np.sqrt(mean_squared_error(y_test, expected)))
+        assert list(runner.fitted_[name].feature_names_in_) == list(X_train.columns)
+    # Jatah core dibagi ke model yang berjalan bersamaan.
+    assert runner.fitted_['forest'].n_jobs == 1
+
+
+def test_second_run_comes_from_cache(data):
+    X_train, y_train, X_test, _ = data
+    runner = ModelRunner(n_jobs=2)
+    first = runner.fit_many(MODELS, X_train, y_train, X_test)
+    second = runner.fit_many(MODELS, X_train, y_train, X_test)
+    assert all(second[name] is first[name] for name in MODELS)
+    assert set(runner.fit_times_.values()) == {0.0}
+    refit = runner.fit_many({'ridge': Ridge(alpha=4.0)}, X_train, y_train)
+    assert refit['ridge'] is not first['ridge']
+
+
+def _column_sums(X, y, column):
+    return float(X[:, column].sum() + y.sum())
+
+
+def test_map_shared_parallel_equals_serial(data):
+    X_train, y_train, _, _ = data
+    tasks = [(i,) for i in range(X_train.shape[1])]
+    serial = map_shared(_column_sums, [X_train, y_train], tasks, n_jobs=1)
+    assert map_shared(_column_sums, [X_train, y_train], tasks, n_jobs=2) == serial
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ames_housing.outliers import iqr_outliers
+
+
+@pytest.fixture(scope='module')
+def numeric(frame):
+    columns = ['LotArea', 'GrLivArea', 'TotalBsmtSF', 'LotFrontage', 'SalePrice']
+    return frame, columns
+
+
+def _reference(df, columns, whisker=1.5):
+    """Perulangan per kolom seperti di notebook, batas dari df awal."""
+    keep = pd.Series(True, index=df.index)
+    counts = {}
+    for col in columns:
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        iqr = q3 - q1
+        outside = (df[col] < q1 - whisker * iqr) | (df[col] > q3 + whisker * iqr)
+        counts[col] = int(outside.sum())
+        keep &= ~outside
+    return counts, keep
+
+
+def test_report_and_drop_match_column_loop(numeric):
+    df, columns = numeric
+    counts, keep = _reference(df, columns)
+    report, kept = iqr_outliers(df, columns, action='drop')
+    assert dict(zip(report['Column'], report['Outliers'])) == {c: n for c, n in counts.items() if n}
+    assert report['Percentage'].is_monotonic_decreasing
+    pd.testing.assert_frame_equal(kept, df.loc[keep])
+
+
+def test_mask_keeps_missing_values(numeric):
+    df, columns = numeric
+    assert df['LotFrontage'].isna().any()
+    _, mask = iqr_outliers(df, columns, action='mask')
+    np.testing.assert_array_equal(mask, _reference(df, columns)[1].to_numpy())
+    assert mask[df['LotFrontage'].isna().to_numpy()].any()
+
+
+def test_cap_clips_to_bounds(numeric):
+    df, columns = numeric
+    _, capped = iqr_outliers(df, columns, whisker=1.0, action='cap')
+    for col in columns:
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        lower, upper = q1 - (q3 - q1), q3 + (q3 - q1)
+        np.testing.assert_allclose(capped[col], df[col].clip(lower, upper))
+    pd.testing.assert_frame_equal(capped.drop(columns=columns), df.drop(columns=columns))
+
+
+def test_unknown_action_raises(numeric):
+    df, columns = numeric
+    with pytest.raises(ValueError):
+        iqr_outliers(df, columns, action='remove')
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from sklearn.dummy import DummyRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.linear_model import LinearRegression
+
+from ames_housing import pipeline
+from ames_housing.preprocessing import TARGET, HousePreprocessor, NativeCategoricalEncoder
+from ames_housing.serving import ModelBundle
+
+
+@pytest.fixture(scope='module')
+def native(frame):
+    preprocessor, X, y = pipeline.preprocess(frame, HousePreprocessor(encoder=NativeCategoricalEncoder()))
+    return preprocessor, pipeline.split(X, y)
+
+
+def test_hist_gradient_boosting_uses_native_categories(native):
+    preprocessor, (X_train, X_test, y_train, y_test) = native
+    mask = preprocessor.encoder.categorical_mask_
+    model = pipeline.hist_gradient_boosting(mask).fit(X_train, y_train)
+    assert isinstance(model, HistGradientBoostingRegressor)
+    np.testing.assert_array_equal(model.is_categorical_, mask)
+    assert model.n_iter_ < 1000  # early stopping aktif
+    rmse, r2 = pipeline.evaluate(y_test, model.predict(X_test))
+    baseline, _ = pipeline.evaluate(y_test, np.full(len(y_test), y_train.mean()))
+    assert r2 > 0.5 and rmse < baseline
+
+
+def test_run_saves_lowest_rmse_model(arff_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, 'default_models', lambda: {
+        'Mean': DummyRegressor(), 'Linear Regression': LinearRegression()})
+    summary = pipeline.run(arff_path, artifacts=tmp_path / 'artifacts', cache_dir=None, n_jobs=1, select=False)
+    results = summary['results']
+    assert list(results.index) == list(results.sort_values('RMSE').index)
+    assert set(results.index) == {'Mean', 'Linear Regression', 'Hist Gradient Boosting'}
+    assert summary['best_model'] == results.index[0] != 'Mean'
+
+    bundle = ModelBundle.load(summary['preprocessor_path'], summary['model_path'])
+    native = summary['best_model'] == 'Hist Gradient Boosting'
+    assert isinstance(bundle.preprocessor.encoder, NativeCategoricalEncoder) == native
+    predictions = bundle.predict_frame(pipeline.load(arff_path).iloc[:50].drop(columns=TARGET))
+    assert np.isfinite(predictions).all() and len(predictions) == 50
+
@@ -0,0 +1,173 @@
+import pickle
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+from ames_housing.preprocessing import (GROUP_MEDIAN_COLUMNS, MODE_COLUMNS, NONE_COLUMNS, SPARSE_COLUMNS,
+                                        ZERO_COLUMNS, HousePreprocessor, Imputer)
+
+
+def _reference_fill(train, df):
+    """Isian imputer sebelum spec deklaratif, ditulis ulang langsung dengan pandas."""
+    df = df.drop(columns=SPARSE_COLUMNS)
+    for col in NONE_COLUMNS:
+        if 'None' not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories(['None'])
+        df[col] = df[col].fillna('None')
+    for col, key in GROUP_MEDIAN_COLUMNS.items():
+        medians = train.groupby(key, observed=True)[col].median()
+        group_fill = df[key].astype(object).map(medians).astype('float64')
+        df[col] = df[col].fillna(group_fill).fillna(train[col].median())
+    for col in ZERO_COLUMNS:
+        df[col] = df[col].fillna(0)
+    for col in MODE_COLUMNS:
+        df[col] = df[col].fillna(train[col].mode()[0])
+    return df
+
+
+@pytest.fixture(scope='module')
+def fitted(frame):
+    return Imputer().fit(frame)
+
+
+def test_default_spec_reproduces_previous_fills(frame, fitted):
+    pd.testing.assert_frame_equal(fitted.transform(frame), _reference_fill(frame, frame), check_dtype=False)
+
+
+def test_unknown_group_falls_back_to_global_median(frame, fitted):
+    listing = frame.iloc[:20].copy()
+    listing['Neighborhood'] = listing['Neighborhood'].astype(object)
+    listing.loc[listing.index[:5], 'Neighborhood'] = 'Unknown'
+    listing['LotFrontage'] = np.nan
+    filled = fitted.transform(listing)['LotFrontage']
+    np.testing.assert_allclose(filled.iloc[:5], frame['LotFrontage'].median())
+    expected = frame.groupby('Neighborhood', observed=True)['LotFrontage'].median()
+    np.testing.assert_allclose(filled.iloc[5:], listing['Neighborhood'].iloc[5:].map(expected).astype(float))
+
+
+def test_no_missing_after_transform(frame, fitted):
+    out = fitted.transform(frame)
+    assert not out[list(Imputer().spec)].isna().any().any()
+
+
+def test_custom_spec_strategies(frame):
+    spec = {'LotFrontage': 'median', 'MasVnrArea': ('constant', -1), 'GarageType': 'mode'}
+    out = Imputer(drop=(), spec=spec).fit_transform(frame)
+    assert (out.loc[frame['LotFrontage'].isna(), 'LotFrontage'] == frame['LotFrontage'].median()).all()
+    assert (out.loc[frame['MasVnrArea'].isna(), 'MasVnrArea'] == -1).all()
+    assert (out.loc[frame['GarageType'].isna(), 'GarageType'] == frame['GarageType'].mode()[0]).all()
+
+
+@pytest.mark.parametrize('rule', ['mean', ('constant',), ('group_median', 'a', 'b')])
+def test_invalid_rule_raises(frame, rule):
+    with pytest.raises(ValueError):
+        Imputer(spec={'LotFrontage': rule}).fit(frame)
+
+
+def test_transform_uses_rules_learned_in_fit(frame, fitted):
+    imputer = Imputer().fit(frame)
+    imputer.spec = {'LotFrontage': ('constant', -1)}
+    pd.testing.assert_frame_equal(imputer.transform(frame), fitted.transform(frame))
+
+
+def test_legacy_pickle_is_migrated(frame, fitted):
+    # State Imputer sebelum spec deklaratif: empat parameter daftar kolom dan tanpa fill_values_.
+    legacy = Imputer.__new__(Imputer)
+    legacy.__dict__.update({
+        'drop': SPARSE_COLUMNS, 'none_columns': NONE_COLUMNS, 'zero_columns': ZERO_COLUMNS,
+        'mode_columns': MODE_COLUMNS, 'group_median': GROUP_MEDIAN_COLUMNS,
+        'feature_names_in_': fitted.feature_names_in_, 'numeric_columns_': fitted.numeric_columns_,
+        'modes_': fitted.modes_, 'group_medians_': fitted.group_medians_, 'medians_': fitted.medians_,
+    })
+    restored = pickle.loads(pickle.dumps(legacy))
+    assert restored.spec == Imputer().spec
+    assert restored.fill_values_ == fitted.fill_values_
+    pd.testing.assert_frame_equal(restored.transform(frame), fitted.transform(frame))
+
+
+@pytest.fixture(scope='module')
+def preprocessor(frame):
+    return HousePreprocessor().fit(frame)
+
+
+def test_encoder_matches_notebook_encodings(frame, preprocessor):
+    imputed = preprocessor.imputer.transform(frame)
+    encoded = preprocessor.transform(frame)
+    dummies = pd.get_dummies(imputed['SaleType'].astype(object), prefix='SaleType', drop_first=True)
+    pd.testing.assert_frame_equal(encoded[dummies.columns], dummies)
+    labels = LabelEncoder().fit_transform(imputed['MSZoning'].astype(object))
+    np.testing.assert_array_equal(encoded['MSZoning'], labels)
+    frequency = imputed['Neighborhood'].astype(object).map(imputed['Neighborhood'].value_counts(normalize=True))
+    np.testing.assert_allclose(encoded['Neighborhood_freq'], frequency.astype('float64'))
+
+
+def test_single_listing_matches_batch(frame, preprocessor):
+    batch = preprocessor.transform_array(frame)
+    for i in (0, 17, len(frame) - 1):
+        np.testing.assert_array_equal(preprocessor.transform_array(frame.iloc[[i]]), batch[[i]])
+    pd.testing.assert_frame_equal(pd.DataFrame(batch, index=frame.index, columns=preprocessor.feature_names_),
+                                  preprocessor.transform(frame).astype('float64'))
+
+
+def test_unseen_categories_encode_as_unknown(frame, preprocessor):
+    listing = frame.iloc[[0]].astype(object)
+    listing['SaleType'] = 'Barter'
+    listing['MSZoning'] = 'Moon'
+    listing['Neighborhood'] = 'Atlantis'
+    encoded = preprocessor.transform(listing)
+    assert not encoded.filter(like='SaleType_').to_numpy().any()
+    assert encoded['MSZoning'].iloc[0] == -1
+    assert encoded['Neighborhood_freq'].iloc[0] == 0.0
+
+
+def test_save_load_roundtrip(frame, preprocessor, tmp_path):
+    loaded = HousePreprocessor.load(preprocessor.save(tmp_path / 'preprocessor.joblib'))
+    pd.testing.assert_frame_equal(loaded.transform(frame), preprocessor.transform(frame))
+    joblib.dump(Imputer(), tmp_path / 'imputer.joblib')
+    with pytest.raises(TypeError):
+        HousePreprocessor.load(tmp_path / 'imputer.joblib')
+
+
+def test_sparse_transform_equals_dense(frame, preprocessor):
+    matrix = preprocessor.transform_sparse(frame)
+    assert matrix.format == 'csr' and matrix.dtype == np.float64
+    np.testing.assert_array_equal(matrix.toarray(), preprocessor.transform_array(frame))
+    index = preprocessor.encoder.feature_index_
+    assert list(index) == preprocessor.feature_names_
+    dummies = [index.get_loc(name) for name in preprocessor.encoder.dummy_names_]
+    # Satu entri per baris dan kolom one-hot, tidak ada nol eksplisit.
+    assert matrix[:, dummies].nnz == (matrix[:, dummies].toarray() != 0).sum() <= len(frame) * len(preprocessor.encoder.onehot_columns)
+
+
+def test_sparse_unseen_categories_and_single_row(frame, preprocessor):
+    listing = frame.iloc[[3]].astype(object)
+    listing['SaleType'] = 'Barter'
+    np.testing.assert_array_equal(preprocessor.transform_sparse(listing).toarray(),
+                                  preprocessor.transform_array(listing))
+
+
+
+def test_native_encoder_keeps_category_codes(frame):
+    from ames_housing.preprocessing import NativeCategoricalEncoder
+
+    imputed = Imputer().fit_transform(frame)
+    encoder = NativeCategoricalEncoder().fit(imputed)
+    encoded = encoder.transform(imputed)
+    assert list(encoded.columns) == encoder.feature_names_
+    assert 'SalePrice' not in encoded and 'Street' not in encoded
+    mask = dict(zip(encoder.feature_names_, encoder.categorical_mask_))
+    assert mask['Neighborhood'] and mask['MSZoning'] and not mask['ExterQual'] and not mask['GrLivArea']
+    vocab = encoder.category_vocab_['Neighborhood']
+    np.testing.assert_array_equal(vocab[encoded['Neighborhood'].astype(int)], imputed['Neighborhood'].astype(object))
+    np.testing.assert_array_equal(encoded['ExterQual'],
+                                  pd.Index(['Po', 'Fa', 'TA', 'Gd', 'Ex']).get_indexer(imputed['ExterQual']))
+
+    listing = imputed.iloc[[0]].astype(object)
+    listing['Neighborhood'] = 'Atlantis'
+    listing['MSZoning'] = None
+    row = encoder.transform_array(listing)[0]
+    assert np.isnan(row[encoder.feature_index_.get_loc('Neighborhood')])
+    assert np.isnan(row[encoder.feature_index_.get_loc('MSZoning')])
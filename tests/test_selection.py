@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Lasso, LinearRegression
+
+from ames_housing.selection import FeatureCurve, default_sizes, rank_features
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(9)
+    X = pd.DataFrame(rng.normal(size=(400, 10)), columns=[f"f{i}" for i in range(10)])
+    y = X.to_numpy() @ np.array([8, -6, 4, 2, 1, 0, 0, 0, 0, 0.5]) + rng.normal(scale=0.5, size=400)
+    return X.iloc[:300], y[:300], X.iloc[300:], y[300:]
+
+
+def _cold_rmse(estimator, X_train, y_train, X_test, y_test, columns):
+    pred = estimator.fit(X_train[columns].to_numpy(), y_train).predict(X_test[columns].to_numpy())
+    return np.sqrt(((y_test - pred) ** 2).mean())
+
+
+def test_default_sizes_cover_range():
+    sizes = default_sizes(150)
+    assert sizes[0] == 1 and sizes[-1] == 150
+    assert sizes == sorted(set(sizes)) and len(sizes) <= 20
+
+
+def test_rank_features(data):
+    X_train, y_train, X_test, y_test = data
+    linear = LinearRegression().fit(X_train, y_train)
+    assert rank_features(linear)[:4] == ['f0', 'f1', 'f2', 'f3']
+    assert rank_features(linear, X_test, y_test, method='permutation', n_jobs=1)[:3] == ['f0', 'f1', 'f2']
+    with pytest.raises(ValueError):
+        rank_features(linear, method='shap')
+
+
+def test_curve_matches_cold_fits(data):
+    X_train, y_train, X_test, y_test = data
+    forest = RandomForestRegressor(n_estimators=15, max_depth=6, random_state=0)
+    curve = FeatureCurve(forest, sizes=[1, 3, 5, 10], n_jobs=2).fit(X_train, y_train, X_test, y_test)
+    assert curve.ranking_[:2] == ['f0', 'f1']
+    for _, row in curve.curve_.iterrows():
+        k = int(row['n_features'])
+        expected = _cold_rmse(forest, X_train, y_train, X_test, y_test, curve.ranking_[:k])
+        assert row['RMSE'] == pytest.approx(expected, rel=1e-9)
+    serial = FeatureCurve(forest, sizes=[1, 3, 5, 10], n_jobs=1).fit(X_train, y_train, X_test, y_test)
+    pd.testing.assert_frame_equal(serial.curve_.drop(columns='fit_time'), curve.curve_.drop(columns='fit_time'))
+
+
+def test_warm_started_lasso_matches_cold_fits(data):
+    X_train, y_train, X_test, y_test = data
+    lasso = Lasso(alpha=0.05, tol=1e-10, max_iter=100_000)
+    ranking = ['f0', 'f1', 'f2', 'f3', 'f4', 'f9', 'f5', 'f6', 'f7', 'f8']
+    curve = FeatureCurve(lasso, ranking=ranking, n_jobs=2).fit(X_train, y_train, X_test, y_test)
+    assert curve.curve_['n_features'].tolist() == default_sizes(10)
+    for _, row in curve.curve_.iterrows():
+        k = int(row['n_features'])
+        expected = _cold_rmse(lasso, X_train, y_train, X_test, y_test, ranking[:k])
+        assert row['RMSE'] == pytest.approx(expected, rel=1e-7)
+    assert curve.best_n_features_ >= 5
+    assert curve.selected_features_ == ranking[:curve.best_n_features_]
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from ames_housing.preprocessing import TARGET, HousePreprocessor
+from ames_housing.serving import InvalidListing, MicroBatcher, ModelBundle, ScoringServer
+
+
+@pytest.fixture(scope='module')
+def bundle(frame):
+    preprocessor = HousePreprocessor().fit(frame)
+    model = LinearRegression().fit(preprocessor.transform(frame), frame[TARGET])
+    return ModelBundle(preprocessor, model)
+
+
+@pytest.fixture(scope='module')
+def records(frame):
+    listings = frame.drop(columns=TARGET).iloc[:5].astype(object)
+    return listings.where(listings.notna(), None).to_dict('records')
+
+
+def _bad(record):
+    return {**record, 'GrLivArea': 'abc'}
+
+
+def test_bad_record_only_fails_its_own_request(bundle, records):
+    batch_sizes = []
+
+    def predict(batch):
+        batch_sizes.append(len(batch))
+        return bundle.predict_records(batch)
+
+    async def scenario():
+        batcher = MicroBatcher(predict, max_batch_size=16, max_wait_ms=200)
+        batcher.start()
+        try:
+            submitted = records[:2] + [_bad(records[2])] + records[3:]
+            return await asyncio.gather(*(batcher.submit(r) for r in submitted), return_exceptions=True)
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(scenario())
+    assert batch_sizes[0] == 5  # semua request digabung dalam satu batch
+    assert isinstance(results[2], InvalidListing)
+    good = [r for i, r in enumerate(results) if i != 2]
+    expected = bundle.predict_records(records[:2] + records[3:])
+    np.testing.assert_allclose(good, expected)
+
+
+def test_invalid_listing_maps_to_400(bundle, records):
+    async def scenario():
+        server = ScoringServer(bundle, max_wait_ms=1)
+        server.batcher.start()
+        try:
+            single = await server._route('POST', '/predict', json.dumps(_bad(records[0])).encode())
+            many = await server._route('POST', '/predict', json.dumps([records[0], _bad(records[1])]).encode())
+            good = await server._route('POST', '/predict', json.dumps(records[0]).encode())
+        finally:
+            await server.batcher.stop()
+        return single, many, good
+
+    single, many, good = asyncio.run(scenario())
+    assert single[0] == 400 and many[0] == 400
+    assert good[0] == 200
+    np.testing.assert_allclose(good[1]['prediction'], bundle.predict_records(records[:1])[0])
+
+
+def test_predict_frame_rejects_unconvertible_values(bundle, frame):
+    listing = frame.drop(columns=TARGET).iloc[:1].astype({'GrLivArea': object})
+    listing.loc[listing.index[0], 'GrLivArea'] = 'abc'
+    with pytest.raises(InvalidListing):
+        bundle.predict_frame(pd.DataFrame(listing))
+
+
+def test_scoring_imports_stay_light():
+    # Subprocess: modul lain di sesi pytest sudah memuat sklearn.ensemble dan sebagainya.
+    code = ("import sys, ames_housing.serving; "
+            "print(' '.join(m for m in ('sklearn.ensemble', 'sklearn.metrics', 'ames_housing.compiled', "
+            "'ames_housing.attribution', 'ames_housing.modeling', 'matplotlib') if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert loaded.strip() == ''
+
+
+def test_explain_reuses_bundle_compiled_model(frame, records):
+    preprocessor = HousePreprocessor().fit(frame)
+    model = RandomForestRegressor(n_estimators=10, max_depth=5, random_state=0).fit(
+        preprocessor.transform(frame), frame[TARGET])
+    bundle = ModelBundle(preprocessor, model)
+    assert bundle.compiled is not None
+    explanations = bundle.explain_records(records[:2], top=3)
+    assert bundle._attribution.compiled is bundle.compiled
+    np.testing.assert_allclose([e['prediction'] for e in explanations], bundle.predict_records(records[:2]))
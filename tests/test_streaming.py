@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ames_housing.arff_io import iter_arff_chunks, read_arff
+from ames_housing.streaming import CorrelationAccumulator, DuplicateCounter, summarize_arff
+
+
+@pytest.fixture(scope='module')
+def full(arff_path):
+    return read_arff(arff_path)
+
+
+@pytest.fixture(scope='module')
+def summary(arff_path):
+    return summarize_arff(arff_path, chunksize=250)
+
+
+def test_missing_matches_in_memory(full, summary):
+    counts = full.isna().sum()
+    expected = counts[counts > 0].sort_values(ascending=False)
+    pd.testing.assert_series_equal(summary['missing']['Missing Values'].sort_index(),
+                                   expected.sort_index(), check_names=False)
+
+
+def test_describe_matches_in_memory(full, summary):
+    result = summary['describe']
+    expected = full.select_dtypes(include='number').astype('float64').describe()
+    for row in ('count', 'mean', 'std', 'min', 'max', '25%', '50%', '75%'):
+        np.testing.assert_allclose(result.loc[row, expected.columns], expected.loc[row], rtol=1e-9)
+
+
+def test_correlation_matches_in_memory(full, summary):
+    numeric = full.select_dtypes(include='number').astype('float64')
+    expected = numeric.corr()
+    result = summary['correlation'].loc[expected.index, expected.columns]
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+
+def test_duplicates_match_in_memory(arff_path, full):
+    doubled = pd.concat([full, full.iloc[:17]])
+    assert summarize_arff(arff_path, outliers=False)['duplicates'] == full.duplicated().sum()
+    counter = DuplicateCounter()
+    for start in range(0, len(doubled), 300):
+        counter.update(doubled.iloc[start:start + 300])
+    assert counter.result() == doubled.duplicated().sum()
+
+
+def test_correlation_merge_equals_single_pass(arff_path):
+    chunks = list(iter_arff_chunks(arff_path, chunksize=200))
+    single = CorrelationAccumulator()
+    for chunk in chunks:
+        single.update(chunk)
+    left, right = CorrelationAccumulator(), CorrelationAccumulator()
+    for i, chunk in enumerate(chunks):
+        (left if i % 2 else right).update(chunk)
+    np.testing.assert_allclose(left.merge(right).result(), single.result(), atol=1e-12)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pyarrow import feather
+
+from ames_housing.arff_io import load_dataset
+from ames_housing.synthetic import AmesSynthesizer
+
+
+@pytest.fixture(scope='module')
+def synth(frame):
+    return AmesSynthesizer().fit(frame)
+
+
+@pytest.fixture(scope='module')
+def sample(synth):
+    return synth.sample(40_000, seed=1)
+
+
+def test_schema_and_dtypes_follow_source(frame, sample):
+    assert list(sample.columns) == list(frame.columns)
+    for col in frame.columns:
+        if isinstance(frame[col].dtype, pd.CategoricalDtype):
+            assert list(sample[col].cat.categories) == list(frame[col].cat.categories)
+    assert sample['Id'].is_monotonic_increasing and sample['Id'].is_unique
+
+
+@pytest.mark.parametrize('column', ['SalePrice', 'GrLivArea', 'LotArea', 'YearBuilt'])
+def test_numeric_marginals(frame, sample, column):
+    levels = [0.1, 0.25, 0.5, 0.75, 0.9]
+    expected, result = frame[column].quantile(levels), sample[column].quantile(levels)
+    spread = frame[column].quantile(0.9) - frame[column].quantile(0.1)
+    np.testing.assert_allclose(result, expected, atol=0.05 * spread)
+
+
+def test_missing_rates_and_category_shares(frame, sample):
+    for column in ('LotFrontage', 'FireplaceQu', 'MasVnrArea'):
+        assert sample[column].isna().mean() == pytest.approx(frame[column].isna().mean(), abs=0.02)
+    shares = frame['Neighborhood'].value_counts(normalize=True)
+    np.testing.assert_allclose(sample['Neighborhood'].value_counts(normalize=True)[shares.index], shares,
+                               atol=0.01)
+
+
+def test_group_conditional_medians(frame, sample):
+    big = frame['Neighborhood'].value_counts().index[:3]
+    expected = frame.groupby('Neighborhood', observed=True)['LotFrontage'].median()[big]
+    result = sample.groupby('Neighborhood', observed=True)['LotFrontage'].median()[big]
+    np.testing.assert_allclose(result, expected, rtol=0.08)
+
+
+def test_copula_keeps_rank_correlation(frame, synth, sample):
+    pair = ['GrLivArea', 'SalePrice']
+    expected = frame[pair].corr(method='spearman').iloc[0, 1]
+    assert sample[pair].corr(method='spearman').iloc[0, 1] == pytest.approx(expected, abs=0.05)
+    independent = AmesSynthesizer(copula=False).fit(frame).sample(20_000, seed=1)
+    assert abs(independent[pair].corr(method='spearman').iloc[0, 1]) < abs(expected) / 2
+
+
+def test_chunks_are_deterministic(synth):
+    first = pd.concat(synth.iter_chunks(2500, chunksize=1000, seed=4), ignore_index=True)
+    second = pd.concat(synth.iter_chunks(2500, chunksize=1000, seed=4), ignore_index=True)
+    pd.testing.assert_frame_equal(first, second)
+    assert first['Id'].is_unique and len(first) == 2500
+
+
+def test_files_round_trip(synth, tmp_path):
+    expected = pd.concat(synth.iter_chunks(1500, chunksize=600, seed=2), ignore_index=True)
+    arff = synth.write_arff(tmp_path / 'synth.arff', 1500, chunksize=600, seed=2)
+    loaded = load_dataset(arff, use_cache=False)
+    pd.testing.assert_frame_equal(loaded, expected, check_dtype=False)
+    table = feather.read_table(synth.write_feather(tmp_path / 'synth.feather', 1500, chunksize=600, seed=2))
+    pd.testing.assert_frame_equal(table.to_pandas(), expected)
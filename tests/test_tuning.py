@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import Lasso, Ridge
+from sklearn.model_selection import GridSearchCV, KFold
+
+from ames_housing.tuning import LassoPathSearch, SuccessiveHalvingSearch
+
+ALPHAS = [0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 20.0]
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(11)
+    X = rng.normal(size=(300, 15))
+    coef = np.where(np.arange(15) < 5, rng.normal(scale=3, size=15), 0.0)
+    y = X @ coef + rng.normal(scale=2.0, size=300)
+    return X, y
+
+
+def test_path_scores_match_grid_search(data):
+    X, y = data
+    search = LassoPathSearch(ALPHAS, cv=5, tol=1e-8, max_iter=100_000).fit(X, y)
+    grid = GridSearchCV(Lasso(tol=1e-8, max_iter=100_000), {'alpha': ALPHAS}, cv=KFold(5)).fit(X, y)
+    expected = pd.Series(grid.cv_results_['mean_test_score'], index=ALPHAS)
+    np.testing.assert_allclose(search.cv_scores_.mean(axis=1).sort_index(), expected.sort_index(), atol=1e-6)
+    assert search.best_alpha_ == grid.best_params_['alpha']
+    assert search.best_score_ == pytest.approx(grid.best_score_, abs=1e-6)
+
+
+def test_best_estimator_equals_cold_fit(data):
+    X, y = data
+    search = LassoPathSearch(ALPHAS, cv=3, tol=1e-8, max_iter=100_000, n_jobs=2).fit(X, y)
+    cold = Lasso(alpha=search.best_alpha_, tol=1e-8, max_iter=100_000).fit(X, y)
+    np.testing.assert_allclose(search.best_estimator_.coef_, cold.coef_, atol=1e-6)
+    np.testing.assert_allclose(search.best_estimator_.intercept_, cold.intercept_, atol=1e-6)
+    assert search.best_estimator_.warm_start is False
+    assert list(search.cv_scores_.columns) == ['fold0', 'fold1', 'fold2']
+
+
+def test_successive_halving_keeps_best_and_grows_trees(data):
+    X, y = data
+    grid = {'max_depth': [1, 2, 3], 'learning_rate': [0.05, 0.2, 0.5]}
+    search = SuccessiveHalvingSearch(GradientBoostingRegressor(random_state=0), grid,
+                                     max_resources=60, factor=3, cv=3).fit(X, y)
+    rounds = search.cv_results_.groupby('round')
+    assert rounds.size().tolist() == [9, 3]
+    assert rounds['n_resources'].first().tolist() == [20, 60]
+    final = search.cv_results_[search.cv_results_['round'] == 1]
+    assert search.best_score_ == final['mean_score'].max()
+    best = search.best_estimator_
+    assert best.n_estimators == 60 and len(best.estimators_) == 60
+    cold = GradientBoostingRegressor(random_state=0, n_estimators=60, **search.best_params_).fit(X, y)
+    np.testing.assert_allclose(best.predict(X), cold.predict(X), rtol=1e-10)
+
+
+def test_halving_requires_warm_start(data):
+    X, y = data
+    with pytest.raises(ValueError, match='warm_start'):
+        SuccessiveHalvingSearch(Ridge(), {'alpha': [1.0]}).fit(X, y)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.model_selection import KFold, cross_val_predict, cross_validate
+from sklearn.tree import DecisionTreeRegressor
+
+from ames_housing.cache import ArtifactCache
+from ames_housing.validation import CrossValidator, fold_ids
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(2)
+    X = pd.DataFrame(rng.normal(size=(250, 5)), columns=list('abcde'))
+    y = pd.Series(X.to_numpy() @ rng.normal(size=5) + rng.normal(scale=0.5, size=250))
+    return X, y
+
+
+MODELS = {'linear': LinearRegression(), 'ridge': Ridge(alpha=10.0),
+          'tree': DecisionTreeRegressor(max_depth=4, random_state=0)}
+
+
+def test_fold_ids_match_kfold():
+    ids = fold_ids(103, n_splits=4, random_state=7)
+    for k, (_, test) in enumerate(KFold(4, shuffle=True, random_state=7).split(np.empty((103, 1)))):
+        np.testing.assert_array_equal(np.flatnonzero(ids == k), test)
+    np.testing.assert_array_equal(fold_ids(10, 5, shuffle=False), np.repeat(np.arange(5), 2))
+
+
+def test_scores_match_sklearn_cross_validate(data):
+    X, y = data
+    validator = CrossValidator(n_splits=5, n_jobs=2)
+    summary = validator.evaluate(MODELS, X, y)
+    kfold = KFold(5, shuffle=True, random_state=42)
+    for name, model in MODELS.items():
+        expected = cross_validate(model, X, y, cv=kfold, scoring=('neg_root_mean_squared_error', 'r2'))
+        scores = validator.fold_scores_[validator.fold_scores_['model'] == name]
+        np.testing.assert_allclose(scores['RMSE'], -expected['test_neg_root_mean_squared_error'], rtol=1e-9)
+        np.testing.assert_allclose(scores['R2'], expected['test_r2'], rtol=1e-9)
+        np.testing.assert_allclose(validator.oof_predictions_[name], cross_val_predict(model, X, y, cv=kfold),
+                                   rtol=1e-9)
+        assert summary.loc[name, 'RMSE_mean'] == pytest.approx(scores['RMSE'].mean())
+    assert summary['RMSE_mean'].is_monotonic_increasing
+
+
+def test_cached_folds_are_reused(data, tmp_path):
+    X, y = data
+    cache = ArtifactCache(tmp_path / 'cache')
+    first = CrossValidator(n_splits=3, n_jobs=1, cache=cache).evaluate(MODELS, X, y)
+    hits = cache.hits
+    validator = CrossValidator(n_splits=3, n_jobs=1, cache=cache)
+    second = validator.evaluate({**MODELS, 'ridge': Ridge(alpha=1.0)}, X, y)
+    # linear dan tree (2 model x 3 fold) dari cache, ridge dengan parameter baru dilatih ulang.
+    assert cache.hits - hits == 6
+    pd.testing.assert_series_equal(first.loc['linear'], second.loc['linear'])
+    assert second.loc['ridge', 'RMSE_mean'] != first.loc['ridge', 'RMSE_mean']